@@ -0,0 +1,66 @@
+# %%
+# 전략 파라미터 스윕 - 수천 개 조합을 한 번에 비교
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# quant_trading_system 코어 모듈 사용
+sys.path.append(str(Path(__file__).resolve().parent.parent / "quant_trading_system"))
+
+from strategies.core.data_fetcher import load_csv_data
+from strategies.core.parameter_sweep import ParameterSweep
+
+print("="*70)
+print("🔍 전략 파라미터 스윕")
+print("="*70)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 1. 데이터 로드 (5년 일봉)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+df = load_csv_data(Path(__file__).resolve().parent / "data" / "bitcoin_daily_5years.csv")
+
+print(f"📅 분석 기간: {df.index[0]:%Y-%m-%d} ~ {df.index[-1]:%Y-%m-%d} ({len(df)}일)")
+
+sweep = ParameterSweep(df, initial_cash=1_000_000, commission=0.0005)
+print(f"💰 Buy & Hold 수익률: {sweep.buy_hold_return:+.2f}%\n")
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 2. SMA 크로스 (fast 2~60 × slow 10~250)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+start = time.time()
+sma_table = sweep.sma_cross(range(2, 61), range(10, 251, 5))
+print(f"📊 SMA 크로스: {len(sma_table)}개 조합 ({time.time() - start:.2f}초)")
+print(sma_table.head(10).to_string())
+print()
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 3. MACD (fast × slow × signal)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+start = time.time()
+macd_table = sweep.macd(range(6, 19, 2), range(20, 41, 2), range(5, 13))
+print(f"📊 MACD: {len(macd_table)}개 조합 ({time.time() - start:.2f}초)")
+print(macd_table.head(10).to_string())
+print()
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 4. 모멘텀 (lookback × 매수 기준 × 매도 기준)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+start = time.time()
+momentum_table = sweep.momentum(
+    range(5, 61, 5),
+    np.round(np.arange(0.0, 0.21, 0.02), 2),
+    np.round(np.arange(-0.20, 0.0, 0.02), 2),
+)
+print(f"📊 모멘텀: {len(momentum_table)}개 조합 ({time.time() - start:.2f}초)")
+print(momentum_table.head(10).to_string())
+print()
+
+print("="*70)
+print("✅ 스윕 완료!")
+print("="*70)
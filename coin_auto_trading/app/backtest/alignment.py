@@ -0,0 +1,90 @@
+"""
+멀티 타임프레임 정렬: 시점마다 타임프레임별로 마감된 캔들만 보여줌
+
+캔들의 timestamp는 시작 시각이며, 캔들은 timestamp + 타임프레임 길이(마감 시각)부터 보인다.
+타임프레임마다 정렬된 캔들 리스트와 커서를 유지하고, 전략에는 복사 없는 CandleWindow를 넘긴다.
+"""
+from collections.abc import Sequence
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterator, List, Tuple
+from app.data.candle import Candle, Timeframe
+
+
+class CandleWindow(Sequence):
+    """캔들 리스트 앞부분 candles[:end]의 읽기 전용 뷰 (복사 없음)"""
+    
+    __slots__ = ('_candles', '_end')
+    
+    def __init__(self, candles: List[Candle], end: int):
+        self._candles = candles
+        self._end = end
+    
+    def __len__(self) -> int:
+        return self._end
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._end)
+            return self._candles[start:stop:step]
+        if index < 0:
+            index += self._end
+        if not 0 <= index < self._end:
+            raise IndexError("CandleWindow index out of range")
+        return self._candles[index]
+    
+    def __iter__(self) -> Iterator[Candle]:
+        return islice(self._candles, self._end)
+
+
+class TimeframeAligner:
+    """
+    타임프레임별 캔들을 마감 시각 기준으로 정렬
+    
+    모든 타임프레임의 캔들 마감 시각을 합친 타임라인을 따라가며,
+    각 시점에 이미 마감된 캔들만 보이도록 타임프레임별 커서를 앞으로만 옮긴다.
+    """
+    
+    def __init__(self, candles_by_timeframe: Dict[Timeframe, List[Candle]]):
+        """
+        초기화
+        
+        Parameters
+        ----------
+        candles_by_timeframe : Dict[Timeframe, List[Candle]]
+            타임프레임별 캔들 데이터 (순서 무관, 한 번만 정렬)
+        """
+        self.candles: Dict[Timeframe, List[Candle]] = {}
+        self.close_times: Dict[Timeframe, List[datetime]] = {}
+        
+        for timeframe, candles in candles_by_timeframe.items():
+            ordered = sorted(candles, key=lambda c: c.timestamp)
+            duration = timeframe.duration
+            self.candles[timeframe] = ordered
+            self.close_times[timeframe] = [c.timestamp + duration for c in ordered]
+        
+        self.timeline: List[datetime] = sorted({
+            close_time for close_times in self.close_times.values() for close_time in close_times
+        })
+    
+    def __len__(self) -> int:
+        return len(self.timeline)
+    
+    def __iter__(self) -> Iterator[Tuple[datetime, Dict[Timeframe, CandleWindow]]]:
+        """
+        (시점, 타임프레임별 마감된 캔들 뷰) 순회
+        
+        아직 마감된 캔들이 없는 타임프레임은 결과에서 빠진다.
+        """
+        cursors = {timeframe: 0 for timeframe in self.candles}
+        
+        for now in self.timeline:
+            windows: Dict[Timeframe, CandleWindow] = {}
+            for timeframe, close_times in self.close_times.items():
+                cursor = cursors[timeframe]
+                while cursor < len(close_times) and close_times[cursor] <= now:
+                    cursor += 1
+                cursors[timeframe] = cursor
+                if cursor:
+                    windows[timeframe] = CandleWindow(self.candles[timeframe], cursor)
+            yield now, windows
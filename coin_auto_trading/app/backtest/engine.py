@@ -4,6 +4,7 @@
 from typing import List, Dict, Optional
 from app.data.candle import Candle, Timeframe
 from app.decision.engine import DecisionEngine
+from app.backtest.alignment import TimeframeAligner
 from app.core.state_machine import PositionState
 from app.core.database import Database
 from app.core.logger import setup_logger
@@ -51,26 +52,14 @@ class BacktestEngine:
         """
         logger.info("Starting backtest...")
         
-        # 모든 타임프레임에서 타임스탬프 추출 및 정렬
-        all_timestamps = set()
-        for candles in candles_by_timeframe.values():
-            for candle in candles:
-                all_timestamps.add(candle.timestamp)
-        
-        sorted_timestamps = sorted(all_timestamps)
+        # 모든 타임프레임의 캔들 마감 시각을 따라가며 마감된 캔들만 사용
+        # (타임프레임별 커서로 앞부분 뷰를 만들어 시점마다 리스트를 다시 만들지 않음)
+        aligner = TimeframeAligner(candles_by_timeframe)
         
         current_position: Optional[Dict] = None
+        current_price: Optional[float] = None
         
-        for timestamp in sorted_timestamps:
-            # 해당 타임스탬프의 캔들 수집
-            current_candles: Dict[Timeframe, List[Candle]] = {}
-            
-            for timeframe, candles in candles_by_timeframe.items():
-                # 해당 시점까지의 캔들만 필터링
-                candles_up_to_timestamp = [c for c in candles if c.timestamp <= timestamp]
-                if candles_up_to_timestamp:
-                    current_candles[timeframe] = candles_up_to_timestamp
-            
+        for timestamp, current_candles in aligner:
             if not current_candles:
                 continue
             
@@ -155,13 +144,8 @@ class BacktestEngine:
         # 최종 평가
         final_value = self.cash
         if current_position:
-            # 미청산 포지션이 있으면 현재가로 평가
-            latest_price = sorted_timestamps[-1]
-            for tf, candles in candles_by_timeframe.items():
-                for candle in reversed(candles):
-                    if candle.timestamp == latest_price:
-                        final_value += current_position['quantity'] * candle.close
-                        break
+            # 미청산 포지션이 있으면 마지막 현재가로 평가
+            final_value += current_position['quantity'] * current_price
         
         total_return = final_value - self.initial_cash
         total_return_pct = (total_return / self.initial_cash) * 100
@@ -1,10 +1,12 @@
 """
 캔들 데이터 모델 및 관리
 """
+from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, Optional, Tuple
 from enum import Enum
+import numpy as np
 
 
 class Timeframe(Enum):
@@ -16,6 +18,13 @@ class Timeframe(Enum):
     HOUR_1 = "1h"
     HOUR_4 = "4h"
     DAY_1 = "1d"
+    
+    @property
+    def duration(self) -> timedelta:
+        """캔들 하나의 길이"""
+        amount, unit = int(self.value[:-1]), self.value[-1]
+        return {'m': timedelta(minutes=amount), 'h': timedelta(hours=amount),
+                'd': timedelta(days=amount)}[unit]
 
 
 @dataclass
@@ -40,24 +49,205 @@ class Candle:
         }
 
 
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_ns(timestamp: datetime) -> int:
+    """datetime -> UTC 기준 epoch 나노초 (timezone 없는 값은 UTC로 간주)"""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def _from_ns(ns: int) -> datetime:
+    """epoch 나노초 -> timezone 없는 UTC datetime"""
+    return _EPOCH + timedelta(microseconds=int(ns) // 1_000)
+
+
+class CandleView(Sequence):
+    """
+    연속된 캔들 구간의 컬럼 뷰 (복사 없음, 읽기 전용)
+    
+    timestamps(int64 나노초)와 open/high/low/close/volume(float64) 배열을 속성으로 가지며,
+    인덱스로 접근하면 Candle 객체를 만들어 반환하므로 기존 List[Candle]처럼 쓸 수 있다.
+    저장소에 캔들이 추가되면 이전에 받은 뷰의 내용은 바뀔 수 있다.
+    """
+    
+    __slots__ = ('timestamps',) + FIELDS
+    
+    def __init__(self, timestamps: np.ndarray, open: np.ndarray, high: np.ndarray,
+                 low: np.ndarray, close: np.ndarray, volume: np.ndarray):
+        self.timestamps = timestamps
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CandleView(*(getattr(self, name)[index] for name in self.__slots__))
+        return Candle(
+            timestamp=_from_ns(self.timestamps[index]),
+            open=float(self.open[index]),
+            high=float(self.high[index]),
+            low=float(self.low[index]),
+            close=float(self.close[index]),
+            volume=float(self.volume[index])
+        )
+    
+    def __iter__(self) -> Iterator[Candle]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+class CandleSeries:
+    """
+    (심볼, 타임프레임) 하나의 컬럼형 캔들 저장소
+    
+    미리 할당한 배열에 순서대로 추가하며(O(1)), 가득 차면 두 배로 늘린다.
+    max_length가 있으면 최근 max_length개만 유지한다. 배열은 2 * max_length 크기로 두고
+    끝에 닿으면 최근 구간을 앞으로 옮기므로(분할 상환 O(1)) 항상 연속된 구간을 뷰로 줄 수 있다.
+    """
+    
+    def __init__(self, max_length: Optional[int] = None, initial_capacity: int = 1024):
+        """
+        초기화
+        
+        Parameters
+        ----------
+        max_length : int, optional
+            유지할 최대 캔들 수 (None이면 무제한)
+        initial_capacity : int
+            처음 할당할 배열 크기
+        """
+        if max_length is not None and max_length < 1:
+            raise ValueError(f"max_length must be positive: {max_length}")
+        self.max_length = max_length
+        capacity = initial_capacity if max_length is None else min(initial_capacity, 2 * max_length)
+        self._allocate(max(capacity, 1))
+    
+    def _allocate(self, capacity: int, start: int = 0, end: int = 0):
+        """배열 (재)할당 후 기존 [start:end] 구간을 앞으로 복사"""
+        size = end - start
+        timestamps = np.empty(capacity, dtype=np.int64)
+        columns = {name: np.empty(capacity, dtype=np.float64) for name in FIELDS}
+        if size:
+            timestamps[:size] = self._timestamps[start:end]
+            for name in FIELDS:
+                columns[name][:size] = self._columns[name][start:end]
+        self._timestamps = timestamps
+        self._columns = columns
+        self._start = 0
+        self._end = size
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    def _reserve(self):
+        """끝에 한 칸 확보 (배열을 늘리거나, 최대 크기면 최근 구간을 앞으로 이동)"""
+        capacity = len(self._timestamps)
+        if self._end < capacity:
+            return
+        limit = None if self.max_length is None else 2 * self.max_length
+        if limit is None or capacity < limit:
+            new_capacity = capacity * 2 if limit is None else min(capacity * 2, limit)
+            self._allocate(new_capacity, self._start, self._end)
+        else:
+            self._compact()
+    
+    def _compact(self):
+        """최근 구간을 배열 앞으로 이동"""
+        start, end = self._start, self._end
+        size = end - start
+        self._timestamps[:size] = self._timestamps[start:end]
+        for column in self._columns.values():
+            column[:size] = column[start:end]
+        self._start, self._end = 0, size
+    
+    def _write(self, index: int, timestamp: int, candle: Candle):
+        self._timestamps[index] = timestamp
+        for name in FIELDS:
+            self._columns[name][index] = getattr(candle, name)
+    
+    def add(self, candle: Candle):
+        """
+        캔들 추가
+        
+        시간순으로 들어오면 끝에 추가(O(1))하고, 과거 캔들은 이진 탐색 위치에 끼워 넣는다.
+        같은 시각의 캔들이 이미 있으면 덮어쓴다 (진행 중인 캔들 갱신).
+        """
+        timestamp = _to_ns(candle.timestamp)
+        start, end = self._start, self._end
+        
+        if end > start and timestamp <= self._timestamps[end - 1]:
+            position = start + int(np.searchsorted(self._timestamps[start:end], timestamp))
+            if self._timestamps[position] == timestamp:
+                self._write(position, timestamp, candle)
+                return
+            # 뒤쪽 구간을 한 칸 밀고 끼워 넣기
+            self._reserve()
+            position -= start - self._start
+            end = self._end
+            self._timestamps[position + 1:end + 1] = self._timestamps[position:end]
+            for column in self._columns.values():
+                column[position + 1:end + 1] = column[position:end]
+        else:
+            self._reserve()
+            position = self._end
+        
+        self._write(position, timestamp, candle)
+        self._end += 1
+        if self.max_length is not None and len(self) > self.max_length:
+            self._start += 1
+    
+    def view(self, limit: Optional[int] = None) -> CandleView:
+        """
+        최근 캔들 뷰 (복사 없음)
+        
+        Parameters
+        ----------
+        limit : int, optional
+            최대 개수 (None이면 전체)
+        """
+        start = self._start if not limit else max(self._start, self._end - limit)
+        arrays = [self._timestamps[start:self._end]]
+        arrays.extend(self._columns[name][start:self._end] for name in FIELDS)
+        for array in arrays:
+            array.flags.writeable = False
+        return CandleView(*arrays)
+
+
 class CandleStore:
-    """캔들 데이터 저장소"""
+    """캔들 데이터 저장소 ((심볼, 타임프레임)별 컬럼형 배열)"""
     
-    def __init__(self):
-        self._candles: dict[str, List[Candle]] = {}  # key: "symbol_timeframe"
+    def __init__(self, max_length: Optional[int] = None):
+        """
+        초기화
+        
+        Parameters
+        ----------
+        max_length : int, optional
+            (심볼, 타임프레임)별 최대 보관 캔들 수 (None이면 무제한)
+        """
+        self.max_length = max_length
+        self._series: Dict[Tuple[str, Timeframe], CandleSeries] = {}
     
     def add_candle(self, symbol: str, timeframe: Timeframe, candle: Candle):
         """캔들 추가"""
-        key = f"{symbol}_{timeframe.value}"
-        if key not in self._candles:
-            self._candles[key] = []
-        
-        self._candles[key].append(candle)
-        # 시간순 정렬
-        self._candles[key].sort(key=lambda x: x.timestamp)
+        key = (symbol, timeframe)
+        if key not in self._series:
+            self._series[key] = CandleSeries(self.max_length)
+        self._series[key].add(candle)
     
     def get_candles(self, symbol: str, timeframe: Timeframe, 
-                   limit: Optional[int] = None) -> List[Candle]:
+                   limit: Optional[int] = None) -> CandleView:
         """
         캔들 조회
         
@@ -72,33 +262,28 @@ class CandleStore:
         
         Returns
         -------
-        List[Candle]
-            캔들 리스트 (오래된 것부터 최신 순)
+        CandleView
+            캔들 뷰 (오래된 것부터 최신 순, 복사 없음)
         """
-        key = f"{symbol}_{timeframe.value}"
-        candles = self._candles.get(key, [])
-        
-        if limit:
-            return candles[-limit:]
-        return candles
+        series = self._series.get((symbol, timeframe))
+        if series is None:
+            return CandleView(np.empty(0, dtype=np.int64), *(np.empty(0) for _ in FIELDS))
+        return series.view(limit)
     
     def get_latest_candle(self, symbol: str, timeframe: Timeframe) -> Optional[Candle]:
         """최신 캔들 조회"""
-        candles = self.get_candles(symbol, timeframe)
+        candles = self.get_candles(symbol, timeframe, limit=1)
         return candles[-1] if candles else None
     
     def is_candle_closed(self, symbol: str, timeframe: Timeframe, 
                         current_time: datetime) -> bool:
         """
-        캔들이 마감되었는지 확인
-        
-        간단한 구현: 실제로는 거래소 API나 데이터 소스에서 확인해야 함
+        최신 캔들이 마감되었는지 확인 (시작 시각 + 타임프레임 길이 <= 현재 시각)
         """
         latest = self.get_latest_candle(symbol, timeframe)
         if not latest:
             return False
         
-        # 타임프레임에 따른 마감 시간 계산
-        # 실제 구현에서는 타임프레임에 맞는 마감 시간을 정확히 계산해야 함
-        return True
-
+        if current_time.tzinfo is not None:
+            current_time = current_time.astimezone(timezone.utc).replace(tzinfo=None)
+        return latest.timestamp + timeframe.duration <= current_time
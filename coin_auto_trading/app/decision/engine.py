@@ -1,11 +1,11 @@
 """
 Decision Engine: 백테스트와 라이브에서 공통 사용하는 결정 엔진
 """
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from app.data.candle import Candle, Timeframe
 from app.core.state_machine import StateMachine, PositionState
 from app.strategies.base_strategy import BaseStrategy
-from app.features.indicators import calculate_features
+from app.features.feature_state import FeatureState
 from app.core.database import Database
 from app.core.logger import setup_logger
 
@@ -32,6 +32,8 @@ class DecisionEngine:
         self.symbol = symbol
         self.db = db
         self.state_machine = StateMachine()
+        # (심볼, 타임프레임)별 증분 피처 상태
+        self._feature_states: Dict[Tuple[str, Timeframe], FeatureState] = {}
         logger.info(f"DecisionEngine initialized: symbol={symbol}, strategy={strategy.name}")
     
     def decide(self, candles: Dict[Timeframe, List[Candle]], 
@@ -76,9 +78,10 @@ class DecisionEngine:
         
         # 피처 계산
         # 기본 타임프레임에서 피처 계산 (첫 번째 타임프레임 사용)
+        # 지난 결정 이후 새로 추가된 캔들만 처리 (히스토리가 바뀌면 전체 재계산)
         primary_timeframe = required_timeframes[0]
         primary_candles = candles[primary_timeframe]
-        features = calculate_features(primary_candles)
+        features = self._get_feature_state(primary_timeframe).update(primary_candles)
         
         # 전략으로부터 시그널 생성
         signal = self.strategy.generate_signal(candles, current_state, features)
@@ -129,6 +132,13 @@ class DecisionEngine:
         
         return result
     
+    def _get_feature_state(self, timeframe: Timeframe) -> FeatureState:
+        """(심볼, 타임프레임) 피처 상태 조회 (없으면 생성)"""
+        key = (self.symbol, timeframe)
+        if key not in self._feature_states:
+            self._feature_states[key] = FeatureState()
+        return self._feature_states[key]
+    
     def apply_decision(self, decision: Dict):
         """
         결정 적용 (상태 머신 업데이트)
@@ -0,0 +1,163 @@
+"""
+증분 피처 계산
+
+캔들 리스트에 새로 추가된 캔들만 처리하여 calculate_features()와 같은 피처를 유지한다.
+처리한 구간의 첫/마지막 캔들이 바뀐 경우(누락 캔들 보충, 구간 이동, 진행 중 캔들 갱신)에만
+처음부터 다시 계산한다. 중간 캔들 값만 제자리에서 바뀌는 경우는 감지하지 않는다.
+"""
+import math
+from typing import Dict, List, Optional
+from app.data.candle import Candle
+
+
+SMA_PERIODS = (5, 20, 50)
+EMA_PERIODS = (12, 26)
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+
+
+class _RollingSum:
+    """고정 기간 합계 (링 버퍼, 한 바퀴마다 합계를 다시 계산하여 오차 누적 방지)"""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.buffer = [0.0] * period
+        self.index = 0
+        self.count = 0
+        self.total = 0.0
+
+    def push(self, value: float) -> Optional[float]:
+        """값 추가 후 평균 반환 (기간이 차기 전에는 None)"""
+        self.total += value - self.buffer[self.index]
+        self.buffer[self.index] = value
+        self.index = (self.index + 1) % self.period
+        self.count += 1
+        if self.index == 0:
+            self.total = math.fsum(self.buffer)
+        return self.total / self.period if self.count >= self.period else None
+
+
+class FeatureState:
+    """
+    (심볼, 타임프레임) 하나의 증분 피처 상태
+
+    update()에 같은 캔들 리스트를 점점 늘려 가며 넘기면 캔들당 O(1)로 피처를 갱신한다.
+    반환되는 피처 리스트는 상태가 소유하며 이후 update()에서 이어서 늘어난다.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """상태 초기화"""
+        self.count = 0
+        # 캔들 객체가 제자리에서 수정될 수 있으므로 값으로 보관
+        self._first_timestamp = None
+        self._last_timestamp = None
+        self._last_close: Optional[float] = None
+
+        self._sums = {period: _RollingSum(period) for period in SMA_PERIODS}
+        self._emas: Dict[int, Optional[float]] = {period: None for period in EMA_PERIODS}
+        self._signal: Optional[float] = None
+        self._prev_close: Optional[float] = None
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+        self.features: Dict[str, object] = {
+            **{f'sma_{period}': [] for period in SMA_PERIODS},
+            **{f'ema_{period}': [] for period in EMA_PERIODS},
+            'rsi': [],
+            'macd': {'macd': [], 'signal': [], 'histogram': []},
+            'current_price': None
+        }
+
+    def _is_continuation(self, candles: List[Candle]) -> bool:
+        """이전에 처리한 캔들 뒤에 새 캔들만 붙었는지 확인"""
+        if self.count == 0 or len(candles) < self.count:
+            return False
+        last = candles[self.count - 1]
+        return (
+            candles[0].timestamp == self._first_timestamp
+            and last.timestamp == self._last_timestamp
+            and last.close == self._last_close
+        )
+
+    def update(self, candles: List[Candle]) -> dict:
+        """
+        캔들 리스트로 피처 갱신
+
+        Parameters
+        ----------
+        candles : List[Candle]
+            캔들 리스트 (오래된 것부터 최신 순)
+
+        Returns
+        -------
+        dict
+            calculate_features()와 같은 형태의 피처
+        """
+        if not candles:
+            self.reset()
+            return {}
+
+        if not self._is_continuation(candles):
+            self.reset()
+
+        for candle in candles[self.count:]:
+            self._push(candle.close)
+
+        self.count = len(candles)
+        self._first_timestamp = candles[0].timestamp
+        self._last_timestamp = candles[-1].timestamp
+        self._last_close = candles[-1].close
+        self.features['current_price'] = candles[-1].close
+        return dict(self.features)
+
+    def _push(self, close: float):
+        """캔들 하나 처리"""
+        features = self.features
+
+        for period, rolling in self._sums.items():
+            features[f'sma_{period}'].append(rolling.push(close))
+
+        for period, prev in self._emas.items():
+            value = close if prev is None else (close - prev) * (2 / (period + 1)) + prev
+            self._emas[period] = value
+            features[f'ema_{period}'].append(value)
+
+        macd_value = self._emas[MACD_FAST] - self._emas[MACD_SLOW]
+        if self._signal is None:
+            self._signal = macd_value
+        else:
+            self._signal = (macd_value - self._signal) * (2 / (MACD_SIGNAL + 1)) + self._signal
+        features['macd']['macd'].append(macd_value)
+        features['macd']['signal'].append(self._signal)
+        features['macd']['histogram'].append(macd_value - self._signal)
+
+        features['rsi'].append(self._push_rsi(close))
+
+    def _push_rsi(self, close: float) -> Optional[float]:
+        """Wilder RSI 갱신 (첫 평균은 RSI_PERIOD개 변화량의 단순 평균)"""
+        prev, self._prev_close = self._prev_close, close
+        if prev is None:
+            return None
+
+        delta = close - prev
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        deltas = len(self.features['rsi'])  # 이번 변화량까지의 개수
+
+        if deltas <= RSI_PERIOD:
+            self._avg_gain += gain
+            self._avg_loss += loss
+            if deltas < RSI_PERIOD:
+                return None
+            self._avg_gain /= RSI_PERIOD
+            self._avg_loss /= RSI_PERIOD
+        else:
+            self._avg_gain = (self._avg_gain * (RSI_PERIOD - 1) + gain) / RSI_PERIOD
+            self._avg_loss = (self._avg_loss * (RSI_PERIOD - 1) + loss) / RSI_PERIOD
+
+        if self._avg_loss == 0:
+            return 100
+        return 100 - 100 / (1 + self._avg_gain / self._avg_loss)
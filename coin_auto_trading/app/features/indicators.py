@@ -1,9 +1,139 @@
 """
 기술적 지표 계산 (SMA, MACD, RSI 등)
+
+*_array 함수는 float64 배열을 받아 float64 배열을 반환하는 NumPy 커널이다
+(값이 없는 앞부분은 NaN). sma/ema/macd/rsi는 같은 커널을 쓰되
+기존처럼 앞부분을 None으로 채운 리스트를 반환한다.
 """
-from typing import List
+from typing import List, Sequence
 import numpy as np
-from app.data.candle import Candle
+import pandas as pd
+from app.data.candle import Candle, CandleView
+
+
+def _as_array(prices: Sequence[float]) -> np.ndarray:
+    """가격 시퀀스를 float64 배열로 변환"""
+    return np.asarray(prices, dtype=np.float64)
+
+
+def _to_list(values: np.ndarray, padding: int = 0) -> List[float]:
+    """배열을 리스트로 변환 (앞의 padding개는 None)"""
+    result = values.tolist()
+    padding = min(padding, len(result))
+    result[:padding] = [None] * padding
+    return result
+
+
+def _recursive_mean(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    y[0] = x[0], y[i] = alpha * x[i] + (1 - alpha) * y[i-1]
+
+    pandas의 컴파일된 ewm(adjust=False) 루프로 계산
+    """
+    if len(values) == 0:
+        return values.copy()
+    return pd.Series(values, copy=False).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def sma_array(prices: Sequence[float], period: int) -> np.ndarray:
+    """
+    Simple Moving Average (누적합)
+    
+    Parameters
+    ----------
+    prices : array-like
+        가격 배열
+    period : int
+        기간
+    
+    Returns
+    -------
+    np.ndarray
+        SMA 배열 (앞의 period-1개는 NaN)
+    """
+    prices = _as_array(prices)
+    result = np.full(len(prices), np.nan)
+    if len(prices) >= period:
+        cumsum = np.concatenate(([0.0], np.cumsum(prices)))
+        result[period - 1:] = (cumsum[period:] - cumsum[:-period]) / period
+    return result
+
+
+def ema_array(prices: Sequence[float], period: int) -> np.ndarray:
+    """
+    Exponential Moving Average (첫 값에서 시작)
+    
+    Parameters
+    ----------
+    prices : array-like
+        가격 배열
+    period : int
+        기간
+    
+    Returns
+    -------
+    np.ndarray
+        EMA 배열
+    """
+    return _recursive_mean(_as_array(prices), 2 / (period + 1))
+
+
+def macd_array(prices: Sequence[float], fast: int = 12, slow: int = 26,
+               signal: int = 9) -> dict:
+    """
+    MACD
+    
+    Returns
+    -------
+    dict
+        {'macd': np.ndarray, 'signal': np.ndarray, 'histogram': np.ndarray}
+    """
+    prices = _as_array(prices)
+    macd_line = ema_array(prices, fast) - ema_array(prices, slow)
+    signal_line = ema_array(macd_line, signal)
+    return {
+        'macd': macd_line,
+        'signal': signal_line,
+        'histogram': macd_line - signal_line
+    }
+
+
+def rsi_array(prices: Sequence[float], period: int = 14) -> np.ndarray:
+    """
+    Relative Strength Index (Wilder 평활)
+    
+    첫 평균은 period개 변화량의 단순 평균, 이후 (이전 평균 * (period-1) + 값) / period
+    
+    Parameters
+    ----------
+    prices : array-like
+        가격 배열
+    period : int
+        기간
+    
+    Returns
+    -------
+    np.ndarray
+        RSI 배열 (0-100, 앞의 period개는 NaN)
+    """
+    prices = _as_array(prices)
+    result = np.full(len(prices), np.nan)
+    if len(prices) < period + 1:
+        return result
+    
+    deltas = np.diff(prices)
+    gains = np.where(deltas > 0, deltas, 0.0)
+    losses = np.where(deltas < 0, -deltas, 0.0)
+    
+    # 첫 평균을 앞에 두고 나머지 변화량을 이어 붙여 한 번에 평활
+    alpha = 1 / period
+    avg_gain = _recursive_mean(np.concatenate(([gains[:period].mean()], gains[period:])), alpha)
+    avg_loss = _recursive_mean(np.concatenate(([losses[:period].mean()], losses[period:])), alpha)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = 100 - 100 / (1 + avg_gain / avg_loss)
+    result[period:] = np.where(avg_loss == 0, 100.0, values)
+    return result
 
 
 def sma(prices: List[float], period: int) -> List[float]:
@@ -22,14 +152,7 @@ def sma(prices: List[float], period: int) -> List[float]:
     List[float]
         SMA 값 리스트 (앞부분은 None으로 채워짐)
     """
-    result = [None] * (period - 1)
-    
-    for i in range(period - 1, len(prices)):
-        window = prices[i - period + 1:i + 1]
-        avg = sum(window) / period
-        result.append(avg)
-    
-    return result
+    return _to_list(sma_array(prices, period), period - 1)
 
 
 def ema(prices: List[float], period: int) -> List[float]:
@@ -48,17 +171,7 @@ def ema(prices: List[float], period: int) -> List[float]:
     List[float]
         EMA 값 리스트
     """
-    if not prices:
-        return []
-    
-    multiplier = 2 / (period + 1)
-    result = [prices[0]]  # 첫 값은 그대로
-    
-    for price in prices[1:]:
-        ema_value = (price - result[-1]) * multiplier + result[-1]
-        result.append(ema_value)
-    
-    return result
+    return _to_list(ema_array(prices, period))
 
 
 def macd(prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -> dict:
@@ -81,33 +194,10 @@ def macd(prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -
     dict
         {'macd': List[float], 'signal': List[float], 'histogram': List[float]}
     """
-    ema_fast = ema(prices, fast)
-    ema_slow = ema(prices, slow)
-    
-    # MACD 라인
-    macd_line = [f - s if f is not None and s is not None else None 
-                 for f, s in zip(ema_fast, ema_slow)]
-    
-    # 시그널 라인 (MACD의 EMA)
-    macd_values = [m for m in macd_line if m is not None]
-    if not macd_values:
-        return {'macd': macd_line, 'signal': [], 'histogram': []}
-    
-    signal_line_raw = ema(macd_values, signal)
-    
-    # None 값 채우기
-    signal_line = [None] * (len(macd_line) - len(signal_line_raw))
-    signal_line.extend(signal_line_raw)
-    
-    # 히스토그램
-    histogram = [m - s if m is not None and s is not None else None
-                 for m, s in zip(macd_line, signal_line)]
-    
-    return {
-        'macd': macd_line,
-        'signal': signal_line,
-        'histogram': histogram
-    }
+    lines = macd_array(prices, fast, slow, signal)
+    if len(lines['macd']) == 0:
+        return {'macd': [], 'signal': [], 'histogram': []}
+    return {key: _to_list(values) for key, values in lines.items()}
 
 
 def rsi(prices: List[float], period: int = 14) -> List[float]:
@@ -126,45 +216,7 @@ def rsi(prices: List[float], period: int = 14) -> List[float]:
     List[float]
         RSI 값 리스트 (0-100)
     """
-    if len(prices) < period + 1:
-        return [None] * len(prices)
-    
-    deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-    
-    result = [None] * period
-    
-    # 초기 평균
-    gains = [d if d > 0 else 0 for d in deltas[:period]]
-    losses = [-d if d < 0 else 0 for d in deltas[:period]]
-    
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
-    
-    if avg_loss == 0:
-        rsi_value = 100
-    else:
-        rs = avg_gain / avg_loss
-        rsi_value = 100 - (100 / (1 + rs))
-    
-    result.append(rsi_value)
-    
-    # 이후 값들 계산 (지수 이동 평균 사용)
-    for i in range(period, len(deltas)):
-        gain = deltas[i] if deltas[i] > 0 else 0
-        loss = -deltas[i] if deltas[i] < 0 else 0
-        
-        avg_gain = (avg_gain * (period - 1) + gain) / period
-        avg_loss = (avg_loss * (period - 1) + loss) / period
-        
-        if avg_loss == 0:
-            rsi_value = 100
-        else:
-            rs = avg_gain / avg_loss
-            rsi_value = 100 - (100 / (1 + rs))
-        
-        result.append(rsi_value)
-    
-    return result
+    return _to_list(rsi_array(prices, period), period)
 
 
 def calculate_features(candles: List[Candle]) -> dict:
@@ -173,8 +225,8 @@ def calculate_features(candles: List[Candle]) -> dict:
     
     Parameters
     ----------
-    candles : List[Candle]
-        캔들 리스트
+    candles : List[Candle] or CandleView
+        캔들 리스트 (CandleView면 종가 배열을 그대로 사용)
     
     Returns
     -------
@@ -184,7 +236,10 @@ def calculate_features(candles: List[Candle]) -> dict:
     if not candles:
         return {}
     
-    closes = [c.close for c in candles]
+    if isinstance(candles, CandleView):
+        closes = candles.close
+    else:
+        closes = np.fromiter((c.close for c in candles), dtype=np.float64, count=len(candles))
     
     features = {
         'sma_5': sma(closes, 5),
@@ -194,7 +249,7 @@ def calculate_features(candles: List[Candle]) -> dict:
         'ema_26': ema(closes, 26),
         'rsi': rsi(closes, 14),
         'macd': macd(closes),
-        'current_price': closes[-1] if closes else None
+        'current_price': float(closes[-1])
     }
     
     return features
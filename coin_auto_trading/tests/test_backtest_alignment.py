@@ -0,0 +1,87 @@
+"""
+멀티 타임프레임 정렬 테스트
+
+마감된 캔들만 보이는지, 백테스트 결과가 직접 자른 리스트로 결정한 것과 같은지 확인
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.backtest.alignment import CandleWindow, TimeframeAligner
+from app.backtest.engine import BacktestEngine
+from app.data.candle import Candle, Timeframe
+from app.decision.engine import DecisionEngine
+from app.strategies.sma_strategy import SMAStrategy
+
+from .test_indicators import make_candles
+
+
+def make_timeframe(timeframe: Timeframe, start: datetime, count: int) -> list:
+    return [
+        Candle(timestamp=start + timeframe.duration * i, open=i, high=i, low=i, close=float(i), volume=1.0)
+        for i in range(count)
+    ]
+
+
+class TestCandleWindow:
+    """CandleWindow 뷰"""
+
+    def test_behaves_like_prefix(self):
+        candles = make_candles(10)
+        window = CandleWindow(candles, 6)
+
+        assert len(window) == 6
+        assert window[-1] is candles[5]
+        assert window[2:] == candles[2:6]
+        assert list(window) == candles[:6]
+        with pytest.raises(IndexError):
+            window[6]
+
+
+class TestTimeframeAligner:
+    """마감 시각 기준 정렬"""
+
+    def test_candles_visible_after_close(self):
+        start = datetime(2025, 1, 1)
+        hourly = make_timeframe(Timeframe.HOUR_1, start, 12)
+        four_hourly = make_timeframe(Timeframe.HOUR_4, start, 3)
+
+        steps = dict(TimeframeAligner({Timeframe.HOUR_1: hourly, Timeframe.HOUR_4: four_hourly}))
+
+        assert len(steps) == 12
+        # 03:00 ~ 04:00 1시간봉이 마감되는 04:00에 첫 4시간봉도 마감
+        assert Timeframe.HOUR_4 not in steps[start + timedelta(hours=3)]
+        assert len(steps[start + timedelta(hours=3)][Timeframe.HOUR_1]) == 3
+        assert len(steps[start + timedelta(hours=4)][Timeframe.HOUR_4]) == 1
+        assert len(steps[start + timedelta(hours=7)][Timeframe.HOUR_4]) == 1
+        assert steps[start + timedelta(hours=12)][Timeframe.HOUR_4][-1] is four_hourly[-1]
+
+    def test_unsorted_input(self):
+        candles = make_candles(50)
+        aligner = TimeframeAligner({Timeframe.MIN_15: list(reversed(candles))})
+        last_time, windows = list(aligner)[-1]
+
+        assert last_time == candles[-1].timestamp + Timeframe.MIN_15.duration
+        assert list(windows[Timeframe.MIN_15]) == candles
+
+
+class TestBacktestEngine:
+    """정렬된 뷰를 쓰는 BacktestEngine"""
+
+    def test_matches_manual_slicing(self):
+        candles = make_candles(800, seed=4)
+        strategy = SMAStrategy(fast_period=5, slow_period=20)
+
+        result = BacktestEngine(DecisionEngine(strategy, "KRW-BTC")).run({Timeframe.MIN_15: candles})
+
+        reference = DecisionEngine(strategy, "KRW-BTC")
+        expected = []
+        for end in range(1, len(candles) + 1):
+            decision = reference.decide({Timeframe.MIN_15: candles[:end]}, candles[end - 1].close)
+            if decision['state_before'] != decision['state_after']:
+                expected.append((decision['action'], candles[end - 1].close))
+            reference.apply_decision(decision)
+
+        assert expected
+        assert [(t['action'], t['price']) for t in result['trades']] == expected
+        assert result['trades'][0]['timestamp'] > candles[0].timestamp
@@ -0,0 +1,98 @@
+"""
+컬럼형 CandleStore 테스트
+
+순서대로/뒤섞여 추가한 캔들이 정렬된 리스트와 같은지, 최대 보관 개수가 지켜지는지 확인
+"""
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.data.candle import CandleSeries, CandleStore, Timeframe
+from app.features.indicators import calculate_features
+
+from .test_indicators import make_candles
+
+
+class TestCandleSeries:
+    """CandleSeries 추가/조회"""
+
+    def test_in_order_append_and_view(self):
+        candles = make_candles(3000)
+        series = CandleSeries(initial_capacity=16)
+        for candle in candles:
+            series.add(candle)
+
+        view = series.view()
+        assert list(view) == candles
+        assert view[-1] == candles[-1]
+        assert np.array_equal(view.close, [c.close for c in candles])
+
+        recent = series.view(limit=100)
+        assert list(recent) == candles[-100:]
+        assert np.shares_memory(recent.close, series.view().close)
+        with pytest.raises(ValueError):
+            recent.close[0] = 0.0
+
+    def test_out_of_order_and_replace(self):
+        candles = make_candles(500, seed=1)
+        shuffled = list(candles)
+        random.Random(0).shuffle(shuffled)
+
+        series = CandleSeries(initial_capacity=8)
+        for candle in shuffled:
+            series.add(candle)
+        # 같은 시각 캔들은 덮어씀 (진행 중인 캔들 갱신)
+        updated = replace(candles[-1], close=1.0)
+        series.add(updated)
+
+        assert list(series.view()) == candles[:-1] + [updated]
+
+    @pytest.mark.parametrize("max_length", [1, 7, 100])
+    def test_bounded_keeps_latest(self, max_length):
+        candles = make_candles(1000, seed=2)
+        # 대부분 순서대로, 가끔 과거 캔들 늦게 도착
+        arrival = list(candles)
+        rng = random.Random(max_length)
+        for i in range(0, len(arrival) - 3, 10):
+            j = i + rng.randint(1, 3)
+            arrival[i], arrival[j] = arrival[j], arrival[i]
+
+        series = CandleSeries(max_length=max_length, initial_capacity=4)
+        expected = []
+        for candle in arrival:
+            series.add(candle)
+            expected = sorted(expected + [candle], key=lambda c: c.timestamp)[-max_length:]
+            assert len(series) == len(expected)
+
+        assert list(series.view()) == expected
+
+
+class TestCandleStore:
+    """CandleStore"""
+
+    def test_get_candles_and_closed(self):
+        store = CandleStore(max_length=200)
+        candles = make_candles(300)
+        for candle in candles:
+            store.add_candle("KRW-BTC", Timeframe.MIN_15, candle)
+
+        view = store.get_candles("KRW-BTC", Timeframe.MIN_15, limit=50)
+        assert list(view) == candles[-50:]
+        assert len(store.get_candles("KRW-BTC", Timeframe.MIN_15)) == 200
+        assert len(store.get_candles("KRW-ETH", Timeframe.MIN_15)) == 0
+        assert store.get_latest_candle("KRW-ETH", Timeframe.MIN_15) is None
+
+        latest = candles[-1].timestamp
+        assert not store.is_candle_closed("KRW-BTC", Timeframe.MIN_15, latest + timedelta(minutes=14))
+        assert store.is_candle_closed("KRW-BTC", Timeframe.MIN_15, latest + timedelta(minutes=15))
+
+    def test_features_from_view(self):
+        store = CandleStore()
+        candles = make_candles(120, seed=3)
+        for candle in candles:
+            store.add_candle("KRW-BTC", Timeframe.MIN_15, candle)
+
+        assert calculate_features(store.get_candles("KRW-BTC", Timeframe.MIN_15)) == calculate_features(candles)
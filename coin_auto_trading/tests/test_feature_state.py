@@ -0,0 +1,78 @@
+"""
+증분 피처 계산 테스트
+
+FeatureState 결과가 calculate_features() 전체 계산과 일치하는지 확인
+"""
+import pytest
+
+from app.core.state_machine import PositionState
+from app.data.candle import Timeframe
+from app.decision.engine import DecisionEngine
+from app.features.feature_state import FeatureState
+from app.features.indicators import calculate_features
+from app.strategies.sma_strategy import SMAStrategy
+
+from .test_indicators import make_candles
+
+
+def assert_features_equal(actual: dict, expected: dict):
+    assert actual.keys() == expected.keys()
+    for key, values in expected.items():
+        if isinstance(values, dict):
+            assert_features_equal(actual[key], values)
+        elif isinstance(values, list):
+            assert len(actual[key]) == len(values), key
+            for a, e in zip(actual[key], values):
+                assert (a is None) == (e is None), key
+                if e is not None:
+                    assert a == pytest.approx(e, rel=1e-9), key
+        else:
+            assert actual[key] == values
+
+
+class TestFeatureState:
+    """FeatureState.update()"""
+
+    def test_appended_candles_match_full_recompute(self):
+        candles = make_candles(400, seed=1)
+        state = FeatureState()
+        for end in (1, 2, 10, 15, 16, 49, 50, 51, 200, 201, 400):
+            assert_features_equal(state.update(candles[:end]), calculate_features(candles[:end]))
+        assert state.count == 400
+
+    def test_rewritten_history_recomputes(self):
+        candles = make_candles(300, seed=2)
+        state = FeatureState()
+        state.update(candles[:100] + candles[101:200])
+
+        # 누락 캔들 보충, 구간 이동, 처음부터 다시, 마지막 캔들 제자리 갱신
+        for window in (candles[:200], candles[50:250], candles[:250]):
+            assert_features_equal(state.update(window), calculate_features(window))
+
+        window = candles[:260]
+        state.update(window)
+        window[-1].close *= 1.01
+        assert_features_equal(state.update(window), calculate_features(window))
+
+
+class TestDecisionEngineFeatures:
+    """DecisionEngine이 증분 피처로 같은 결정을 내리는지 확인"""
+
+    def test_decisions_unchanged(self):
+        candles = make_candles(600, seed=3)
+        strategy = SMAStrategy(fast_period=5, slow_period=20)
+        engine = DecisionEngine(strategy, symbol="KRW-BTC")
+        state = PositionState.FLAT
+
+        actions = []
+        for end in range(1, len(candles) + 1):
+            window = candles[:end]
+            decision = engine.decide({Timeframe.MIN_15: window}, window[-1].close)
+            expected = strategy.generate_signal({Timeframe.MIN_15: window}, state, calculate_features(window))
+
+            assert decision['action'] == expected['action']
+            engine.apply_decision(decision)
+            state = engine.get_state()
+            actions.append(decision['action'])
+
+        assert 'BUY' in actions and 'SELL' in actions
@@ -0,0 +1,103 @@
+"""
+지표 계산 테스트
+
+NumPy 커널 결과가 단순 반복문 계산과 일치하는지 확인
+"""
+import math
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.data.candle import Candle
+from app.features.indicators import sma, ema, macd, rsi, calculate_features
+
+
+def make_prices(n: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    prices = [50_000_000.0]
+    for _ in range(n - 1):
+        prices.append(prices[-1] * math.exp(rng.gauss(0, 0.01)))
+    return prices
+
+
+def make_candles(n: int, seed: int = 0) -> list:
+    start = datetime(2025, 1, 1)
+    return [
+        Candle(timestamp=start + timedelta(minutes=15 * i), open=p, high=p, low=p, close=p, volume=1.0)
+        for i, p in enumerate(make_prices(n, seed))
+    ]
+
+
+def reference_sma(prices, period):
+    return [None if i < period - 1 else sum(prices[i - period + 1:i + 1]) / period
+            for i in range(len(prices))]
+
+
+def reference_ema(prices, period):
+    multiplier = 2 / (period + 1)
+    result = [prices[0]]
+    for price in prices[1:]:
+        result.append((price - result[-1]) * multiplier + result[-1])
+    return result
+
+
+def reference_rsi(prices, period):
+    if len(prices) < period + 1:
+        return [None] * len(prices)
+    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    avg_gain = sum(max(d, 0) for d in deltas[:period]) / period
+    avg_loss = sum(max(-d, 0) for d in deltas[:period]) / period
+    result = [None] * period
+    for i in range(period, len(deltas) + 1):
+        if i > period:
+            avg_gain = (avg_gain * (period - 1) + max(deltas[i - 1], 0)) / period
+            avg_loss = (avg_loss * (period - 1) + max(-deltas[i - 1], 0)) / period
+        result.append(100 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss))
+    return result
+
+
+def assert_close(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None:
+            assert a is None
+        else:
+            assert a == pytest.approx(e, rel=1e-9)
+
+
+class TestIndicators:
+    """반복문 계산과 비교"""
+
+    def test_sma(self):
+        prices = make_prices(500)
+        for period in (1, 5, 20, 50):
+            assert_close(sma(prices, period), reference_sma(prices, period))
+        assert sma(prices[:3], 5) == [None, None, None]
+
+    def test_ema_and_macd(self):
+        prices = make_prices(500, seed=1)
+        assert_close(ema(prices, 12), reference_ema(prices, 12))
+
+        result = macd(prices)
+        line = [f - s for f, s in zip(reference_ema(prices, 12), reference_ema(prices, 26))]
+        signal = reference_ema(line, 9)
+        assert_close(result['macd'], line)
+        assert_close(result['signal'], signal)
+        assert_close(result['histogram'], [m - s for m, s in zip(line, signal)])
+
+    def test_rsi(self):
+        prices = make_prices(500, seed=2)
+        # 하락 없는 구간 (avg_loss == 0)
+        prices[:20] = [100.0 + i for i in range(20)]
+        assert_close(rsi(prices, 14), reference_rsi(prices, 14))
+        assert rsi(prices[:10], 14) == [None] * 10
+
+    def test_calculate_features_keeps_lists(self):
+        candles = make_candles(100, seed=3)
+        features = calculate_features(candles)
+
+        assert isinstance(features['sma_20'], list)
+        assert features['sma_20'][18] is None
+        assert features['sma_20'][-1] == pytest.approx(sum(c.close for c in candles[-20:]) / 20)
+        assert features['current_price'] == candles[-1].close
@@ -7,8 +7,11 @@ import hmac
 import jwt
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional
 from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
 
 from app.adapters.upbit.exceptions import (
     UpbitError,
@@ -16,34 +19,249 @@ from app.adapters.upbit.exceptions import (
     UpbitRateLimitError,
     UpbitAPIError,
 )
+from app.adapters.upbit.rate_limiter import quotation_limiter, exchange_limiter
+from app.core.config import settings
+from app.core.latency import upbit_latency
 from app.core.logging import get_logger
 
 logger = get_logger(__name__, "system")
 
+# 캔들 API 한 번에 받을 수 있는 최대 개수
+CANDLE_PAGE_SIZE = 200
+
+# 캔들 페이지 동시 요청 수 (실제 요청 속도는 quotation_limiter가 제한)
+CANDLE_MAX_WORKERS = 8
+
+UTC_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+# 현재가 한 번에 요청할 마켓 수 (API는 쉼표로 여러 마켓을 받으며 URL 길이만 제한)
+TICKER_BATCH_SIZE = 100
+
+# 마켓 목록 캐시 유효 시간 (초) - 상장/상장폐지는 드물다
+MARKET_LIST_TTL = 3600
+
+
+def split_markets(markets: List[str], valid_markets: Optional[set]):
+    """
+    현재가 요청 전에 존재하지 않는 마켓 코드 걸러내기
+    
+    Args:
+        markets: 요청한 마켓 코드 리스트
+        valid_markets: 거래 가능한 마켓 코드 집합 (None이면 거르지 않음)
+        
+    Returns:
+        (요청할 마켓 배치 리스트, 제외한 마켓 리스트)
+    """
+    # 중복 제거 (순서 유지)
+    markets = list(dict.fromkeys(markets))
+    if valid_markets is not None:
+        dropped = [market for market in markets if market not in valid_markets]
+        markets = [market for market in markets if market in valid_markets]
+    else:
+        dropped = []
+    batches = [markets[i:i + TICKER_BATCH_SIZE] for i in range(0, len(markets), TICKER_BATCH_SIZE)]
+    return batches, dropped
+
+
+def auth_headers(access_key: str, secret_key: str, query_string: Optional[str] = None) -> Dict[str, str]:
+    """
+    JWT 인증 헤더 생성
+    
+    Args:
+        access_key: Upbit Access Key
+        secret_key: Upbit Secret Key
+        query_string: 쿼리 문자열 (선택사항)
+        
+    Returns:
+        헤더 딕셔너리
+    """
+    payload = {
+        "access_key": access_key,
+        "nonce": str(int(time.time() * 1000)),
+    }
+    
+    if query_string:
+        payload["query_string"] = query_string
+    
+    jwt_token = jwt.encode(payload, secret_key, algorithm="HS256")
+    authorization_token = f"Bearer {jwt_token}"
+    
+    return {
+        "Authorization": authorization_token,
+        "Content-Type": "application/json",
+    }
+
+
+def error_from_response(status_code: int, error_data: Any, fallback: str) -> UpbitError:
+    """
+    오류 응답을 Upbit 예외로 변환
+    
+    Args:
+        status_code: HTTP 상태 코드
+        error_data: 응답 본문 (JSON)
+        fallback: 본문에 메시지가 없을 때 쓸 메시지
+    """
+    if status_code == 401:
+        return UpbitAuthError("인증 실패. API 키를 확인하세요.")
+    if status_code == 429:
+        return UpbitRateLimitError("Rate limit 초과. 잠시 후 다시 시도하세요.")
+    error = error_data.get("error", {}) if isinstance(error_data, dict) else {}
+    error_msg = error.get("message", fallback)
+    return UpbitAPIError(f"API 오류: {error_msg}", error_code=status_code)
+
+
+def order_params(
+    market: str,
+    side: str,
+    volume: Optional[float] = None,
+    price: Optional[float] = None,
+    ord_type: str = "limit",
+) -> Dict[str, str]:
+    """주문 파라미터 생성 및 검증 (UpbitAdapter.place_order 참고)"""
+    params = {
+        "market": market,
+        "side": side,
+        "ord_type": ord_type,
+    }
+    
+    if ord_type == "limit":
+        if volume and price:
+            params["volume"] = str(volume)
+            params["price"] = str(price)
+        else:
+            raise ValueError("limit 주문은 volume과 price가 필요합니다.")
+    elif ord_type == "price":
+        if price:
+            params["price"] = str(price)
+        else:
+            raise ValueError("price 주문은 price가 필요합니다.")
+    elif ord_type == "market":
+        if side == "bid" and price:
+            params["price"] = str(price)
+        elif side == "ask" and volume:
+            params["volume"] = str(volume)
+        else:
+            raise ValueError("market 주문 파라미터가 올바르지 않습니다.")
+    
+    return params
+
+
+def candle_endpoint(interval: str):
+    """
+    캔들 간격을 API 엔드포인트와 캔들 길이로 변환
+    
+    Args:
+        interval: day, week, month, minute1, minute3, ..., minute240
+        
+    Returns:
+        (엔드포인트, 캔들 길이) - 월봉은 길이가 일정하지 않아 None
+    """
+    if interval in ("day", "days"):
+        return "candles/days", timedelta(days=1)
+    if interval in ("week", "weeks"):
+        return "candles/weeks", timedelta(weeks=1)
+    if interval in ("month", "months"):
+        return "candles/months", None
+    if interval.startswith("minute"):
+        unit = int(interval.replace("minutes", "").replace("minute", ""))
+        return f"candles/minutes/{unit}", timedelta(minutes=unit)
+    raise ValueError(f"지원하지 않는 캔들 간격입니다: {interval}")
+
+
+def plan_candle_pages(length: timedelta, count: int, to: Optional[str] = None):
+    """
+    페이지별 요청 개수와 조회 시점 계산
+    
+    Returns:
+        (페이지별 개수 리스트, 페이지별 to 리스트)
+    """
+    num_pages = -(-count // CANDLE_PAGE_SIZE)
+    
+    if to is None:
+        # 첫 페이지는 진행 중인 캔들부터, 이후 페이지는 앞 페이지의 마지막 캔들 시각 기준
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        open_start = now - (now - datetime(1970, 1, 1)) % length
+        page_ends = [None] + [
+            (open_start - length * (CANDLE_PAGE_SIZE * k - 1)).strftime(UTC_FORMAT)
+            for k in range(1, num_pages)
+        ]
+    else:
+        end = datetime.strptime(to.replace("Z", "")[:19], UTC_FORMAT)
+        page_ends = [
+            (end - length * (CANDLE_PAGE_SIZE * k)).strftime(UTC_FORMAT)
+            for k in range(num_pages)
+        ]
+    
+    page_counts = [min(CANDLE_PAGE_SIZE, count - CANDLE_PAGE_SIZE * k) for k in range(num_pages)]
+    return page_counts, page_ends
+
+
+def merge_candle_pages(page_counts: List[int], pages: List[List[Dict[str, Any]]], count: int):
+    """
+    페이지를 시간순으로 이어 붙이고 중복 제거
+    
+    Returns:
+        (최신순 캔들, 더 과거 데이터가 없는지 여부)
+    """
+    merged = {}
+    exhausted = False
+    for page_count, page in zip(page_counts, pages):
+        for candle in page:
+            merged[candle["candle_date_time_utc"]] = candle
+        if len(page) < page_count:
+            exhausted = True
+            break
+    
+    candles = sorted(merged.values(), key=lambda c: c["candle_date_time_utc"], reverse=True)[:count]
+    return candles, exhausted
+
 
 class UpbitAdapter:
     """Upbit API 어댑터"""
     
     BASE_URL = "https://api.upbit.com/v1"
+    MAX_RATE_LIMIT_RETRIES = 3  # 429 응답 시 재시도 횟수
     
-    def __init__(self, access_key: str, secret_key: str):
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+    ):
         """
         Args:
             access_key: Upbit Access Key
             secret_key: Upbit Secret Key
+            pool_connections: 호스트별 연결 풀 개수 (기본: settings.upbit_pool_connections)
+            pool_maxsize: 풀당 최대 연결 수 (기본: settings.upbit_pool_maxsize)
         """
         self.access_key = access_key
         self.secret_key = secret_key
-        self.last_request_time = 0
-        self.min_request_interval = 0.1  # Rate limit: 최소 0.1초 간격
+        self._valid_markets: Optional[set] = None
+        self._markets_loaded_at = 0.0
+        
+        # 요청마다 TCP/TLS 연결을 새로 맺지 않도록 세션으로 연결 재사용
+        self._session = requests.Session()
+        http_adapter = HTTPAdapter(
+            pool_connections=pool_connections or settings.upbit_pool_connections,
+            pool_maxsize=pool_maxsize or settings.upbit_pool_maxsize,
+        )
+        self._session.mount("https://", http_adapter)
+        self._session.mount("http://", http_adapter)
+    
+    def close(self):
+        """연결 풀 종료"""
+        self._session.close()
         
-    def _wait_for_rate_limit(self):
-        """Rate limit 대기"""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+    def _wait_for_rate_limit(self, is_private: bool = False):
+        """
+        Rate limit 대기
+        
+        어댑터 인스턴스가 여러 개여도 프로세스 전체에서 하나의 토큰 버킷을 공유한다.
+        """
+        limiter = exchange_limiter if is_private else quotation_limiter
+        limiter.acquire()
     
     def _get_headers(self, query_string: Optional[str] = None) -> Dict[str, str]:
         """
@@ -55,21 +273,7 @@ class UpbitAdapter:
         Returns:
             헤더 딕셔너리
         """
-        payload = {
-            "access_key": self.access_key,
-            "nonce": str(int(time.time() * 1000)),
-        }
-        
-        if query_string:
-            payload["query_string"] = query_string
-        
-        jwt_token = jwt.encode(payload, self.secret_key, algorithm="HS256")
-        authorization_token = f"Bearer {jwt_token}"
-        
-        return {
-            "Authorization": authorization_token,
-            "Content-Type": "application/json",
-        }
+        return auth_headers(self.access_key, self.secret_key, query_string)
     
     def _request(
         self,
@@ -93,7 +297,27 @@ class UpbitAdapter:
         Raises:
             UpbitError: API 오류
         """
-        self._wait_for_rate_limit()
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                return self._send(method, endpoint, params, is_private)
+            except UpbitRateLimitError:
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    raise
+                # 같은 버킷을 쓰는 모든 요청이 함께 물러남
+                backoff = 0.5 * 2 ** attempt
+                limiter = exchange_limiter if is_private else quotation_limiter
+                limiter.pause(backoff)
+                logger.warning(f"Rate limit 초과, {backoff:.1f}초 후 재시도: {endpoint}")
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        is_private: bool = False,
+    ) -> Dict[str, Any]:
+        """API 요청 1회 전송 (_request 참고)"""
+        self._wait_for_rate_limit(is_private)
         
         url = f"{self.BASE_URL}/{endpoint}"
         headers = {"Accept": "application/json"}
@@ -102,28 +326,24 @@ class UpbitAdapter:
             query_string = urlencode(params) if params else ""
             headers.update(self._get_headers(query_string))
         
+        started = time.perf_counter()
         try:
             if method == "GET":
-                response = requests.get(url, params=params, headers=headers, timeout=10)
+                response = self._session.get(url, params=params, headers=headers, timeout=10)
             elif method == "POST":
-                response = requests.post(url, json=params, headers=headers, timeout=10)
+                response = self._session.post(url, json=params, headers=headers, timeout=10)
             elif method == "DELETE":
-                response = requests.delete(url, params=params, headers=headers, timeout=10)
+                response = self._session.delete(url, params=params, headers=headers, timeout=10)
             else:
                 raise ValueError(f"Unsupported method: {method}")
             
+            upbit_latency.observe(f"{method} {endpoint}", time.perf_counter() - started)
             response.raise_for_status()
             return response.json()
             
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise UpbitAuthError("인증 실패. API 키를 확인하세요.")
-            elif response.status_code == 429:
-                raise UpbitRateLimitError("Rate limit 초과. 잠시 후 다시 시도하세요.")
-            else:
-                error_data = response.json() if response.content else {}
-                error_msg = error_data.get("error", {}).get("message", str(e))
-                raise UpbitAPIError(f"API 오류: {error_msg}", error_code=response.status_code)
+            error_data = response.json() if response.content else {}
+            raise error_from_response(response.status_code, error_data, str(e))
         except requests.exceptions.RequestException as e:
             raise UpbitError(f"요청 실패: {str(e)}")
     
@@ -182,30 +402,7 @@ class UpbitAdapter:
         Returns:
             주문 결과
         """
-        params = {
-            "market": market,
-            "side": side,
-            "ord_type": ord_type,
-        }
-        
-        if ord_type == "limit":
-            if volume and price:
-                params["volume"] = str(volume)
-                params["price"] = str(price)
-            else:
-                raise ValueError("limit 주문은 volume과 price가 필요합니다.")
-        elif ord_type == "price":
-            if price:
-                params["price"] = str(price)
-            else:
-                raise ValueError("price 주문은 price가 필요합니다.")
-        elif ord_type == "market":
-            if side == "bid" and price:
-                params["price"] = str(price)
-            elif side == "ask" and volume:
-                params["volume"] = str(volume)
-            else:
-                raise ValueError("market 주문 파라미터가 올바르지 않습니다.")
+        params = order_params(market, side, volume, price, ord_type)
         
         try:
             response = self._request("POST", "orders", params=params, is_private=True)
@@ -255,10 +452,31 @@ class UpbitAdapter:
             raise
     
     # 시장 데이터
+    def get_markets(self) -> List[Dict[str, Any]]:
+        """전체 마켓 목록 조회"""
+        return self._request("GET", "market/all", is_private=False)
+    
+    def get_valid_markets(self) -> Optional[set]:
+        """
+        거래 가능한 마켓 코드 집합 (MARKET_LIST_TTL 동안 캐시)
+        
+        Returns:
+            마켓 코드 집합, 조회에 실패했고 캐시도 없으면 None
+        """
+        if self._valid_markets is None or time.monotonic() - self._markets_loaded_at > MARKET_LIST_TTL:
+            try:
+                self._valid_markets = {market["market"] for market in self.get_markets()}
+                self._markets_loaded_at = time.monotonic()
+            except Exception as e:
+                logger.warning(f"마켓 목록 조회 실패, 이전 목록 사용: {e}")
+        return self._valid_markets
+    
     def get_ticker(self, markets: List[str]) -> List[Dict[str, Any]]:
         """
         현재가 조회
         
+        마켓 목록에 없는 코드는 요청 전에 제외하고, 나머지는 최소 요청 수로 묶어 조회한다.
+        
         Args:
             markets: 마켓 코드 리스트
             
@@ -268,66 +486,40 @@ class UpbitAdapter:
         if not markets:
             return []
         
-        # 마켓 코드를 배치로 나누어 요청 (한 번에 너무 많으면 실패할 수 있음)
-        batch_size = 10
+        batches, dropped = split_markets(markets, self.get_valid_markets())
+        if dropped:
+            logger.debug(f"존재하지 않는 마켓 제외: {dropped}")
+        
         all_tickers = []
+        for batch in batches:
+            all_tickers.extend(self._get_ticker_batch(batch))
+        return all_tickers
+    
+    def _get_ticker_batch(self, batch: List[str]) -> List[Dict[str, Any]]:
+        """현재가 배치 조회 (마켓 목록이 없거나 오래되어 실패하면 개별 마켓으로 재시도)"""
+        try:
+            response = self._request("GET", "ticker", params={"markets": ",".join(batch)}, is_private=False)
+            if isinstance(response, list):
+                return response
+            logger.debug(f"배치 조회 실패, 개별 마켓으로 재시도: {batch}")
+        except Exception as e:
+            logger.debug(f"배치 조회 실패, 개별 마켓으로 재시도: {batch}, {e}")
         
-        for i in range(0, len(markets), batch_size):
-            batch = markets[i:i + batch_size]
-            params = {"markets": ",".join(batch)}
+        tickers = []
+        for market in batch:
             try:
-                response = self._request("GET", "ticker", params=params, is_private=False)
+                response = self._request("GET", "ticker", params={"markets": market}, is_private=False)
                 if isinstance(response, list):
-                    all_tickers.extend(response)
-                elif isinstance(response, dict) and "error" in response:
-                    # 에러가 발생하면 개별 마켓으로 재시도
-                    logger.debug(f"배치 조회 실패, 개별 마켓으로 재시도: {batch}")
-                    # 개별 마켓으로 요청
-                    for market in batch:
-                        try:
-                            individual_response = self._request("GET", "ticker", params={"markets": market}, is_private=False)
-                            if isinstance(individual_response, list) and len(individual_response) > 0:
-                                all_tickers.extend(individual_response)
-                        except Exception:
-                            # 개별 마켓도 실패하면 건너뛰기
-                            continue
-                else:
-                    all_tickers.extend(response if isinstance(response, list) else [response])
-            except UpbitAPIError as e:
-                # "Code not found" 오류는 일부 마켓이 존재하지 않는 경우
-                if "not found" in str(e).lower() or "code" in str(e).lower():
-                    # 배치 실패 시 개별 마켓으로 재시도
-                    logger.debug(f"배치 조회 실패 (Code not found), 개별 마켓으로 재시도: {batch}")
-                    for market in batch:
-                        try:
-                            individual_response = self._request("GET", "ticker", params={"markets": market}, is_private=False)
-                            if isinstance(individual_response, list) and len(individual_response) > 0:
-                                all_tickers.extend(individual_response)
-                        except Exception:
-                            # 개별 마켓도 실패하면 건너뛰기
-                            continue
-                else:
-                    logger.error(f"현재가 조회 실패: {e}")
-                    # 다른 에러도 개별 마켓으로 재시도
-                    for market in batch:
-                        try:
-                            individual_response = self._request("GET", "ticker", params={"markets": market}, is_private=False)
-                            if isinstance(individual_response, list) and len(individual_response) > 0:
-                                all_tickers.extend(individual_response)
-                        except Exception:
-                            continue
-            except Exception as e:
-                # 예외 발생 시 개별 마켓으로 재시도
-                logger.debug(f"배치 조회 예외 발생, 개별 마켓으로 재시도: {batch}, {e}")
-                for market in batch:
-                    try:
-                        individual_response = self._request("GET", "ticker", params={"markets": market}, is_private=False)
-                        if isinstance(individual_response, list) and len(individual_response) > 0:
-                            all_tickers.extend(individual_response)
-                    except Exception:
-                        continue
-        
-        return all_tickers
+                    tickers.extend(response)
+            except Exception:
+                # 개별 마켓도 실패하면 건너뛰기
+                continue
+        return tickers
+    
+    @staticmethod
+    def _candle_endpoint(interval: str):
+        """캔들 간격을 API 엔드포인트와 캔들 길이로 변환 (candle_endpoint 참고)"""
+        return candle_endpoint(interval)
     
     def get_ohlcv(
         self,
@@ -339,27 +531,91 @@ class UpbitAdapter:
         """
         OHLCV 조회
         
+        200개를 넘으면 캔들 길이 × 개수로 페이지별 조회 시점을 미리 계산해
+        페이지를 동시에 요청하고, 시간순으로 이어 붙인 뒤 중복을 제거한다.
+        
         Args:
             market: 마켓 코드
             interval: 캔들 간격 (day, minute1, minute3, minute5, ...)
             count: 조회 개수
-            to: 조회 시점 (선택사항)
+            to: 조회 시점 (UTC, 선택사항)
             
         Returns:
-            OHLCV 데이터
+            OHLCV 데이터 (최신순)
         """
-        params = {
-            "market": market,
-            "interval": interval,
-            "count": count,
-        }
-        if to:
-            params["to"] = to
+        endpoint, length = self._candle_endpoint(interval)
         
         try:
-            response = self._request("GET", f"candles/{interval}", params=params, is_private=False)
-            return response
+            if count <= CANDLE_PAGE_SIZE:
+                return self._get_candle_page(endpoint, market, count, to)
+            
+            if length is None:
+                return self._get_candles_sequential(endpoint, market, count, to)
+            
+            return self._get_candles_concurrent(endpoint, length, market, count, to)
         except Exception as e:
             logger.error(f"OHLCV 조회 실패: {e}")
             raise
+    
+    def _get_candle_page(
+        self,
+        endpoint: str,
+        market: str,
+        count: int,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """캔들 한 페이지 조회"""
+        params = {"market": market, "count": count}
+        if to:
+            params["to"] = to
+        return self._request("GET", endpoint, params=params, is_private=False)
+    
+    def _get_candles_sequential(
+        self,
+        endpoint: str,
+        market: str,
+        count: int,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """이전 응답의 마지막 캔들 시각을 이어 가며 순서대로 조회"""
+        candles = []
+        while len(candles) < count:
+            page_count = min(CANDLE_PAGE_SIZE, count - len(candles))
+            page = self._get_candle_page(endpoint, market, page_count, to)
+            candles.extend(page)
+            if len(page) < page_count:
+                break
+            to = page[-1]["candle_date_time_utc"]
+        return candles
+    
+    def _get_candles_concurrent(
+        self,
+        endpoint: str,
+        length: timedelta,
+        market: str,
+        count: int,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """페이지별 조회 시점을 미리 계산하여 동시에 조회"""
+        page_counts, page_ends = plan_candle_pages(length, count, to)
+        
+        with ThreadPoolExecutor(max_workers=min(CANDLE_MAX_WORKERS, len(page_counts))) as executor:
+            futures = [
+                executor.submit(self._get_candle_page, endpoint, market, page_count, page_end)
+                for page_count, page_end in zip(page_counts, page_ends)
+            ]
+            pages = [future.result() for future in futures]
+        
+        candles, exhausted = merge_candle_pages(page_counts, pages, count)
+        
+        # 거래가 없어 비어 있는 캔들 때문에 모자라면 이어서 조회
+        if not exhausted and candles and len(candles) < count:
+            remaining = count - len(candles)
+            oldest = candles[-1]["candle_date_time_utc"]
+            if remaining <= CANDLE_PAGE_SIZE:
+                candles += self._get_candle_page(endpoint, market, remaining, oldest)
+            else:
+                candles += self._get_candles_concurrent(endpoint, length, market, remaining, oldest)
+        
+        return candles
 
@@ -0,0 +1,429 @@
+"""
+Upbit API 비동기 어댑터
+
+이벤트 루프를 막지 않도록 httpx.AsyncClient로 요청한다.
+연결은 어댑터 인스턴스 안에서 재사용(keep-alive)하고, Rate limit 버킷과
+오류 변환 규칙은 동기 어댑터(UpbitAdapter)와 공유한다.
+"""
+import asyncio
+import time
+import httpx
+from datetime import timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from app.adapters.upbit.adapter import (
+    CANDLE_PAGE_SIZE,
+    MARKET_LIST_TTL,
+    auth_headers,
+    candle_endpoint,
+    error_from_response,
+    merge_candle_pages,
+    order_params,
+    plan_candle_pages,
+    split_markets,
+)
+from app.adapters.upbit.exceptions import UpbitError, UpbitRateLimitError
+from app.adapters.upbit.rate_limiter import quotation_limiter, exchange_limiter
+from app.core.config import settings
+from app.core.latency import upbit_latency
+from app.core.logging import get_logger
+
+logger = get_logger(__name__, "system")
+
+
+class AsyncUpbitAdapter:
+    """Upbit API 비동기 어댑터 (UpbitAdapter와 같은 메서드를 코루틴으로 제공)"""
+
+    BASE_URL = "https://api.upbit.com/v1"
+    MAX_RATE_LIMIT_RETRIES = 3  # 429 응답 시 재시도 횟수
+
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            access_key: Upbit Access Key
+            secret_key: Upbit Secret Key
+            transport: httpx 전송 계층 (테스트용, 기본은 네트워크)
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self._valid_markets: Optional[set] = None
+        self._markets_loaded_at = 0.0
+        self._markets_lock = asyncio.Lock()
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            headers={"Accept": "application/json"},
+            timeout=10,
+            limits=httpx.Limits(
+                max_connections=settings.upbit_pool_maxsize,
+                max_keepalive_connections=settings.upbit_pool_connections,
+                keepalive_expiry=settings.upbit_keepalive_expiry,
+            ),
+            transport=transport,
+        )
+
+    async def aclose(self):
+        """연결 풀 종료"""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        is_private: bool = False,
+    ) -> Any:
+        """
+        API 요청
+
+        Args:
+            method: HTTP 메서드 (GET, POST, DELETE)
+            endpoint: API 엔드포인트
+            params: 요청 파라미터
+            is_private: Private API 여부
+
+        Returns:
+            응답 데이터
+
+        Raises:
+            UpbitError: API 오류
+        """
+        limiter = exchange_limiter if is_private else quotation_limiter
+        for attempt in range(self.MAX_RATE_LIMIT_RETRIES + 1):
+            try:
+                return await self._send(method, endpoint, params, is_private)
+            except UpbitRateLimitError:
+                if attempt == self.MAX_RATE_LIMIT_RETRIES:
+                    raise
+                # 같은 버킷을 쓰는 모든 요청이 함께 물러남
+                backoff = 0.5 * 2 ** attempt
+                limiter.pause(backoff)
+                logger.warning(f"Rate limit 초과, {backoff:.1f}초 후 재시도: {endpoint}")
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        is_private: bool = False,
+    ) -> Any:
+        """API 요청 1회 전송 (_request 참고)"""
+        limiter = exchange_limiter if is_private else quotation_limiter
+        await limiter.acquire_async()
+
+        headers = {}
+        if is_private:
+            query_string = urlencode(params) if params else ""
+            headers.update(auth_headers(self.access_key, self.secret_key, query_string))
+
+        started = time.perf_counter()
+        try:
+            if method == "GET":
+                response = await self._client.get(endpoint, params=params, headers=headers)
+            elif method == "POST":
+                response = await self._client.post(endpoint, json=params, headers=headers)
+            elif method == "DELETE":
+                response = await self._client.delete(endpoint, params=params, headers=headers)
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+
+            upbit_latency.observe(f"{method} {endpoint}", time.perf_counter() - started)
+            response.raise_for_status()
+            return response.json()
+
+        except httpx.HTTPStatusError as e:
+            error_data = response.json() if response.content else {}
+            raise error_from_response(response.status_code, error_data, str(e))
+        except httpx.HTTPError as e:
+            raise UpbitError(f"요청 실패: {str(e)}")
+
+    # 계좌 조회
+    async def get_accounts(self) -> List[Dict[str, Any]]:
+        """전체 계좌 조회"""
+        try:
+            return await self._request("GET", "accounts", is_private=True)
+        except Exception as e:
+            logger.error(f"계좌 조회 실패: {e}")
+            raise
+
+    async def get_balance(self, currency: str = "KRW") -> Dict[str, Any]:
+        """
+        특정 화폐 잔고 조회
+
+        Args:
+            currency: 화폐 코드 (KRW, BTC, ETH 등)
+
+        Returns:
+            잔고 정보
+        """
+        accounts = await self.get_accounts()
+        for account in accounts:
+            if account["currency"] == currency:
+                return account
+        return {
+            "currency": currency,
+            "balance": "0.0",
+            "locked": "0.0",
+            "avg_buy_price": "0.0",
+            "avg_buy_price_modified": False,
+            "unit_currency": "KRW",
+        }
+
+    # 주문
+    async def place_order(
+        self,
+        market: str,
+        side: str,
+        volume: Optional[float] = None,
+        price: Optional[float] = None,
+        ord_type: str = "limit",
+    ) -> Dict[str, Any]:
+        """
+        주문하기
+
+        Args:
+            market: 마켓 코드 (KRW-BTC 등)
+            side: 주문 종류 (bid: 매수, ask: 매도)
+            volume: 주문 수량
+            price: 주문 가격
+            ord_type: 주문 타입 (limit, price, market)
+
+        Returns:
+            주문 결과
+        """
+        params = order_params(market, side, volume, price, ord_type)
+
+        try:
+            return await self._request("POST", "orders", params=params, is_private=True)
+        except Exception as e:
+            logger.error(f"주문 실패: {e}")
+            raise
+
+    async def cancel_order(self, uuid: str) -> Dict[str, Any]:
+        """
+        주문 취소
+
+        Args:
+            uuid: 주문 UUID
+
+        Returns:
+            취소 결과
+        """
+        try:
+            return await self._request("DELETE", "order", params={"uuid": uuid}, is_private=True)
+        except Exception as e:
+            logger.error(f"주문 취소 실패: {e}")
+            raise
+
+    async def get_orders(self, market: Optional[str] = None, state: str = "wait") -> List[Dict[str, Any]]:
+        """
+        주문 조회
+
+        Args:
+            market: 마켓 코드 (선택사항)
+            state: 주문 상태 (wait, done, cancel)
+
+        Returns:
+            주문 목록
+        """
+        params = {"state": state}
+        if market:
+            params["market"] = market
+
+        try:
+            return await self._request("GET", "orders", params=params, is_private=True)
+        except Exception as e:
+            logger.error(f"주문 조회 실패: {e}")
+            raise
+
+    # 시장 데이터
+    async def get_markets(self) -> List[Dict[str, Any]]:
+        """전체 마켓 목록 조회"""
+        return await self._request("GET", "market/all")
+
+    async def get_valid_markets(self) -> Optional[set]:
+        """
+        거래 가능한 마켓 코드 집합 (MARKET_LIST_TTL 동안 캐시, 동시 호출은 한 번만 조회)
+
+        Returns:
+            마켓 코드 집합, 조회에 실패했고 캐시도 없으면 None
+        """
+        async with self._markets_lock:
+            if self._valid_markets is None or time.monotonic() - self._markets_loaded_at > MARKET_LIST_TTL:
+                try:
+                    self._valid_markets = {market["market"] for market in await self.get_markets()}
+                    self._markets_loaded_at = time.monotonic()
+                except Exception as e:
+                    logger.warning(f"마켓 목록 조회 실패, 이전 목록 사용: {e}")
+        return self._valid_markets
+
+    async def get_ticker(self, markets: List[str]) -> List[Dict[str, Any]]:
+        """
+        현재가 조회
+
+        마켓 목록에 없는 코드는 요청 전에 제외하고, 나머지는 최소 요청 수로 묶어
+        동시에 조회한다.
+
+        Args:
+            markets: 마켓 코드 리스트
+
+        Returns:
+            현재가 정보
+        """
+        if not markets:
+            return []
+
+        batches, dropped = split_markets(markets, await self.get_valid_markets())
+        if dropped:
+            logger.debug(f"존재하지 않는 마켓 제외: {dropped}")
+
+        results = await asyncio.gather(*(self._get_ticker_batch(batch) for batch in batches))
+        return [ticker for tickers in results for ticker in tickers]
+
+    async def _get_ticker_batch(self, batch: List[str]) -> List[Dict[str, Any]]:
+        """현재가 배치 조회 (마켓 목록이 없거나 오래되어 실패하면 개별 마켓으로 재시도)"""
+        try:
+            response = await self._request("GET", "ticker", params={"markets": ",".join(batch)})
+            if isinstance(response, list):
+                return response
+            if not (isinstance(response, dict) and "error" in response):
+                return [response]
+            logger.debug(f"배치 조회 실패, 개별 마켓으로 재시도: {batch}")
+        except Exception as e:
+            logger.debug(f"배치 조회 실패, 개별 마켓으로 재시도: {batch}, {e}")
+
+        results = await asyncio.gather(
+            *(self._request("GET", "ticker", params={"markets": market}) for market in batch),
+            return_exceptions=True,
+        )
+        # 개별 마켓도 실패하면 건너뛰기
+        return [
+            ticker
+            for result in results
+            if isinstance(result, list)
+            for ticker in result
+        ]
+
+    async def get_ohlcv(
+        self,
+        market: str,
+        interval: str = "day",
+        count: int = 200,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        OHLCV 조회 (UpbitAdapter.get_ohlcv와 같은 페이지 분할)
+
+        Args:
+            market: 마켓 코드
+            interval: 캔들 간격 (day, minute1, minute3, minute5, ...)
+            count: 조회 개수
+            to: 조회 시점 (UTC, 선택사항)
+
+        Returns:
+            OHLCV 데이터 (최신순)
+        """
+        endpoint, length = candle_endpoint(interval)
+
+        try:
+            if count <= CANDLE_PAGE_SIZE:
+                return await self._get_candle_page(endpoint, market, count, to)
+
+            if length is None:
+                return await self._get_candles_sequential(endpoint, market, count, to)
+
+            return await self._get_candles_concurrent(endpoint, length, market, count, to)
+        except Exception as e:
+            logger.error(f"OHLCV 조회 실패: {e}")
+            raise
+
+    async def _get_candle_page(
+        self,
+        endpoint: str,
+        market: str,
+        count: int,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """캔들 한 페이지 조회"""
+        params = {"market": market, "count": count}
+        if to:
+            params["to"] = to
+        return await self._request("GET", endpoint, params=params)
+
+    async def _get_candles_sequential(
+        self,
+        endpoint: str,
+        market: str,
+        count: int,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """이전 응답의 마지막 캔들 시각을 이어 가며 순서대로 조회"""
+        candles = []
+        while len(candles) < count:
+            page_count = min(CANDLE_PAGE_SIZE, count - len(candles))
+            page = await self._get_candle_page(endpoint, market, page_count, to)
+            candles.extend(page)
+            if len(page) < page_count:
+                break
+            to = page[-1]["candle_date_time_utc"]
+        return candles
+
+    async def _get_candles_concurrent(
+        self,
+        endpoint: str,
+        length: timedelta,
+        market: str,
+        count: int,
+        to: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """페이지별 조회 시점을 미리 계산하여 동시에 조회"""
+        page_counts, page_ends = plan_candle_pages(length, count, to)
+        pages = await asyncio.gather(*(
+            self._get_candle_page(endpoint, market, page_count, page_end)
+            for page_count, page_end in zip(page_counts, page_ends)
+        ))
+
+        candles, exhausted = merge_candle_pages(page_counts, pages, count)
+
+        # 거래가 없어 비어 있는 캔들 때문에 모자라면 이어서 조회
+        if not exhausted and candles and len(candles) < count:
+            remaining = count - len(candles)
+            oldest = candles[-1]["candle_date_time_utc"]
+            if remaining <= CANDLE_PAGE_SIZE:
+                candles += await self._get_candle_page(endpoint, market, remaining, oldest)
+            else:
+                candles += await self._get_candles_concurrent(endpoint, length, market, remaining, oldest)
+
+        return candles
+
+
+# 전역 비동기 어댑터 (API 키별 하나, 연결 풀 공유)
+_async_adapters: Dict[Tuple[str, str], AsyncUpbitAdapter] = {}
+
+
+def get_async_upbit_adapter(access_key: str, secret_key: str) -> AsyncUpbitAdapter:
+    """
+    API 키별 비동기 어댑터 반환 (없으면 생성)
+
+    Args:
+        access_key: Upbit Access Key
+        secret_key: Upbit Secret Key
+    """
+    key = (access_key, secret_key)
+    adapter = _async_adapters.get(key)
+    if adapter is None or adapter._client.is_closed:
+        adapter = _async_adapters[key] = AsyncUpbitAdapter(access_key, secret_key)
+    return adapter
+
+
+async def close_async_upbit_adapters():
+    """모든 비동기 어댑터의 연결 풀 종료 (애플리케이션 종료 시)"""
+    adapters = list(_async_adapters.values())
+    _async_adapters.clear()
+    for adapter in adapters:
+        await adapter.aclose()
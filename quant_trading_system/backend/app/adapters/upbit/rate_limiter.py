@@ -0,0 +1,80 @@
+"""
+Upbit API 요청 제한
+프로세스 전체에서 공유하는 토큰 버킷 (동기/비동기 클라이언트 공용)
+"""
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """토큰 버킷 요청 제한기 (스레드 안전)"""
+
+    def __init__(self, rate: float, capacity: int = None):
+        """
+        Args:
+            rate: 초당 허용 요청 수
+            capacity: 한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본: rate)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # pause() 중에는 updated_at이 미래 시각이므로 그 이후부터 채움
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def try_acquire(self) -> float:
+        """
+        토큰 하나 가져오기 시도 (대기하지 않음)
+
+        Returns:
+            가져왔으면 0, 아니면 다시 시도하기까지 기다려야 할 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+
+            if now < self.paused_until:
+                return self.paused_until - now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """토큰 하나 가져오기 (없으면 스레드 대기)"""
+        wait = self.try_acquire()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self.try_acquire()
+
+    async def acquire_async(self):
+        """토큰 하나 가져오기 (없으면 이벤트 루프를 막지 않고 대기)"""
+        wait = self.try_acquire()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self.try_acquire()
+
+    def pause(self, seconds: float):
+        """
+        요청 일시 중지 (429 응답 시 백오프)
+
+        Args:
+            seconds: 중지 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            self.updated_at = self.paused_until
+
+
+# 전역 요청 제한 인스턴스 (Upbit 정책: 시세 조회 초당 10회, 주문 초당 8회)
+quotation_limiter = TokenBucket(rate=10)
+exchange_limiter = TokenBucket(rate=8)
@@ -8,6 +8,7 @@ from typing import List, Dict, Any
 from app.core.monitoring import system_monitor
 from app.core.strategy_manager import strategy_manager
 from app.core.job_state import job_state_manager
+from app.core.latency import upbit_latency
 
 router = APIRouter(prefix="/monitoring", tags=["Monitoring"])
 
@@ -88,4 +89,10 @@ async def get_system_metrics():
     return system_monitor.get_all_metrics()
 
 
-
+@router.get("/upbit-latency")
+async def get_upbit_latency():
+    """Upbit API 엔드포인트별 지연 시간 히스토그램 조회"""
+    return {
+        "unit": "ms",
+        "endpoints": upbit_latency.snapshot(),
+    }
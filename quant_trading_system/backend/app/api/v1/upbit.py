@@ -3,9 +3,10 @@ Upbit API 연동 엔드포인트
 실제 계좌 조회 및 주문
 """
 from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 from app.core.config import settings, ENV_FILE
-from app.adapters.upbit.adapter import UpbitAdapter
+from app.adapters.upbit.async_adapter import AsyncUpbitAdapter, get_async_upbit_adapter
 from app.adapters.upbit.exceptions import UpbitError, UpbitAuthError
 from app.core.logging import get_logger
 
@@ -13,8 +14,14 @@ logger = get_logger(__name__, "system")
 router = APIRouter(prefix="/upbit", tags=["Upbit"])
 
 
-def get_upbit_adapter() -> UpbitAdapter:
-    """UpbitAdapter 인스턴스 생성"""
+@lru_cache(maxsize=1)
+def load_upbit_credentials() -> Tuple[str, str]:
+    """
+    Upbit API 키 로드 (처음 한 번만, 실패하면 다음 요청에서 다시 시도)
+    
+    Returns:
+        (access_key, secret_key)
+    """
     # 환경 변수 직접 확인 (설정이 제대로 로드되지 않았을 경우 대비)
     import os
     from dotenv import load_dotenv
@@ -24,16 +31,17 @@ def get_upbit_adapter() -> UpbitAdapter:
     backend_root = Path(__file__).parent.parent.parent.parent
     env_file = backend_root / ".env"
     
-    # .env 파일 다시 로드 시도
-    if env_file.exists():
-        load_dotenv(dotenv_path=env_file, override=True)
-        logger.debug(f"✅ .env 파일 로드됨: {env_file}")
-    else:
-        logger.warning(f"⚠️ .env 파일을 찾을 수 없습니다: {env_file}")
-    
-    # settings에서 먼저 확인, 없으면 환경 변수에서 직접 가져오기
-    access_key = settings.upbit_access_key or os.getenv('UPBIT_ACCESS_KEY', '')
-    secret_key = settings.upbit_secret_key or os.getenv('UPBIT_SECRET_KEY', '')
+    # settings에서 먼저 확인, 없을 때만 .env 파일 다시 로드
+    access_key = settings.upbit_access_key
+    secret_key = settings.upbit_secret_key
+    if not access_key or not secret_key:
+        if env_file.exists():
+            load_dotenv(dotenv_path=env_file, override=True)
+            logger.debug(f"✅ .env 파일 로드됨: {env_file}")
+        else:
+            logger.warning(f"⚠️ .env 파일을 찾을 수 없습니다: {env_file}")
+        access_key = access_key or os.getenv('UPBIT_ACCESS_KEY', '')
+        secret_key = secret_key or os.getenv('UPBIT_SECRET_KEY', '')
     
     if not access_key or not secret_key:
         logger.error(
@@ -48,15 +56,20 @@ def get_upbit_adapter() -> UpbitAdapter:
             detail="Upbit API 키가 설정되지 않았습니다. backend/.env 파일을 생성하고 UPBIT_ACCESS_KEY와 UPBIT_SECRET_KEY를 설정한 후 서버를 재시작하세요."
         )
     
-    # 환경 변수에서 직접 가져온 값 사용
-    return UpbitAdapter(access_key, secret_key)
+    return access_key, secret_key
+
+
+def get_upbit_adapter() -> AsyncUpbitAdapter:
+    """비동기 Upbit 어댑터 반환 (API 키는 한 번만 로드, 어댑터와 연결 풀은 재사용)"""
+    access_key, secret_key = load_upbit_credentials()
+    return get_async_upbit_adapter(access_key, secret_key)
 
 
 @router.get("/accounts")
-async def get_accounts(adapter: UpbitAdapter = Depends(get_upbit_adapter)):
+async def get_accounts(adapter: AsyncUpbitAdapter = Depends(get_upbit_adapter)):
     """전체 계좌 조회"""
     try:
-        accounts = adapter.get_accounts()
+        accounts = await adapter.get_accounts()
         return {
             "success": True,
             "data": accounts,
@@ -74,10 +87,10 @@ async def get_accounts(adapter: UpbitAdapter = Depends(get_upbit_adapter)):
 
 
 @router.get("/balance/{currency}")
-async def get_balance(currency: str, adapter: UpbitAdapter = Depends(get_upbit_adapter)):
+async def get_balance(currency: str, adapter: AsyncUpbitAdapter = Depends(get_upbit_adapter)):
     """특정 화폐 잔고 조회"""
     try:
-        balance = adapter.get_balance(currency)
+        balance = await adapter.get_balance(currency)
         return {
             "success": True,
             "data": balance,
@@ -94,7 +107,7 @@ async def get_balance(currency: str, adapter: UpbitAdapter = Depends(get_upbit_a
 
 
 @router.get("/ticker")
-async def get_ticker(markets: str, adapter: UpbitAdapter = Depends(get_upbit_adapter)):
+async def get_ticker(markets: str, adapter: AsyncUpbitAdapter = Depends(get_upbit_adapter)):
     """현재가 조회
     
     Args:
@@ -109,7 +122,7 @@ async def get_ticker(markets: str, adapter: UpbitAdapter = Depends(get_upbit_ada
                 "message": "마켓 코드가 없습니다.",
             }
         
-        tickers = adapter.get_ticker(market_list)
+        tickers = await adapter.get_ticker(market_list)
         return {
             "success": True,
             "data": tickers,
@@ -141,7 +154,7 @@ async def get_ticker(markets: str, adapter: UpbitAdapter = Depends(get_upbit_ada
 async def get_orders(
     market: str = None,
     state: str = "wait",
-    adapter: UpbitAdapter = Depends(get_upbit_adapter),
+    adapter: AsyncUpbitAdapter = Depends(get_upbit_adapter),
 ):
     """주문 조회
     
@@ -150,7 +163,7 @@ async def get_orders(
         state: 주문 상태 (wait, done, cancel)
     """
     try:
-        orders = adapter.get_orders(market=market, state=state)
+        orders = await adapter.get_orders(market=market, state=state)
         return {
             "success": True,
             "data": orders,
@@ -4,13 +4,15 @@
 가상 자금으로 전략을 테스트하기 위한 계좌 관리 API
 """
 
+import heapq
+from itertools import islice
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional, Dict, Any, List
 from app.core.virtual_account_manager import virtual_account_manager
 from app.core.logging import get_logger
 
-# get_upbit_adapter는 upbit.py에 있으므로 여기서는 직접 adapter를 생성
-from app.adapters.upbit.adapter import UpbitAdapter
+# 현재가는 전략과 공유하는 현재가 캐시에서 조회
+from app.core.ticker_cache import ticker_cache
 from app.core.config import settings
 from app.adapters.upbit.exceptions import UpbitAuthError, UpbitError
 
@@ -57,18 +59,8 @@ async def get_balance(strategy_id: Optional[str] = Query(None, description="전
         prices = {}
         if holdings:
             try:
-                # UpbitAdapter 인스턴스 생성
                 if settings.upbit_access_key and settings.upbit_secret_key:
-                    adapter = UpbitAdapter(
-                        access_key=settings.upbit_access_key,
-                        secret_key=settings.upbit_secret_key
-                    )
-                    markets = [f"KRW-{currency}" for currency in holdings.keys()]
-                    tickers = adapter.get_ticker(markets)
-                    for ticker in tickers:
-                        if ticker and ticker.get('market'):
-                            currency = ticker['market'].replace('KRW-', '')
-                            prices[currency] = ticker.get('trade_price', 0)
+                    prices = await ticker_cache.get_prices(holdings.keys())
             except Exception as e:
                 logger.warning(f"현재가 조회 실패: {e}")
         
@@ -149,18 +141,8 @@ async def get_summary(strategy_id: Optional[str] = Query(None, description="전
         prices = {}
         if holdings:
             try:
-                # UpbitAdapter 인스턴스 생성
                 if settings.upbit_access_key and settings.upbit_secret_key:
-                    adapter = UpbitAdapter(
-                        access_key=settings.upbit_access_key,
-                        secret_key=settings.upbit_secret_key
-                    )
-                    markets = [f"KRW-{currency}" for currency in holdings.keys()]
-                    tickers = adapter.get_ticker(markets)
-                    for ticker in tickers:
-                        if ticker and ticker.get('market'):
-                            currency = ticker['market'].replace('KRW-', '')
-                            prices[currency] = ticker.get('trade_price', 0)
+                    prices = await ticker_cache.get_prices(holdings.keys())
             except Exception as e:
                 logger.warning(f"현재가 조회 실패: {e}")
         
@@ -200,33 +182,36 @@ async def get_summary(strategy_id: Optional[str] = Query(None, description="전
 @router.get("/trades")
 async def get_trades(
     limit: Optional[int] = Query(50, description="조회할 거래 개수"),
-    strategy_id: Optional[str] = Query(None, description="전략 ID (없으면 모든 전략의 거래 내역)")
+    strategy_id: Optional[str] = Query(None, description="전략 ID (없으면 모든 전략의 거래 내역)"),
+    after_id: Optional[int] = Query(None, description="커서 - 이 거래 ID보다 오래된 거래부터 조회 (strategy_id 지정 시)"),
 ):
-    """거래 내역 조회"""
+    """거래 내역 조회 (최신순)"""
     try:
+        next_after_id = None
         if strategy_id:
-            # 특정 전략의 거래 내역
+            # 특정 전략의 거래 내역 (커서 페이지)
             account = virtual_account_manager.get_account(strategy_id)
-            history = account.get_trade_history(limit=limit)
+            history = account.get_trade_history(limit=limit, after_id=after_id)
+            if limit and len(history) == limit:
+                next_after_id = history[-1]['id']
         else:
-            # 모든 전략의 거래 내역 합쳐서 정렬
+            # 모든 전략의 최근 거래를 합쳐서 최신순으로 limit개
             all_accounts = virtual_account_manager.get_all_accounts()
-            all_trades = []
-            
+            pages = []
             for sid, acc in all_accounts.items():
-                trades = acc.get_trade_history(limit=1000)  # 충분히 많이 가져오기
-                for trade in trades:
-                    trade_copy = trade.copy()
-                    trade_copy['strategy_id'] = sid  # 전략 ID 추가
-                    all_trades.append(trade_copy)
+                pages.append([
+                    {**trade, 'strategy_id': sid}  # 전략 ID 추가
+                    for trade in acc.get_trade_history(limit=limit)
+                ])
             
-            # 타임스탬프 기준으로 정렬 (최신순)
-            all_trades.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            history = all_trades[:limit]
+            # 각 페이지가 이미 최신순이므로 병합만 수행
+            merged = heapq.merge(*pages, key=lambda x: x.get('timestamp', ''), reverse=True)
+            history = list(islice(merged, limit))
         
         return {
             "success": True,
-            "data": history
+            "data": history,
+            "next_after_id": next_after_id,
         }
     except Exception as e:
         logger.error(f"거래 내역 조회 실패: {e}", exc_info=True)
@@ -239,15 +224,10 @@ async def get_strategy_accounts():
     try:
         all_accounts = virtual_account_manager.get_all_accounts()
         
-        # UpbitAdapter 생성 (현재가 조회용)
+        # 현재가 조회 (현재가 캐시)
         prices_map = {}
         if settings.upbit_access_key and settings.upbit_secret_key:
             try:
-                adapter = UpbitAdapter(
-                    access_key=settings.upbit_access_key,
-                    secret_key=settings.upbit_secret_key
-                )
-                
                 # 모든 전략의 보유 코인 수집
                 all_currencies = set()
                 for acc in all_accounts.values():
@@ -255,12 +235,7 @@ async def get_strategy_accounts():
                     all_currencies.update(holdings.keys())
                 
                 if all_currencies:
-                    markets = [f"KRW-{currency}" for currency in all_currencies]
-                    tickers = adapter.get_ticker(markets)
-                    for ticker in tickers:
-                        if ticker and ticker.get('market'):
-                            currency = ticker['market'].replace('KRW-', '')
-                            prices_map[currency] = ticker.get('trade_price', 0)
+                    prices_map = await ticker_cache.get_prices(all_currencies)
             except Exception as e:
                 logger.warning(f"현재가 조회 실패: {e}")
         
@@ -282,7 +257,7 @@ async def get_strategy_accounts():
                 'total_value': total_value,
                 'summary': summary,
                 'prices': prices,  # 직접 접근을 위해 추가
-                'trade_count': len(account.get_trade_history(limit=10000)),
+                'trade_count': account.trade_history.num_trades,
             })
         
         return {
@@ -31,8 +31,8 @@ class BaseStrategy(ABC):
         ----------
         account : VirtualAccount
             가상 계좌 인스턴스
-        upbit_adapter : UpbitAdapter, optional
-            Upbit API 어댑터 (과거 데이터 로드용)
+        upbit_adapter : AsyncUpbitAdapter, optional
+            Upbit API 비동기 어댑터 (과거 데이터 로드용, 메서드를 await로 호출)
         """
         pass
     
@@ -38,6 +38,10 @@ class Settings(BaseSettings):
     upbit_access_key: str = ""
     upbit_secret_key: str = ""
     upbit_server_url: str = "https://api.upbit.com"
+    # Upbit HTTP 연결 풀 (어댑터 인스턴스별)
+    upbit_pool_connections: int = 10
+    upbit_pool_maxsize: int = 20
+    upbit_keepalive_expiry: float = 30.0
     
     @property
     def has_upbit_credentials(self) -> bool:
@@ -0,0 +1,270 @@
+"""
+정수 고정소수점 가상 계좌
+
+VirtualAccount와 같은 공개 API를 정수 연산으로 구현한다.
+거래마다 Decimal(str(x)) 변환과 거래 기록 dict 생성이 반복되지 않도록,
+금액은 정수 원, 수량은 1e-8 단위 정수로 보관하고 거래 기록은 컬럼형 TradeHistory에 쌓아 조회할 때만 dict로 만든다.
+
+반올림 규칙 (잔고가 실제보다 많게 잡히지 않는 쪽으로)
+- 입력 float(가격, 수량, 비율, 수수료율)는 각 단위의 가장 가까운 정수로 변환
+- 매수 수량, 비율 매도 수량: 1e-8 단위 내림 (거래소 주문 수량과 동일)
+- 매수에 필요한 금액: 원 단위 올림
+- 매도 금액: 원 단위 내림, 매도 수수료: 원 단위 올림
+- 금액 매수 시 지정 금액은 원 단위 내림, 수수료는 원 단위 올림
+"""
+
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from app.core.logging import get_logger
+from app.core.trade_history import DEFAULT_CAPACITY, TradeHistory
+
+logger = get_logger(__name__, "virtual_account")
+
+
+QUANTITY_SCALE = 10 ** 8  # 수량 단위 (1e-8)
+PRICE_SCALE = 10 ** 4     # 가격 단위 (0.0001원, 업비트 최소 호가 단위)
+RATE_SCALE = 10 ** 8      # 수수료율/매도 비율 단위
+
+# 수량 × 가격 -> 원 변환 분모
+VALUE_SCALE = QUANTITY_SCALE * PRICE_SCALE
+
+
+def _ceil_div(a: int, b: int) -> int:
+    """정수 올림 나눗셈"""
+    return -(-a // b)
+
+
+def _to_units(value: float, scale: int) -> int:
+    """float를 가장 가까운 정수 단위로 변환"""
+    return int(round(value * scale))
+
+
+class FixedPointVirtualAccount:
+    """가상 계좌 (정수 고정소수점)"""
+
+    def __init__(
+        self,
+        initial_balance: float = 10_000_000,
+        history_capacity: int = DEFAULT_CAPACITY,
+        history_path: Optional[Path] = None,
+    ):
+        """
+        Parameters
+        ----------
+        initial_balance : float
+            초기 잔고 (기본 1000만원, 원 단위 내림)
+        history_capacity : int
+            메모리에 보관할 최근 거래 수
+        history_path : Path, optional
+            오래된 거래 내역을 옮길 SQLite 파일
+        """
+        self.initial_balance_won = int(initial_balance)
+        self.balance_won = self.initial_balance_won  # KRW 잔고 (원)
+        self.holdings_units: Dict[str, int] = {}  # {currency: 수량 (1e-8 단위)}
+        # {currency: 수량 × 가격 (1e-8 × 0.0001원 단위)} - 평균 매수가 = 원가 / 수량
+        self.cost_basis: Dict[str, int] = {}
+        self.trade_history = TradeHistory(history_capacity, history_path)
+        self.created_at = datetime.now()
+        self._updated_ts = time.time()
+
+    @property
+    def updated_at(self) -> datetime:
+        """마지막 변경 시각"""
+        return datetime.fromtimestamp(self._updated_ts)
+
+    @property
+    def initial_balance(self) -> float:
+        """초기 잔고"""
+        return float(self.initial_balance_won)
+
+    def get_balance(self) -> float:
+        """현재 KRW 잔고 조회"""
+        return float(self.balance_won)
+
+    def get_holdings(self) -> Dict[str, float]:
+        """보유 코인 조회"""
+        return {currency: units / QUANTITY_SCALE for currency, units in self.holdings_units.items()}
+
+    def get_avg_buy_prices(self) -> Dict[str, float]:
+        """평균 매수가 조회"""
+        return {
+            currency: self.cost_basis[currency] / units / PRICE_SCALE
+            for currency, units in self.holdings_units.items()
+        }
+
+    def get_total_value(self, prices: Dict[str, float]) -> float:
+        """총 자산 가치 계산 (KRW + 코인 평가액)"""
+        total = float(self.balance_won)
+        for currency, units in self.holdings_units.items():
+            price = prices.get(currency)
+            if price is not None:
+                total += units * price / QUANTITY_SCALE
+        return total
+
+    def buy(self, currency: str, price: float, quantity: Optional[float] = None, amount: Optional[float] = None, commission: float = 0.0005) -> bool:
+        """
+        매수
+
+        Parameters
+        ----------
+        currency : str
+            코인 심볼 (예: 'BTC')
+        price : float
+            매수가격
+        quantity : float, optional
+            매수 수량 (amount와 둘 중 하나만 지정)
+        amount : float, optional
+            매수 금액 (quantity와 둘 중 하나만 지정)
+        commission : float
+            수수료율 (기본 0.05%)
+
+        Returns
+        -------
+        bool
+            성공 여부
+        """
+        price_ticks = _to_units(price, PRICE_SCALE)
+        rate = _to_units(commission, RATE_SCALE)
+
+        if amount:
+            # 금액으로 매수 (수수료를 뺀 금액만큼 수량 계산)
+            actual_won = int(amount)
+            if actual_won > self.balance_won:
+                logger.warning("잔고 부족: %s > %s", actual_won, self.balance_won)
+                return False
+            fee_won = _ceil_div(actual_won * rate, RATE_SCALE)
+            units = (actual_won - fee_won) * VALUE_SCALE // price_ticks
+        elif quantity:
+            # 수량으로 매수 (수수료 포함 필요 금액 계산)
+            units = _to_units(quantity, QUANTITY_SCALE)
+            net_won = _ceil_div(units * price_ticks, VALUE_SCALE)
+            actual_won = _ceil_div(net_won * RATE_SCALE, RATE_SCALE - rate)
+            if actual_won > self.balance_won:
+                logger.warning("잔고 부족: %s > %s", actual_won, self.balance_won)
+                return False
+            fee_won = actual_won - net_won
+        else:
+            logger.error("quantity 또는 amount 중 하나를 지정해야 합니다")
+            return False
+
+        if units <= 0:
+            logger.warning("매수 수량이 최소 단위보다 작습니다: %s @ %s원", currency, price)
+            return False
+
+        # 잔고 차감, 보유 수량과 원가 추가 (평균 매수가는 원가 / 수량으로 가중평균)
+        self.balance_won -= actual_won
+        self.holdings_units[currency] = self.holdings_units.get(currency, 0) + units
+        self.cost_basis[currency] = self.cost_basis.get(currency, 0) + units * price_ticks
+
+        self._record('BUY', currency, price_ticks, units, actual_won, fee_won, 0)
+        logger.info("매수 완료: %s %s개 @ %s원 (금액: %s원)", currency, units / QUANTITY_SCALE, price, f"{actual_won:,}")
+        return True
+
+    def sell(self, currency: str, price: float, quantity: Optional[float] = None, ratio: Optional[float] = None, commission: float = 0.0005) -> bool:
+        """
+        매도
+
+        Parameters
+        ----------
+        currency : str
+            코인 심볼 (예: 'BTC')
+        price : float
+            매도가격
+        quantity : float, optional
+            매도 수량 (ratio와 둘 중 하나만 지정)
+        ratio : float, optional
+            매도 비율 (0.0 ~ 1.0, quantity와 둘 중 하나만 지정)
+        commission : float
+            수수료율 (기본 0.05%)
+
+        Returns
+        -------
+        bool
+            성공 여부
+        """
+        available = self.holdings_units.get(currency, 0)
+        if available <= 0:
+            logger.warning("보유 코인 없음: %s", currency)
+            return False
+
+        price_ticks = _to_units(price, PRICE_SCALE)
+        rate = _to_units(commission, RATE_SCALE)
+
+        if ratio:
+            # 비율로 매도
+            units = available * _to_units(ratio, RATE_SCALE) // RATE_SCALE
+        elif quantity:
+            # 수량으로 매도 (보유량보다 많으면 전체 매도)
+            units = min(_to_units(quantity, QUANTITY_SCALE), available)
+        else:
+            # 전체 매도
+            units = available
+
+        # 매도 금액 계산 (수수료 제외)
+        gross_won = units * price_ticks // VALUE_SCALE
+        fee_won = _ceil_div(gross_won * rate, RATE_SCALE)
+        net_won = gross_won - fee_won
+
+        self.balance_won += net_won
+
+        # 보유 수량 차감 (평균 매수가는 유지되도록 원가도 같은 비율로 차감)
+        cost = self.cost_basis[currency]
+        remaining = available - units
+        if remaining <= 0:
+            del self.holdings_units[currency]
+            del self.cost_basis[currency]
+            sold_cost = cost
+        else:
+            self.holdings_units[currency] = remaining
+            self.cost_basis[currency] = cost * remaining // available
+            sold_cost = cost - self.cost_basis[currency]
+
+        # 실현 손익 (매도 순금액 - 평균 매수가 기준 원가, 1e-8 × 0.0001원 단위)
+        pnl_ticks = net_won * VALUE_SCALE - sold_cost
+        self._record('SELL', currency, price_ticks, units, net_won, fee_won, pnl_ticks)
+        logger.info("매도 완료: %s %s개 @ %s원 (금액: %s원)", currency, units / QUANTITY_SCALE, price, f"{net_won:,}")
+        return True
+
+    def _record(self, trade_type: str, currency: str, price_ticks: int, units: int, amount_won: int, fee_won: int, pnl_ticks: int):
+        """거래 기록 추가"""
+        self._updated_ts = time.time()
+        self.trade_history.append(
+            trade_type, currency, price_ticks / PRICE_SCALE, units / QUANTITY_SCALE, float(amount_won),
+            float(fee_won), self._updated_ts, float(self.balance_won), pnl_ticks / VALUE_SCALE,
+        )
+
+    def get_trade_history(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict]:
+        """
+        거래 내역 조회 (최신순)
+
+        Parameters
+        ----------
+        limit : int, optional
+            조회 개수 (없으면 남아 있는 전체)
+        after_id : int, optional
+            이 거래 ID보다 오래된 거래부터 조회 (이전 페이지의 마지막 id)
+        """
+        return self.trade_history.page(limit=limit or None, after_id=after_id)
+
+    def get_summary(self, prices: Optional[Dict[str, float]] = None) -> Dict:
+        """계좌 요약 정보"""
+        total_value = self.get_total_value(prices or {})
+        initial_balance = float(self.initial_balance_won)
+        profit_loss = total_value - initial_balance
+        profit_loss_rate = (profit_loss / initial_balance) * 100
+
+        return {
+            'initial_balance': initial_balance,
+            'current_balance': float(self.balance_won),
+            'holdings': self.get_holdings(),
+            'total_value': total_value,
+            'profit_loss': profit_loss,
+            'profit_loss_rate': profit_loss_rate,
+            'num_trades': self.trade_history.num_trades,
+            'total_commission': self.trade_history.total_commission,
+            'realized_pnl': self.trade_history.realized_pnl,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
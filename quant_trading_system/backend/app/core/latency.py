@@ -0,0 +1,106 @@
+"""
+요청 지연 시간 히스토그램
+
+외부 API 호출 시간을 엔드포인트별로 고정 구간 히스토그램에 모아
+연결 재사용 효과 등을 /monitoring 에서 확인할 수 있게 한다.
+"""
+import bisect
+import threading
+from typing import Dict, Any, List, Optional
+
+
+# 구간 상한 (밀리초), 마지막 구간은 그 이상 전부
+DEFAULT_BOUNDS_MS = (5, 10, 25, 50, 75, 100, 150, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (고정 구간)"""
+
+    def __init__(self, bounds_ms=DEFAULT_BOUNDS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float):
+        """측정값 추가"""
+        self.counts[bisect.bisect_left(self.bounds_ms, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        분위수 추정 (해당 구간의 상한, 마지막 구간은 최대값)
+
+        Args:
+            q: 0~1 사이 분위
+
+        Returns:
+            지연 시간 (밀리초), 측정값이 없으면 None
+        """
+        if self.count == 0:
+            return None
+        target = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target and bucket_count:
+                return self.bounds_ms[index] if index < len(self.bounds_ms) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """요약 및 구간별 개수"""
+        labels = [f"le_{bound}" for bound in self.bounds_ms] + ["inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class LatencyRecorder:
+    """이름(엔드포인트)별 히스토그램 모음 (스레드 안전)"""
+
+    def __init__(self, bounds_ms=DEFAULT_BOUNDS_MS):
+        self.bounds_ms = bounds_ms
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, elapsed_seconds: float):
+        """
+        측정값 추가
+
+        Args:
+            name: 엔드포인트 이름 (예: "GET accounts")
+            elapsed_seconds: 걸린 시간 (초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = LatencyHistogram(self.bounds_ms)
+            histogram.observe(elapsed_seconds * 1000)
+
+    def names(self) -> List[str]:
+        """측정된 이름 목록"""
+        with self._lock:
+            return sorted(self._histograms)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """이름별 히스토그램 요약"""
+        with self._lock:
+            return {name: self._histograms[name].to_dict() for name in sorted(self._histograms)}
+
+    def reset(self):
+        """측정값 초기화"""
+        with self._lock:
+            self._histograms.clear()
+
+
+# 전역 Upbit API 지연 시간 기록 (동기/비동기 어댑터 공용)
+upbit_latency = LatencyRecorder()
@@ -0,0 +1,153 @@
+"""
+시장 데이터 허브
+
+여러 전략이 같은 마켓의 현재가를 각자 조회하지 않도록,
+구독 중인 모든 마켓을 한 번의 현재가 조회로 모아 받고 asyncio 큐로 나눠 준다.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.core.ticker_cache import ticker_cache
+from app.core.logging import get_logger
+
+logger = get_logger(__name__, "system")
+
+TickerFetcher = Callable[[List[str]], Awaitable[List[Dict[str, Any]]]]
+
+
+class MarketDataHub:
+    """현재가 조회 허브 (프로세스 전체에서 하나)"""
+
+    def __init__(self, fetch_tickers: Optional[TickerFetcher] = None):
+        """
+        Args:
+            fetch_tickers: 마켓 리스트를 받아 현재가 리스트를 반환하는 코루틴 함수
+                (기본: 현재가 캐시 ticker_cache.get_tickers)
+        """
+        self._fetch_tickers = fetch_tickers
+        # 마켓 -> {구독 큐: 원하는 갱신 주기(초)}
+        self._subscribers: Dict[str, Dict[asyncio.Queue, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+
+        self.snapshot: Dict[str, Dict[str, Any]] = {}
+        self.request_count = 0
+
+    @property
+    def interval(self) -> float:
+        """조회 주기 (구독자가 원하는 주기 중 가장 짧은 값)"""
+        intervals = [
+            interval
+            for queues in self._subscribers.values()
+            for interval in queues.values()
+        ]
+        return min(intervals) if intervals else 0.0
+
+    @property
+    def markets(self) -> List[str]:
+        """구독 중인 마켓 목록"""
+        return sorted(self._subscribers)
+
+    def subscribe(self, market: str, interval: float = 60.0) -> asyncio.Queue:
+        """
+        마켓 현재가 구독
+
+        큐에는 항상 가장 최근 현재가 하나만 남는다 (읽지 않은 이전 값은 버림).
+
+        Args:
+            market: 마켓 코드
+            interval: 원하는 갱신 주기 (초)
+
+        Returns:
+            현재가(ticker dict)가 들어오는 큐
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        refresh_now = market not in self._subscribers or interval < self.interval
+        self._subscribers.setdefault(market, {})[queue] = interval
+
+        if market in self.snapshot:
+            self._offer(queue, self.snapshot[market])
+
+        if self._task is None or self._task.done():
+            # 이벤트 루프가 바뀌어도 쓸 수 있도록 작업마다 새로 생성
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        elif refresh_now:
+            # 새 마켓이나 더 짧은 주기는 다음 주기를 기다리지 않고 바로 조회
+            self._wakeup.set()
+
+        return queue
+
+    def unsubscribe(self, market: str, queue: asyncio.Queue):
+        """
+        구독 해제 (구독자가 없으면 조회 중지)
+
+        Args:
+            market: 마켓 코드
+            queue: subscribe()가 반환한 큐
+        """
+        queues = self._subscribers.get(market)
+        if queues is None:
+            return
+        queues.pop(queue, None)
+        if not queues:
+            del self._subscribers[market]
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def get_snapshot(self, market: str) -> Optional[Dict[str, Any]]:
+        """마지막으로 받은 현재가 (없으면 None)"""
+        return self.snapshot.get(market)
+
+    async def stop(self):
+        """조회 작업 종료 (애플리케이션 종료 시)"""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, ticker: Dict[str, Any]):
+        """큐에 최신 값만 남기기"""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(ticker)
+
+    async def _fetch(self, markets: List[str]) -> List[Dict[str, Any]]:
+        if self._fetch_tickers is not None:
+            return await self._fetch_tickers(markets)
+        # 가상 계좌 API와 같은 현재가 캐시를 거쳐 결과를 공유
+        return await ticker_cache.get_tickers(markets)
+
+    async def _run(self):
+        """구독자가 있는 동안 주기마다 모든 마켓을 한 번에 조회하여 배포"""
+        while self._subscribers:
+            self._wakeup.clear()
+            markets = self.markets
+            try:
+                tickers = await self._fetch(markets)
+                self.request_count += 1
+                for ticker in tickers:
+                    market = ticker.get("market")
+                    if market not in self._subscribers:
+                        continue
+                    self.snapshot[market] = ticker
+                    for queue in self._subscribers[market]:
+                        self._offer(queue, ticker)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"현재가 조회 실패 ({len(markets)}개 마켓): {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+
+# 전역 시장 데이터 허브 인스턴스
+market_data_hub = MarketDataHub()
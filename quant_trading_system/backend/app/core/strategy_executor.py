@@ -11,7 +11,8 @@ from app.core.strategy_loader import strategy_loader
 from app.core.virtual_account_manager import virtual_account_manager
 from app.core.logging import get_logger
 from app.core.strategy_manager import strategy_manager
-from app.adapters.upbit.adapter import UpbitAdapter
+from app.adapters.upbit.async_adapter import get_async_upbit_adapter
+from app.core.market_data_hub import market_data_hub
 from app.core.config import settings
 
 logger = get_logger(__name__, "strategy_executor")
@@ -123,33 +124,37 @@ class StrategyExecutor:
         config : Dict[str, Any], optional
             전략 설정
         """
+        ticker_queue: Optional[asyncio.Queue] = None
+        market = (config or {}).get('market', 'KRW-SOL')
         try:
             # 전략 인스턴스 생성
             strategy_config = config or {}
             strategy_config.setdefault('market', 'KRW-SOL')  # 기본값
             strategy_instance = strategy_class(config=strategy_config)
             
-            # UpbitAdapter 생성
+            # 비동기 어댑터 (과거 데이터 로드가 이벤트 루프를 막지 않도록)
             upbit_adapter = None
             if settings.upbit_access_key and settings.upbit_secret_key:
-                upbit_adapter = UpbitAdapter(
-                    access_key=settings.upbit_access_key,
-                    secret_key=settings.upbit_secret_key
+                upbit_adapter = get_async_upbit_adapter(
+                    settings.upbit_access_key, settings.upbit_secret_key
                 )
             
             # 전략별 계좌 가져오기
             strategy_account = virtual_account_manager.get_account(strategy_id)
             
-            # 전략 초기화 (UpbitAdapter 전달하여 과거 데이터 로드 가능하도록)
+            # 전략 초기화 (어댑터 전달하여 과거 데이터 로드 가능하도록)
             if hasattr(strategy_instance, 'initialize'):
                 await strategy_instance.initialize(strategy_account, upbit_adapter)
             
             logger.info(f"전략 실행 시작: {strategy_id}, 마켓: {strategy_config.get('market', 'KRW-SOL')}")
             
             # 전략 실행 루프
-            market = strategy_config.get('market', 'KRW-SOL')
             check_interval = strategy_config.get('check_interval', 60)  # 기본 1분
             
+            # 현재가는 시장 데이터 허브에서 받음 (전략마다 따로 조회하지 않음)
+            if upbit_adapter:
+                ticker_queue = market_data_hub.subscribe(market, interval=check_interval)
+            
             while True:
                 try:
                     # 하트비트 업데이트
@@ -159,21 +164,20 @@ class StrategyExecutor:
                     current_price = 0
                     market_data = {}
                     
-                    if upbit_adapter:
+                    if ticker_queue is not None:
                         try:
-                            tickers = upbit_adapter.get_ticker([market])
-                            if tickers and len(tickers) > 0:
-                                ticker = tickers[0]
-                                current_price = ticker.get('trade_price', 0)
-                                market_data = {
-                                    'price': current_price,
-                                    'volume': ticker.get('acc_trade_volume_24h', 0),
-                                    'change_rate': ticker.get('signed_change_rate', 0),
-                                    'high_price': ticker.get('high_price', 0),
-                                    'low_price': ticker.get('low_price', 0),
-                                }
-                        except Exception as e:
-                            logger.warning(f"가격 조회 실패: {e}")
+                            # 허브가 보낸 가장 최근 현재가 (아직 없으면 다음 조회까지 대기)
+                            ticker = await asyncio.wait_for(ticker_queue.get(), timeout=check_interval)
+                            current_price = ticker.get('trade_price', 0)
+                            market_data = {
+                                'price': current_price,
+                                'volume': ticker.get('acc_trade_volume_24h', 0),
+                                'change_rate': ticker.get('signed_change_rate', 0),
+                                'high_price': ticker.get('high_price', 0),
+                                'low_price': ticker.get('low_price', 0),
+                            }
+                        except asyncio.TimeoutError:
+                            logger.warning(f"가격 조회 실패: {check_interval}초 동안 현재가 업데이트 없음")
                     
                     if current_price > 0:
                         # 전략 실행
@@ -209,6 +213,9 @@ class StrategyExecutor:
             logger.error(f"전략 실행 실패: {strategy_id}, 오류: {e}", exc_info=True)
             strategy_manager.record_error(strategy_id, e)
         finally:
+            if ticker_queue is not None:
+                market_data_hub.unsubscribe(market, ticker_queue)
+            
             # 정리 작업
             if hasattr(strategy_instance, 'cleanup'):
                 try:
@@ -0,0 +1,115 @@
+"""
+현재가 스냅샷 캐시
+
+가상 계좌 API와 전략(시장 데이터 허브)이 같은 현재가를 공유하도록,
+짧은 유효 시간 동안 마켓별 마지막 현재가를 보관하고 없는 마켓만 모아 한 번에 조회한다.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.adapters.upbit.async_adapter import get_async_upbit_adapter
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__, "system")
+
+TickerFetcher = Callable[[List[str]], Awaitable[List[Dict[str, Any]]]]
+
+# 현재가 캐시 유효 시간 (초)
+TICKER_TTL = 2.0
+
+
+class TickerCache:
+    """마켓별 현재가 스냅샷 (프로세스 전체에서 하나)"""
+
+    def __init__(self, ttl: float = TICKER_TTL, fetch_tickers: Optional[TickerFetcher] = None):
+        """
+        Args:
+            ttl: 현재가 유효 시간 (초)
+            fetch_tickers: 마켓 리스트를 받아 현재가 리스트를 반환하는 코루틴 함수
+                (기본: AsyncUpbitAdapter.get_ticker)
+        """
+        self.ttl = ttl
+        self._fetch_tickers = fetch_tickers
+        # 마켓 -> (받은 시각, 현재가)
+        self._snapshot: Dict[str, tuple] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self.request_count = 0
+
+    def _fresh(self, market: str, now: float) -> Optional[Dict[str, Any]]:
+        """유효 시간 안의 현재가 (없으면 None)"""
+        entry = self._snapshot.get(market)
+        if entry is not None and now - entry[0] <= self.ttl:
+            return entry[1]
+        return None
+
+    async def _fetch(self, markets: List[str]) -> List[Dict[str, Any]]:
+        if self._fetch_tickers is not None:
+            return await self._fetch_tickers(markets)
+        adapter = get_async_upbit_adapter(settings.upbit_access_key, settings.upbit_secret_key)
+        return await adapter.get_ticker(markets)
+
+    async def get_tickers(self, markets: List[str]) -> List[Dict[str, Any]]:
+        """
+        현재가 조회 (유효 시간 안의 값은 캐시에서, 나머지만 한 번에 조회)
+
+        동시에 들어온 요청은 잠금으로 묶여 같은 마켓을 두 번 조회하지 않는다.
+
+        Args:
+            markets: 마켓 코드 리스트
+
+        Returns:
+            현재가 정보 (받지 못한 마켓은 빠짐)
+        """
+        if not markets:
+            return []
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            now = time.monotonic()
+            found = {}
+            missing = []
+            for market in dict.fromkeys(markets):
+                ticker = self._fresh(market, now)
+                if ticker is None:
+                    missing.append(market)
+                else:
+                    found[market] = ticker
+
+            if missing:
+                tickers = await self._fetch(missing)
+                self.request_count += 1
+                received_at = time.monotonic()
+                for ticker in tickers:
+                    if ticker and ticker.get('market'):
+                        self._snapshot[ticker['market']] = (received_at, ticker)
+                        found[ticker['market']] = ticker
+
+            return [found[market] for market in dict.fromkeys(markets) if market in found]
+
+    async def get_prices(self, currencies) -> Dict[str, float]:
+        """
+        원화 마켓 현재가
+
+        Args:
+            currencies: 화폐 코드 목록 (BTC, ETH 등)
+
+        Returns:
+            화폐 코드 -> 현재가
+        """
+        markets = [f"KRW-{currency}" for currency in currencies]
+        tickers = await self.get_tickers(markets)
+        return {
+            ticker['market'].replace('KRW-', ''): ticker.get('trade_price', 0)
+            for ticker in tickers
+        }
+
+    def clear(self):
+        """캐시 비우기"""
+        self._snapshot.clear()
+
+
+# 전역 현재가 캐시 인스턴스
+ticker_cache = TickerCache()
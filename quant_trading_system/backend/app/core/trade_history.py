@@ -0,0 +1,252 @@
+"""
+가상 계좌 거래 내역 저장소
+
+최근 거래는 고정 크기 컬럼형 링 버퍼(array)에 보관하고, 밀려난 거래는
+SQLite 파일로 옮긴다 (spill_path를 지정한 경우). 거래 수, 총 수수료, 실현 손익은
+거래를 추가할 때 누적하므로 조회 시 다시 계산하지 않는다.
+
+조회는 최신순 커서 방식 (after_id보다 오래된 거래를 limit개)이며
+전체 내역을 복사하지 않는다.
+"""
+import sqlite3
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__, "virtual_account")
+
+# 메모리에 보관할 최근 거래 수 (계좌별)
+DEFAULT_CAPACITY = 10_000
+
+# 디스크로 옮길 때 한 번에 쓰는 거래 수
+SPILL_BATCH = 500
+
+TRADE_TYPES = ('BUY', 'SELL')
+
+
+class TradeHistory:
+    """거래 내역 (최신 capacity개는 메모리, 나머지는 SQLite)"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, spill_path: Optional[Path] = None):
+        """
+        Parameters
+        ----------
+        capacity : int
+            메모리에 보관할 최근 거래 수
+        spill_path : Path, optional
+            밀려난 거래를 저장할 SQLite 파일 (없으면 버리고 누적 통계만 유지)
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity는 1 이상이어야 합니다: {capacity}")
+        self.capacity = capacity
+        self.spill_path = Path(spill_path) if spill_path else None
+
+        zeros = bytes(8 * capacity)
+        self._types = array('b', bytes(capacity))
+        self._currencies: List[Optional[str]] = [None] * capacity
+        self._prices = array('d', zeros)
+        self._quantities = array('d', zeros)
+        self._amounts = array('d', zeros)
+        self._commissions = array('d', zeros)
+        self._timestamps = array('d', zeros)
+        self._balances = array('d', zeros)
+        self._pnls = array('d', zeros)
+
+        self._next_id = 1
+        self._pending: List[tuple] = []
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # 누적 통계
+        self.num_buys = 0
+        self.num_sells = 0
+        self.total_commission = 0.0
+        self.realized_pnl = 0.0
+
+    @property
+    def num_trades(self) -> int:
+        """전체 거래 수 (디스크로 옮긴 거래 포함)"""
+        return self._next_id - 1
+
+    @property
+    def last_id(self) -> int:
+        """가장 최근 거래 ID (없으면 0)"""
+        return self._next_id - 1
+
+    @property
+    def oldest_in_memory(self) -> int:
+        """메모리에 남아 있는 가장 오래된 거래 ID"""
+        return max(1, self._next_id - self.capacity)
+
+    def __len__(self) -> int:
+        return self.num_trades
+
+    def append(
+        self,
+        trade_type: str,
+        currency: str,
+        price: float,
+        quantity: float,
+        amount: float,
+        commission: float,
+        timestamp: float,
+        balance_after: float,
+        realized_pnl: float = 0.0,
+    ) -> int:
+        """
+        거래 추가
+
+        Parameters
+        ----------
+        trade_type : str
+            'BUY' 또는 'SELL'
+        timestamp : float
+            체결 시각 (epoch 초)
+        realized_pnl : float
+            이 거래로 실현된 손익 (매도만 해당)
+
+        Returns
+        -------
+        int
+            거래 ID (1부터 증가)
+        """
+        trade_id = self._next_id
+        slot = (trade_id - 1) % self.capacity
+
+        if trade_id > self.capacity and self.spill_path is not None:
+            # 덮어쓰기 전에 가장 오래된 거래를 디스크 대기열로
+            self._pending.append(self._row(trade_id - self.capacity, slot))
+            if len(self._pending) >= SPILL_BATCH:
+                self._flush()
+
+        self._types[slot] = TRADE_TYPES.index(trade_type)
+        self._currencies[slot] = currency
+        self._prices[slot] = price
+        self._quantities[slot] = quantity
+        self._amounts[slot] = amount
+        self._commissions[slot] = commission
+        self._timestamps[slot] = timestamp
+        self._balances[slot] = balance_after
+        self._pnls[slot] = realized_pnl
+        self._next_id = trade_id + 1
+
+        if trade_type == 'BUY':
+            self.num_buys += 1
+        else:
+            self.num_sells += 1
+        self.total_commission += commission
+        self.realized_pnl += realized_pnl
+        return trade_id
+
+    def page(self, limit: Optional[int] = 50, after_id: Optional[int] = None) -> List[Dict]:
+        """
+        최신순 거래 조회
+
+        Parameters
+        ----------
+        limit : int, optional
+            조회 개수 (None이면 남아 있는 전체)
+        after_id : int, optional
+            커서 - 이 ID보다 오래된 거래부터 조회 (이전 페이지의 마지막 id)
+
+        Returns
+        -------
+        List[Dict]
+            거래 내역 (최신순)
+        """
+        start = self.last_id if after_id is None else min(after_id - 1, self.last_id)
+        if limit is None:
+            limit = self.num_trades
+        if start < 1 or limit <= 0:
+            return []
+
+        stop = max(start - limit, self.oldest_in_memory - 1)
+        trades = [self._trade_dict(self._row(trade_id, (trade_id - 1) % self.capacity))
+                  for trade_id in range(start, stop, -1)]
+
+        remaining = limit - len(trades)
+        if remaining > 0 and stop >= 1 and self.spill_path is not None:
+            trades.extend(self._read_spilled(stop, remaining))
+        return trades
+
+    def stats(self) -> Dict:
+        """누적 통계"""
+        return {
+            'num_trades': self.num_trades,
+            'num_buys': self.num_buys,
+            'num_sells': self.num_sells,
+            'total_commission': self.total_commission,
+            'realized_pnl': self.realized_pnl,
+        }
+
+    def close(self):
+        """대기 중인 거래를 디스크에 쓰고 파일 닫기"""
+        if self._pending:
+            self._flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _row(self, trade_id: int, slot: int) -> tuple:
+        return (
+            trade_id,
+            TRADE_TYPES[self._types[slot]],
+            self._currencies[slot],
+            self._prices[slot],
+            self._quantities[slot],
+            self._amounts[slot],
+            self._commissions[slot],
+            self._timestamps[slot],
+            self._balances[slot],
+            self._pnls[slot],
+        )
+
+    @staticmethod
+    def _trade_dict(row: tuple) -> Dict:
+        trade_id, trade_type, currency, price, quantity, amount, commission, timestamp, balance, pnl = row
+        return {
+            'id': trade_id,
+            'type': trade_type,
+            'currency': currency,
+            'price': price,
+            'quantity': quantity,
+            'amount': amount,
+            'commission': commission,
+            'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+            'balance_after': balance,
+            'realized_pnl': pnl,
+        }
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.spill_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS trades ("
+                "id INTEGER PRIMARY KEY, type TEXT, currency TEXT, price REAL, quantity REAL, "
+                "amount REAL, commission REAL, timestamp REAL, balance_after REAL, realized_pnl REAL)"
+            )
+            # 계좌는 아직 재시작 후 복원되지 않으므로 이전 실행의 내역은 비움
+            self._conn.execute("DELETE FROM trades")
+            self._conn.commit()
+        return self._conn
+
+    def _flush(self):
+        """디스크 대기열 쓰기"""
+        conn = self._connect()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", self._pending)
+        self._pending.clear()
+
+    def _read_spilled(self, start: int, limit: int) -> List[Dict]:
+        """디스크로 옮긴 거래 조회 (start 이하 ID, 최신순)"""
+        if self._pending:
+            self._flush()
+        if self._conn is None:
+            return []
+        rows = self._conn.execute(
+            "SELECT * FROM trades WHERE id <= ? ORDER BY id DESC LIMIT ?", (start, limit)
+        ).fetchall()
+        return [self._trade_dict(row) for row in rows]
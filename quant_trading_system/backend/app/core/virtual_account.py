@@ -4,10 +4,13 @@
 가상 자금으로 전략을 테스트하기 위한 계좌 관리
 """
 
+import time
+from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 from decimal import Decimal, ROUND_DOWN
 from app.core.logging import get_logger
+from app.core.trade_history import DEFAULT_CAPACITY, TradeHistory
 
 logger = get_logger(__name__, "virtual_account")
 
@@ -15,18 +18,27 @@ logger = get_logger(__name__, "virtual_account")
 class VirtualAccount:
     """가상 계좌"""
     
-    def __init__(self, initial_balance: float = 10_000_000):
+    def __init__(
+        self,
+        initial_balance: float = 10_000_000,
+        history_capacity: int = DEFAULT_CAPACITY,
+        history_path: Optional[Path] = None,
+    ):
         """
         Parameters
         ----------
         initial_balance : float
             초기 잔고 (기본 1000만원)
+        history_capacity : int
+            메모리에 보관할 최근 거래 수
+        history_path : Path, optional
+            오래된 거래 내역을 옮길 SQLite 파일
         """
         self.initial_balance = Decimal(str(initial_balance))
         self.balance = Decimal(str(initial_balance))  # KRW 잔고
         self.holdings: Dict[str, Decimal] = {}  # {currency: quantity}
         self.avg_buy_prices: Dict[str, Decimal] = {}  # {currency: avg_buy_price} - 평균 매수가 추적
-        self.trade_history: List[Dict] = []
+        self.trade_history = TradeHistory(history_capacity, history_path)
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
     
@@ -122,17 +134,10 @@ class VirtualAccount:
             self.avg_buy_prices[currency] = price_decimal
         
         # 거래 기록
-        trade = {
-            'type': 'BUY',
-            'currency': currency,
-            'price': float(price_decimal),
-            'quantity': float(quantity_decimal),
-            'amount': float(actual_amount),
-            'commission': float(actual_amount * commission_decimal),
-            'timestamp': datetime.now().isoformat(),
-            'balance_after': float(self.balance),
-        }
-        self.trade_history.append(trade)
+        self.trade_history.append(
+            'BUY', currency, float(price_decimal), float(quantity_decimal), float(actual_amount),
+            float(actual_amount * commission_decimal), time.time(), float(self.balance),
+        )
         self.updated_at = datetime.now()
         
         logger.info(f"매수 완료: {currency} {float(quantity_decimal)}개 @ {price}원 (금액: {float(actual_amount):,.0f}원)")
@@ -185,6 +190,9 @@ class VirtualAccount:
         gross_amount = quantity_decimal * price_decimal
         net_amount = gross_amount * (Decimal('1') - commission_decimal)
         
+        # 실현 손익 (매도 순금액 - 평균 매수가 기준 원가)
+        realized_pnl = net_amount - quantity_decimal * self.avg_buy_prices.get(currency, price_decimal)
+        
         # 잔고 추가
         self.balance += net_amount
         
@@ -197,28 +205,27 @@ class VirtualAccount:
                 del self.avg_buy_prices[currency]
         
         # 거래 기록
-        trade = {
-            'type': 'SELL',
-            'currency': currency,
-            'price': float(price_decimal),
-            'quantity': float(quantity_decimal),
-            'amount': float(net_amount),
-            'commission': float(gross_amount * commission_decimal),
-            'timestamp': datetime.now().isoformat(),
-            'balance_after': float(self.balance),
-        }
-        self.trade_history.append(trade)
+        self.trade_history.append(
+            'SELL', currency, float(price_decimal), float(quantity_decimal), float(net_amount),
+            float(gross_amount * commission_decimal), time.time(), float(self.balance), float(realized_pnl),
+        )
         self.updated_at = datetime.now()
         
         logger.info(f"매도 완료: {currency} {float(quantity_decimal)}개 @ {price}원 (금액: {float(net_amount):,.0f}원)")
         return True
     
-    def get_trade_history(self, limit: Optional[int] = None) -> List[Dict]:
-        """거래 내역 조회"""
-        history = self.trade_history.copy()
-        if limit:
-            history = history[-limit:]
-        return list(reversed(history))
+    def get_trade_history(self, limit: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict]:
+        """
+        거래 내역 조회 (최신순)
+        
+        Parameters
+        ----------
+        limit : int, optional
+            조회 개수 (없으면 남아 있는 전체)
+        after_id : int, optional
+            이 거래 ID보다 오래된 거래부터 조회 (이전 페이지의 마지막 id)
+        """
+        return self.trade_history.page(limit=limit or None, after_id=after_id)
     
     def get_summary(self, prices: Optional[Dict[str, float]] = None) -> Dict:
         """계좌 요약 정보"""
@@ -233,7 +240,9 @@ class VirtualAccount:
             'total_value': total_value,
             'profit_loss': profit_loss,
             'profit_loss_rate': profit_loss_rate,
-            'num_trades': len(self.trade_history),
+            'num_trades': self.trade_history.num_trades,
+            'total_commission': self.trade_history.total_commission,
+            'realized_pnl': self.trade_history.realized_pnl,
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
         }
@@ -3,8 +3,10 @@
 
 전략별로 독립적인 가상 계좌를 생성하고 관리
 """
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Dict, Optional, Type, Union
 from app.core.virtual_account import VirtualAccount
+from app.core.fixed_point_account import FixedPointVirtualAccount
 from app.core.logging import get_logger
 
 logger = get_logger(__name__, "virtual_account_manager")
@@ -13,14 +15,25 @@ logger = get_logger(__name__, "virtual_account_manager")
 class VirtualAccountManager:
     """가상 계좌 관리자"""
     
-    def __init__(self, initial_balance_per_strategy: float = 5_000_000):
+    def __init__(
+        self,
+        initial_balance_per_strategy: float = 5_000_000,
+        account_class: Type[Union[VirtualAccount, FixedPointVirtualAccount]] = FixedPointVirtualAccount,
+        history_dir: Optional[Path] = None,
+    ):
         """
         Parameters
         ----------
         initial_balance_per_strategy : float
             전략당 초기 자금 (기본 500만원)
+        account_class : type
+            계좌 구현 (기본: 정수 고정소수점 FixedPointVirtualAccount, Decimal 구현은 VirtualAccount)
+        history_dir : Path, optional
+            전략별 오래된 거래 내역을 옮길 디렉토리 (없으면 최근 내역만 메모리에 보관)
         """
         self.initial_balance_per_strategy = initial_balance_per_strategy
+        self.account_class = account_class
+        self.history_dir = history_dir
         self.accounts: Dict[str, VirtualAccount] = {}
         self._default_account: Optional[VirtualAccount] = None
     
@@ -40,7 +53,11 @@ class VirtualAccountManager:
         """
         if strategy_id not in self.accounts:
             logger.info(f"전략별 계좌 생성: {strategy_id} (초기 자금: {self.initial_balance_per_strategy:,.0f}원)")
-            self.accounts[strategy_id] = VirtualAccount(initial_balance=self.initial_balance_per_strategy)
+            history_path = self.history_dir / f"{strategy_id}.db" if self.history_dir else None
+            self.accounts[strategy_id] = self.account_class(
+                initial_balance=self.initial_balance_per_strategy,
+                history_path=history_path,
+            )
         
         return self.accounts[strategy_id]
     
@@ -54,7 +71,7 @@ class VirtualAccountManager:
             전략 ID
         """
         if strategy_id in self.accounts:
-            del self.accounts[strategy_id]
+            self.accounts.pop(strategy_id).trade_history.close()
             logger.info(f"전략별 계좌 제거: {strategy_id}")
     
     def get_default_account(self) -> VirtualAccount:
@@ -67,7 +84,7 @@ class VirtualAccountManager:
             기본 가상 계좌
         """
         if self._default_account is None:
-            self._default_account = VirtualAccount(initial_balance=10_000_000)
+            self._default_account = self.account_class(initial_balance=10_000_000)
         return self._default_account
     
     def get_all_accounts(self) -> Dict[str, VirtualAccount]:
@@ -83,8 +100,11 @@ class VirtualAccountManager:
 
 
 # 전역 가상 계좌 관리자 인스턴스
-# 전략당 500만원씩 할당
-virtual_account_manager = VirtualAccountManager(initial_balance_per_strategy=5_000_000)
+# 전략당 500만원씩 할당, 오래된 거래 내역은 state/trades/{전략 ID}.db로 이동
+virtual_account_manager = VirtualAccountManager(
+    initial_balance_per_strategy=5_000_000,
+    history_dir=Path("state") / "trades",
+)
 
 
 
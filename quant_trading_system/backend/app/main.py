@@ -9,6 +9,8 @@ from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.logging import setup_logging
 from app.core.strategy_manager import strategy_manager
+from app.core.market_data_hub import market_data_hub
+from app.adapters.upbit.async_adapter import close_async_upbit_adapters
 from app.core.exception_handler import (
     global_exception_handler,
     http_exception_handler,
@@ -47,6 +49,8 @@ async def lifespan(app: FastAPI):
         await monitor_task
     except asyncio.CancelledError:
         pass
+    await market_data_hub.stop()
+    await close_async_upbit_adapters()
 
 
 app = FastAPI(
@@ -0,0 +1,82 @@
+"""
+가상 계좌 구현 벤치마크
+
+Decimal 구현(VirtualAccount)과 정수 고정소수점 구현(FixedPointVirtualAccount)에
+같은 모의 체결을 흘려 처리 시간과 최종 잔고를 비교한다.
+
+사용법:
+    python scripts/benchmark_virtual_account.py [체결 수]
+"""
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+
+# backend를 Python path에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.core.virtual_account import VirtualAccount
+from app.core.fixed_point_account import FixedPointVirtualAccount
+
+CURRENCIES = ["BTC", "ETH", "SOL", "XRP"]
+
+
+def make_fills(n: int, seed: int = 42):
+    """모의 체결 (매수는 금액, 매도는 비율/수량/전량 섞어서)"""
+    rng = random.Random(seed)
+    prices = {"BTC": 90_000_000.0, "ETH": 4_000_000.0, "SOL": 200_000.0, "XRP": 800.0}
+    fills = []
+    for _ in range(n):
+        currency = rng.choice(CURRENCIES)
+        prices[currency] = round(prices[currency] * (1 + rng.gauss(0, 0.002)), 1)
+        if rng.random() < 0.5:
+            fills.append(("buy", currency, prices[currency], {"amount": rng.uniform(5_000, 50_000)}))
+        else:
+            kind = rng.random()
+            if kind < 0.4:
+                kwargs = {"ratio": rng.choice([0.25, 0.5, 1.0])}
+            elif kind < 0.7:
+                kwargs = {"quantity": rng.uniform(0.0001, 0.01)}
+            else:
+                kwargs = {}
+            fills.append(("sell", currency, prices[currency], kwargs))
+    return fills, prices
+
+
+def run(account_class, fills, prices):
+    account = account_class(initial_balance=1_000_000_000)
+    started = time.perf_counter()
+    for side, currency, price, kwargs in fills:
+        if side == "buy":
+            account.buy(currency, price, **kwargs)
+        else:
+            account.sell(currency, price, **kwargs)
+    elapsed = time.perf_counter() - started
+    return elapsed, account.get_total_value(prices)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # 체결마다 남기는 로그(매수/매도 완료, 보유 코인 없음)는 두 구현이 같으므로 제외하고 연산만 비교
+    logging.disable(logging.WARNING)
+
+    fills, prices = make_fills(n)
+    print(f"모의 체결 {n:,}건")
+
+    results = {}
+    for account_class in (VirtualAccount, FixedPointVirtualAccount):
+        elapsed, total_value = run(account_class, fills, prices)
+        results[account_class.__name__] = elapsed
+        print(
+            f"  {account_class.__name__:<26} {elapsed:8.2f}초 "
+            f"({n / elapsed:,.0f}건/초), 총 자산 {total_value:,.0f}원"
+        )
+
+    speedup = results["VirtualAccount"] / results["FixedPointVirtualAccount"]
+    print(f"고정소수점 구현 {speedup:.1f}배 빠름")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,12 @@
 
 모든 전략에서 공통으로 사용하는 기능들
 - indicators: 기술적 지표 계산
+- streaming_indicators: 봉 단위 증분 지표 (실시간용)
 - backtest_engine: 백테스팅 엔진
+- parameter_sweep: 파라미터 그리드 스윕
 - data_fetcher: 데이터 수집
+- candle_cache: 캔들 로컬 캐시 (SQLite)
+- rate_limiter: API 요청 제한 (토큰 버킷)
 - logger: 로깅 유틸리티
 """
 
@@ -134,7 +134,12 @@ class Portfolio:
 class BacktestEngine:
     """백테스팅 엔진"""
     
-    def __init__(self, initial_cash: float = 1_000_000, commission: float = 0.0005):
+    def __init__(
+        self,
+        initial_cash: float = 1_000_000,
+        commission: float = 0.0005,
+        vectorized: bool = True,
+    ):
         """
         Parameters
         ----------
@@ -142,14 +147,93 @@ class BacktestEngine:
             초기 자본금
         commission : float
             수수료율
+        vectorized : bool
+            NumPy 배열 기반 실행 사용 여부 (False면 행 단위 참조 구현 사용)
         """
         self.initial_cash = initial_cash
         self.commission = commission
+        self.vectorized = vectorized
     
     def run(self, df: pd.DataFrame, signals: pd.DataFrame) -> Dict:
         """
         백테스팅 실행
         
+        Parameters
+        ----------
+        df : pd.DataFrame
+            가격 데이터
+        signals : pd.DataFrame
+            매매 신호 (signal, position 컬럼 필요)
+        
+        Returns
+        -------
+        dict
+            백테스팅 결과
+        """
+        if self.vectorized:
+            return self.run_vectorized(df, signals)
+        return self.run_reference(df, signals)
+    
+    def run_vectorized(self, df: pd.DataFrame, signals: pd.DataFrame) -> Dict:
+        """
+        백테스팅 실행 (NumPy 배열 기반)
+        
+        종가와 포지션 컬럼을 한 번만 배열로 꺼낸 뒤, 거래가 발생하는 행만
+        순회하며 현금/보유량 상태를 구간 단위로 채운다.
+        결과는 run_reference()와 동일하다.
+        
+        Parameters
+        ----------
+        df : pd.DataFrame
+            가격 데이터
+        signals : pd.DataFrame
+            매매 신호 (position 컬럼 필요)
+        
+        Returns
+        -------
+        dict
+            백테스팅 결과
+        """
+        prices = df['종가'].to_numpy(dtype=np.float64)
+        # run_reference()와 같은 방식으로 인덱스 정렬
+        positions = df[[]].assign(position=signals['position'])['position'].to_numpy(dtype=np.float64)
+        dates = df.index
+        
+        portfolio = Portfolio(
+            initial_cash=self.initial_cash,
+            commission=self.commission
+        )
+        
+        n = len(prices)
+        cash_arr = np.empty(n, dtype=np.float64)
+        holdings_arr = np.empty(n, dtype=np.float64)
+        
+        # 거래 신호가 있는 행에서만 상태가 바뀜
+        start = 0
+        for i in np.flatnonzero((positions == 1) | (positions == -1)):
+            cash_arr[start:i] = portfolio.cash
+            holdings_arr[start:i] = portfolio.holdings
+            
+            if positions[i] == 1:
+                portfolio.buy(dates[i], prices[i])
+            else:
+                portfolio.sell(dates[i], prices[i])
+            start = i
+        
+        cash_arr[start:] = portfolio.cash
+        holdings_arr[start:] = portfolio.holdings
+        
+        portfolio.portfolio_values = (cash_arr + holdings_arr * prices).tolist()
+        portfolio.dates = dates.tolist()
+        
+        portfolio.finalize(prices[-1])
+        
+        return self._calculate_metrics(df, portfolio)
+    
+    def run_reference(self, df: pd.DataFrame, signals: pd.DataFrame) -> Dict:
+        """
+        백테스팅 실행 (행 단위 루프, 참조 구현)
+        
         Parameters
         ----------
         df : pd.DataFrame
@@ -0,0 +1,427 @@
+"""
+파라미터 스윕 모듈
+
+하나의 가격 시계열에 대해 전략 파라미터 조합을 대량으로 백테스팅하고
+성과 순으로 정렬된 결과 테이블을 만든다.
+
+- 이동평균/EMA/모멘텀 등 지표는 기간별로 한 번만 계산하여 모든 조합이 공유
+- 매매 신호는 NumPy 배열 연산으로 생성
+- 체결/수수료/지표 계산 방식은 BacktestEngine과 동일
+"""
+
+import itertools
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .indicators import calculate_sma, calculate_ema
+
+
+# 결과 테이블 컬럼 (파라미터 컬럼 뒤에 붙음)
+METRIC_COLUMNS = [
+    'total_return',
+    'buy_hold_return',
+    'mdd',
+    'sharpe_ratio',
+    'num_trades',
+    'win_rate',
+    'final_value',
+]
+
+
+class ParameterSweep:
+    """
+    파라미터 그리드 백테스터
+
+    Examples
+    --------
+    >>> sweep = ParameterSweep(df)
+    >>> table = sweep.sma_cross(range(2, 61), range(10, 251, 5))
+    >>> table.head(10)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        initial_cash: float = 1_000_000,
+        commission: float = 0.0005,
+        column: str = '종가',
+    ):
+        """
+        Parameters
+        ----------
+        df : pd.DataFrame
+            가격 데이터 (시간순 정렬)
+        initial_cash : float
+            초기 자본금
+        commission : float
+            수수료율
+        column : str
+            가격 컬럼명
+        """
+        if len(df) == 0:
+            raise ValueError("가격 데이터가 비어 있습니다")
+
+        self.df = df
+        self.column = column
+        self.initial_cash = initial_cash
+        self.commission = commission
+        self.prices = df[column].to_numpy(dtype=np.float64)
+        self.buy_hold_return = ((self.prices[-1] / self.prices[0]) - 1) * 100
+
+        # 기간별 지표 캐시
+        self._sma_cache: Dict[int, np.ndarray] = {}
+        self._ema_cache: Dict[int, np.ndarray] = {}
+        self._momentum_cache: Dict[int, np.ndarray] = {}
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 지표 캐시
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def sma(self, window: int) -> np.ndarray:
+        """SMA 배열 (기간별 1회 계산)"""
+        if window not in self._sma_cache:
+            self._sma_cache[window] = calculate_sma(
+                self.df, column=self.column, window=window
+            ).to_numpy(dtype=np.float64)
+        return self._sma_cache[window]
+
+    def ema(self, span: int) -> np.ndarray:
+        """EMA 배열 (기간별 1회 계산)"""
+        if span not in self._ema_cache:
+            self._ema_cache[span] = calculate_ema(
+                self.df, column=self.column, span=span
+            ).to_numpy(dtype=np.float64)
+        return self._ema_cache[span]
+
+    def momentum_values(self, period: int) -> np.ndarray:
+        """N기간 수익률 배열 (기간별 1회 계산)"""
+        if period not in self._momentum_cache:
+            self._momentum_cache[period] = (
+                self.df[self.column].pct_change(periods=period).to_numpy(dtype=np.float64)
+            )
+        return self._momentum_cache[period]
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 전략별 스윕
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def sma_cross(
+        self,
+        fast_periods: Iterable[int],
+        slow_periods: Iterable[int],
+        sort_by: str = 'total_return',
+    ) -> pd.DataFrame:
+        """
+        SMA 골든/데드 크로스 스윕
+
+        fast < slow 인 조합만 평가한다.
+
+        Parameters
+        ----------
+        fast_periods : Iterable[int]
+            단기 이동평균 기간 목록
+        slow_periods : Iterable[int]
+            장기 이동평균 기간 목록
+        sort_by : str
+            정렬 기준 컬럼
+
+        Returns
+        -------
+        pd.DataFrame
+            순위별 결과 (fast, slow, 성과 지표)
+        """
+        rows = []
+        for fast, slow in itertools.product(list(fast_periods), list(slow_periods)):
+            if fast >= slow:
+                continue
+            positions = cross_positions(self.sma(fast), self.sma(slow))
+            rows.append({'fast': fast, 'slow': slow, **self.evaluate(positions)})
+
+        return rank_results(rows, ['fast', 'slow'], sort_by)
+
+    def macd(
+        self,
+        fast_periods: Iterable[int],
+        slow_periods: Iterable[int],
+        signal_periods: Iterable[int],
+        trend_periods: Optional[Iterable[int]] = None,
+        sort_by: str = 'total_return',
+    ) -> pd.DataFrame:
+        """
+        MACD 크로스 스윕
+
+        MACD선이 시그널선을 상향 돌파하면 매수, 하향 돌파하면 매도한다.
+        trend_periods를 주면 추세 필터(종가 > 추세 MA일 때만 매수,
+        종가 < 추세 MA이면 매도)를 함께 스윕한다.
+
+        Parameters
+        ----------
+        fast_periods : Iterable[int]
+            MACD 단기 EMA 기간 목록
+        slow_periods : Iterable[int]
+            MACD 장기 EMA 기간 목록
+        signal_periods : Iterable[int]
+            시그널선 기간 목록
+        trend_periods : Iterable[int], optional
+            추세 필터 SMA 기간 목록 (None이면 필터 미사용)
+        sort_by : str
+            정렬 기준 컬럼
+
+        Returns
+        -------
+        pd.DataFrame
+            순위별 결과 (fast, slow, signal, [trend], 성과 지표)
+        """
+        signal_periods = list(signal_periods)
+        trend_list: List[Optional[int]] = list(trend_periods) if trend_periods is not None else [None]
+
+        rows = []
+        for fast, slow in itertools.product(list(fast_periods), list(slow_periods)):
+            if fast >= slow:
+                continue
+            macd_line = self.ema(fast) - self.ema(slow)
+
+            for signal in signal_periods:
+                signal_line = pd.Series(macd_line).ewm(span=signal, adjust=False).mean().to_numpy()
+                cross_up, cross_down = _crossovers(macd_line, signal_line, inclusive=True)
+
+                for trend in trend_list:
+                    buy, sell = cross_up, cross_down
+                    if trend is not None:
+                        trend_ma = self.sma(trend)
+                        buy = buy & (self.prices > trend_ma)
+                        sell = sell | (self.prices < trend_ma)
+
+                    params = {'fast': fast, 'slow': slow, 'signal': signal}
+                    if trend is not None:
+                        params['trend'] = trend
+                    rows.append({**params, **self.evaluate(_to_positions(buy, sell))})
+
+        param_columns = ['fast', 'slow', 'signal'] + (['trend'] if trend_periods is not None else [])
+        return rank_results(rows, param_columns, sort_by)
+
+    def momentum(
+        self,
+        lookback_periods: Iterable[int],
+        buy_thresholds: Iterable[float],
+        sell_thresholds: Iterable[float],
+        sort_by: str = 'total_return',
+    ) -> pd.DataFrame:
+        """
+        모멘텀 전략 스윕
+
+        N기간 수익률이 buy_threshold 이상이면 매수,
+        sell_threshold 이하이면 매도한다.
+
+        Parameters
+        ----------
+        lookback_periods : Iterable[int]
+            모멘텀 계산 기간 목록
+        buy_thresholds : Iterable[float]
+            매수 기준 목록 (예: 0.05 = 5%)
+        sell_thresholds : Iterable[float]
+            매도 기준 목록 (예: -0.03 = -3%)
+        sort_by : str
+            정렬 기준 컬럼
+
+        Returns
+        -------
+        pd.DataFrame
+            순위별 결과 (lookback, buy_threshold, sell_threshold, 성과 지표)
+        """
+        buy_thresholds = list(buy_thresholds)
+        sell_thresholds = list(sell_thresholds)
+
+        rows = []
+        for lookback in lookback_periods:
+            momentum = self.momentum_values(lookback)
+            for buy_th, sell_th in itertools.product(buy_thresholds, sell_thresholds):
+                if sell_th >= buy_th:
+                    continue
+                positions = _to_positions(momentum >= buy_th, momentum <= sell_th)
+                rows.append({
+                    'lookback': lookback,
+                    'buy_threshold': buy_th,
+                    'sell_threshold': sell_th,
+                    **self.evaluate(positions),
+                })
+
+        return rank_results(rows, ['lookback', 'buy_threshold', 'sell_threshold'], sort_by)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 백테스팅
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def evaluate(self, positions: np.ndarray) -> Dict:
+        """
+        포지션 배열 하나를 백테스팅하여 성과 지표 반환
+
+        BacktestEngine과 같은 규칙(전액 매수/전량 매도, 마지막 종가로 정산)을
+        따르지만 거래 기록/포트폴리오 DataFrame은 만들지 않는다.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            1 (매수), -1 (매도), 그 외 (유지)
+
+        Returns
+        -------
+        dict
+            성과 지표 (METRIC_COLUMNS)
+        """
+        prices = self.prices
+        n = len(prices)
+        fee = 1 - self.commission
+
+        cash = float(self.initial_cash)
+        holdings = 0.0
+        cash_arr = np.empty(n, dtype=np.float64)
+        holdings_arr = np.empty(n, dtype=np.float64)
+
+        # 보유 중 매수/미보유 중 매도는 무시되므로 방향이 바뀌는 신호만 남김
+        events = np.flatnonzero((positions == 1) | (positions == -1))
+        sides = positions[events]
+        changed = np.empty(len(sides), dtype=bool)
+        changed[:1] = sides[:1] == 1
+        changed[1:] = sides[1:] != sides[:-1]
+        events = events[changed]
+
+        # 거래 기록: (매수 여부, 체결 직후 포트폴리오 가치)
+        trades = []
+        start = 0
+        for i in events:
+            cash_arr[start:i] = cash
+            holdings_arr[start:i] = holdings
+
+            if positions[i] == 1:
+                if cash > 0:
+                    holdings += cash * fee / prices[i]
+                    cash = 0.0
+                    trades.append((True, holdings * prices[i]))
+            elif holdings > 0:
+                cash = holdings * prices[i] * fee
+                holdings = 0.0
+                trades.append((False, cash))
+            start = i
+
+        cash_arr[start:] = cash
+        holdings_arr[start:] = holdings
+        values = cash_arr + holdings_arr * prices
+
+        # 최종 정산
+        if holdings > 0:
+            cash = holdings * prices[-1] * fee
+        final_value = cash
+
+        # MDD
+        cummax = np.maximum.accumulate(values)
+        mdd = ((values - cummax) / cummax).min() * 100
+
+        # 샤프 비율
+        sharpe_ratio = 0
+        if n > 2:
+            excess_returns = values[1:] / values[:-1] - 1 - 0.02 / 365
+            std = excess_returns.std(ddof=1)
+            if std != 0:
+                sharpe_ratio = (excess_returns.mean() / std) * np.sqrt(365)
+
+        # 승률 (매수-매도 쌍 기준)
+        profits = [
+            trades[i + 1][1] - trades[i][1]
+            for i in range(0, len(trades) - 1, 2)
+            if trades[i][0] and not trades[i + 1][0]
+        ]
+        win_count = len([p for p in profits if p > 0])
+        win_rate = (win_count / len(profits) * 100) if len(profits) > 0 else 0
+
+        return {
+            'total_return': ((final_value / self.initial_cash) - 1) * 100,
+            'buy_hold_return': self.buy_hold_return,
+            'mdd': mdd,
+            'sharpe_ratio': sharpe_ratio,
+            'num_trades': len(trades),
+            'win_rate': win_rate,
+            'final_value': final_value,
+        }
+
+
+def cross_positions(fast: np.ndarray, slow: np.ndarray) -> np.ndarray:
+    """
+    두 지표 배열의 골든/데드 크로스를 포지션 배열로 변환
+
+    Parameters
+    ----------
+    fast : np.ndarray
+        단기 지표
+    slow : np.ndarray
+        장기 지표
+
+    Returns
+    -------
+    np.ndarray
+        골든 크로스 1, 데드 크로스 -1, 나머지 0
+    """
+    golden, dead = _crossovers(fast, slow, inclusive=False)
+    return _to_positions(golden, dead)
+
+
+def rank_results(
+    rows: List[Dict],
+    param_columns: Sequence[str],
+    sort_by: str = 'total_return',
+    ascending: bool = False,
+) -> pd.DataFrame:
+    """
+    스윕 결과를 순위 테이블로 정리
+
+    Parameters
+    ----------
+    rows : list of dict
+        조합별 파라미터 + 성과 지표
+    param_columns : Sequence[str]
+        파라미터 컬럼명
+    sort_by : str
+        정렬 기준 컬럼
+    ascending : bool
+        오름차순 여부 (mdd처럼 작을수록 나쁜 지표는 기본값 유지)
+
+    Returns
+    -------
+    pd.DataFrame
+        1위부터 번호가 매겨진 결과 (인덱스: rank)
+    """
+    table = pd.DataFrame(rows, columns=list(param_columns) + METRIC_COLUMNS)
+    table = table.sort_values(sort_by, ascending=ascending, kind='mergesort').reset_index(drop=True)
+    table.index = pd.RangeIndex(1, len(table) + 1, name='rank')
+    return table
+
+
+def _crossovers(a: np.ndarray, b: np.ndarray, inclusive: bool):
+    """
+    상향/하향 돌파 지점 계산
+
+    inclusive=False: 이전 봉에서 a < b (또는 a > b) 였던 경우만 돌파로 인정
+    inclusive=True:  이전 봉에서 a <= b (또는 a >= b) 도 돌파로 인정
+    """
+    up = np.zeros(len(a), dtype=bool)
+    down = np.zeros(len(a), dtype=bool)
+
+    prev_a, prev_b = a[:-1], b[:-1]
+    cur_a, cur_b = a[1:], b[1:]
+    if inclusive:
+        up[1:] = (prev_a <= prev_b) & (cur_a > cur_b)
+        down[1:] = (prev_a >= prev_b) & (cur_a < cur_b)
+    else:
+        up[1:] = (prev_a < prev_b) & (cur_a > cur_b)
+        down[1:] = (prev_a > prev_b) & (cur_a < cur_b)
+    return up, down
+
+
+def _to_positions(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """매수/매도 조건을 포지션 배열로 변환 (매도 우선)"""
+    positions = np.zeros(len(buy), dtype=np.int8)
+    positions[buy] = 1
+    positions[sell] = -1
+    return positions
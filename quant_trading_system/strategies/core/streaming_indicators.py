@@ -0,0 +1,367 @@
+"""
+스트리밍 지표 모듈
+
+새 봉이 하나 들어올 때마다 O(1)로 갱신되는 상태 보존형 지표들.
+실시간 전략에서 매 틱마다 DataFrame을 다시 만들어 전체 구간을 재계산하지 않도록 한다.
+
+각 지표는 indicators.py의 배치 함수(pandas)와 같은 값을 낸다.
+- RollingSMA   : calculate_sma (rolling().mean())
+- StreamingEMA : calculate_ema (ewm(adjust=False))
+- RollingRSI   : calculate_rsi (단순 이동평균 RSI)
+- WilderRSI    : Wilder 평활 RSI (첫 평균은 SMA, 이후 1/period 지수 평활)
+- StreamingMACD: MACD / 시그널 / 히스토그램
+- VolumeMA     : 거래량 이동평균 (RollingSMA와 동일)
+
+값이 아직 준비되지 않은 구간은 NaN을 반환한다 (pandas 배치 함수와 동일).
+"""
+
+import math
+from collections import namedtuple
+from typing import Iterable, Optional
+
+
+MACDValue = namedtuple('MACDValue', ['macd', 'signal', 'histogram'])
+
+
+class RollingSMA:
+    """
+    단순 이동평균 (링 버퍼 + 누적합)
+
+    누적합의 부동소수점 오차가 쌓이지 않도록 버퍼를 한 바퀴 돌 때마다
+    합계를 다시 계산한다 (분할 상환 O(1)).
+    """
+
+    def __init__(self, window: int):
+        """
+        Parameters
+        ----------
+        window : int
+            이동평균 기간
+        """
+        if window < 1:
+            raise ValueError(f"window는 1 이상이어야 합니다: {window}")
+        self.window = window
+        self._buffer = [0.0] * window
+        self._index = 0
+        self._count = 0
+        self._sum = 0.0
+
+    @property
+    def ready(self) -> bool:
+        """기간만큼 데이터가 쌓였는지 여부"""
+        return self._count >= self.window
+
+    @property
+    def value(self) -> float:
+        """현재 이동평균 (준비 전에는 NaN)"""
+        if not self.ready:
+            return math.nan
+        return self._sum / self.window
+
+    def update(self, value: float) -> float:
+        """
+        새 값 추가
+
+        Parameters
+        ----------
+        value : float
+            새 봉의 값
+
+        Returns
+        -------
+        float
+            갱신된 이동평균 (준비 전에는 NaN)
+        """
+        value = float(value)
+        self._sum += value - self._buffer[self._index]
+        self._buffer[self._index] = value
+        self._index = (self._index + 1) % self.window
+        self._count += 1
+
+        if self._index == 0:
+            self._sum = math.fsum(self._buffer)
+
+        return self.value
+
+    def update_many(self, values: Iterable[float]) -> float:
+        """여러 값을 순서대로 추가하고 마지막 이동평균 반환"""
+        for value in values:
+            self.update(value)
+        return self.value
+
+
+# 거래량 이동평균은 입력만 다를 뿐 계산은 같다
+VolumeMA = RollingSMA
+
+
+class StreamingEMA:
+    """
+    지수 이동평균 (pandas ewm(span, adjust=False)와 동일)
+
+    첫 값으로 시작하고 이후 EMA = alpha * 값 + (1 - alpha) * 이전 EMA
+    """
+
+    def __init__(self, span: Optional[int] = None, alpha: Optional[float] = None):
+        """
+        Parameters
+        ----------
+        span : int, optional
+            EMA 기간 (alpha = 2 / (span + 1))
+        alpha : float, optional
+            평활 계수 (span 대신 직접 지정)
+        """
+        if alpha is None:
+            if span is None or span < 1:
+                raise ValueError(f"span은 1 이상이어야 합니다: {span}")
+            alpha = 2 / (span + 1)
+        self.span = span
+        self.alpha = alpha
+        self._value = math.nan
+
+    @property
+    def ready(self) -> bool:
+        """첫 값이 들어왔는지 여부"""
+        return not math.isnan(self._value)
+
+    @property
+    def value(self) -> float:
+        """현재 EMA (값이 없으면 NaN)"""
+        return self._value
+
+    def update(self, value: float) -> float:
+        """
+        새 값 추가
+
+        Parameters
+        ----------
+        value : float
+            새 봉의 값
+
+        Returns
+        -------
+        float
+            갱신된 EMA
+        """
+        value = float(value)
+        if math.isnan(self._value):
+            self._value = value
+        else:
+            self._value += self.alpha * (value - self._value)
+        return self._value
+
+    def update_many(self, values: Iterable[float]) -> float:
+        """여러 값을 순서대로 추가하고 마지막 EMA 반환"""
+        for value in values:
+            self.update(value)
+        return self._value
+
+
+def _rsi(avg_gain: float, avg_loss: float) -> float:
+    """평균 상승폭/하락폭으로 RSI 계산 (pandas 계산과 같은 경계값 처리)"""
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else math.nan
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class RollingRSI:
+    """
+    단순 이동평균 RSI (indicators.calculate_rsi와 동일)
+
+    상승폭/하락폭을 각각 RollingSMA로 평균한다.
+    calculate_rsi와 같이 첫 봉의 변화량은 0으로 본다.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Parameters
+        ----------
+        period : int
+            RSI 기간 (기본 14)
+        """
+        self.period = period
+        self._gain = RollingSMA(period)
+        self._loss = RollingSMA(period)
+        self._prev = math.nan
+
+    @property
+    def ready(self) -> bool:
+        """기간만큼 데이터가 쌓였는지 여부"""
+        return self._gain.ready
+
+    @property
+    def value(self) -> float:
+        """현재 RSI (준비 전에는 NaN)"""
+        if not self.ready:
+            return math.nan
+        return _rsi(self._gain.value, self._loss.value)
+
+    def update(self, value: float) -> float:
+        """
+        새 값 추가
+
+        Parameters
+        ----------
+        value : float
+            새 봉의 종가
+
+        Returns
+        -------
+        float
+            갱신된 RSI (0~100, 준비 전에는 NaN)
+        """
+        value = float(value)
+        delta = 0.0 if math.isnan(self._prev) else value - self._prev
+        self._prev = value
+
+        self._gain.update(max(delta, 0.0))
+        self._loss.update(max(-delta, 0.0))
+        return self.value
+
+    def update_many(self, values: Iterable[float]) -> float:
+        """여러 값을 순서대로 추가하고 마지막 RSI 반환"""
+        for value in values:
+            self.update(value)
+        return self.value
+
+
+class WilderRSI:
+    """
+    Wilder 평활 RSI
+
+    처음 period개 변화량은 단순 평균으로 시작하고,
+    이후 평균 = (이전 평균 * (period - 1) + 변화량) / period 로 갱신한다.
+    첫 RSI는 period + 1번째 봉에서 나온다.
+    """
+
+    def __init__(self, period: int = 14):
+        """
+        Parameters
+        ----------
+        period : int
+            RSI 기간 (기본 14)
+        """
+        if period < 1:
+            raise ValueError(f"period는 1 이상이어야 합니다: {period}")
+        self.period = period
+        self._prev = math.nan
+        self._count = 0  # 들어온 변화량 개수
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+
+    @property
+    def ready(self) -> bool:
+        """첫 평균이 만들어졌는지 여부"""
+        return self._count >= self.period
+
+    @property
+    def value(self) -> float:
+        """현재 RSI (준비 전에는 NaN)"""
+        if not self.ready:
+            return math.nan
+        return _rsi(self._avg_gain, self._avg_loss)
+
+    def update(self, value: float) -> float:
+        """
+        새 값 추가
+
+        Parameters
+        ----------
+        value : float
+            새 봉의 종가
+
+        Returns
+        -------
+        float
+            갱신된 RSI (0~100, 준비 전에는 NaN)
+        """
+        value = float(value)
+        if math.isnan(self._prev):
+            self._prev = value
+            return math.nan
+
+        delta = value - self._prev
+        self._prev = value
+        gain = max(delta, 0.0)
+        loss = max(-delta, 0.0)
+
+        self._count += 1
+        if self._count <= self.period:
+            # 첫 평균은 단순 평균 (누적 후 마지막에 나눔)
+            self._avg_gain += gain
+            self._avg_loss += loss
+            if self._count == self.period:
+                self._avg_gain /= self.period
+                self._avg_loss /= self.period
+        else:
+            self._avg_gain += (gain - self._avg_gain) / self.period
+            self._avg_loss += (loss - self._avg_loss) / self.period
+
+        return self.value
+
+    def update_many(self, values: Iterable[float]) -> float:
+        """여러 값을 순서대로 추가하고 마지막 RSI 반환"""
+        for value in values:
+            self.update(value)
+        return self.value
+
+
+class StreamingMACD:
+    """
+    MACD (단기 EMA - 장기 EMA), 시그널 (MACD의 EMA), 히스토그램
+
+    ewm(adjust=False) 기반 배치 계산과 같은 값을 낸다.
+    """
+
+    def __init__(self, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        """
+        Parameters
+        ----------
+        fast_period : int
+            단기 EMA 기간
+        slow_period : int
+            장기 EMA 기간
+        signal_period : int
+            시그널 EMA 기간
+        """
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self._fast = StreamingEMA(fast_period)
+        self._slow = StreamingEMA(slow_period)
+        self._signal = StreamingEMA(signal_period)
+        self._value = MACDValue(math.nan, math.nan, math.nan)
+
+    @property
+    def ready(self) -> bool:
+        """첫 값이 들어왔는지 여부"""
+        return self._signal.ready
+
+    @property
+    def value(self) -> MACDValue:
+        """현재 (macd, signal, histogram)"""
+        return self._value
+
+    def update(self, value: float) -> MACDValue:
+        """
+        새 값 추가
+
+        Parameters
+        ----------
+        value : float
+            새 봉의 종가
+
+        Returns
+        -------
+        MACDValue
+            갱신된 (macd, signal, histogram)
+        """
+        macd = self._fast.update(value) - self._slow.update(value)
+        signal = self._signal.update(macd)
+        self._value = MACDValue(macd, signal, macd - signal)
+        return self._value
+
+    def update_many(self, values: Iterable[float]) -> MACDValue:
+        """여러 값을 순서대로 추가하고 마지막 MACD 반환"""
+        for value in values:
+            self.update(value)
+        return self._value
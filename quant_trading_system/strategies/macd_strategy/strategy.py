@@ -70,23 +70,18 @@ class MACDStrategy(BaseStrategy):
         if upbit_adapter:
             try:
                 logger.info(f"과거 데이터 로드 시작: {self.market} ({self.candle_minutes}분봉)")
-                # 1시간봉 데이터 가져오기 (최근 1000개)
-                from strategies.core.data_fetcher import fetch_minute_data
-                
-                df = fetch_minute_data(
-                    market=self.market,
-                    minutes=self.candle_minutes,  # 1시간봉 (60분)
-                    count=1000  # 최근 1000개 (약 41일 분량)
+                # 1시간봉 데이터 가져오기 (최근 1000개, 약 41일 분량, 최신순)
+                candles = await upbit_adapter.get_ohlcv(
+                    self.market, interval=f"minute{self.candle_minutes}", count=1000
                 )
                 
-                if not df.empty and len(df) > 0:
-                    # price_history에 과거 데이터 채우기
-                    for idx in range(len(df)):
-                        row = df.iloc[idx]
+                if candles:
+                    # price_history에 과거 데이터 채우기 (날짜순으로 정렬)
+                    for candle in reversed(candles):
                         self.price_history.append({
-                            'price': row['종가'],
-                            'volume': row.get('거래량', 0),
-                            'timestamp': row.name if hasattr(row.name, 'isoformat') else pd.Timestamp.now(),
+                            'price': candle['trade_price'],
+                            'volume': candle.get('candle_acc_trade_volume', 0),
+                            'timestamp': pd.Timestamp(candle['candle_date_time_kst']),
                         })
                     
                     logger.info(f"과거 데이터 로드 완료: {len(self.price_history)}개 데이터 포인트")
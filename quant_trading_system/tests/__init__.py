@@ -0,0 +1,3 @@
+"""
+테스트 모듈
+"""
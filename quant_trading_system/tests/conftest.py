@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+
+백엔드 모듈(app.*)을 가져올 수 있도록 backend 경로 추가
+"""
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent / "backend"
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
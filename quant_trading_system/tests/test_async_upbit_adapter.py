@@ -0,0 +1,110 @@
+"""
+비동기 Upbit 어댑터 테스트
+
+네트워크 대신 httpx.MockTransport로 응답을 흉내 내어
+오류 변환, 429 재시도, 현재가 배치 조회를 확인
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.adapters.upbit.async_adapter import AsyncUpbitAdapter
+from app.adapters.upbit.exceptions import UpbitAPIError, UpbitAuthError
+
+
+def run_with_adapter(handler, scenario):
+    """MockTransport 어댑터로 시나리오 실행 후 연결 종료"""
+    async def main():
+        adapter = AsyncUpbitAdapter("access", "s" * 32, transport=httpx.MockTransport(handler))
+        try:
+            return await scenario(adapter)
+        finally:
+            await adapter.aclose()
+
+    return asyncio.run(main())
+
+
+class TestAsyncUpbitAdapter:
+    """AsyncUpbitAdapter"""
+
+    def test_error_mapping(self):
+        def handler(request):
+            if request.url.path.endswith("/accounts"):
+                return httpx.Response(401, json={"error": {"message": "invalid key"}})
+            return httpx.Response(400, json={"error": {"message": "bad request"}})
+
+        async def scenario(adapter):
+            with pytest.raises(UpbitAuthError):
+                await adapter.get_accounts()
+            with pytest.raises(UpbitAPIError, match="bad request"):
+                await adapter.get_orders()
+
+        run_with_adapter(handler, scenario)
+
+    def test_private_request_is_signed(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("Authorization", ""))
+            return httpx.Response(200, json=[{"currency": "KRW", "balance": "1000"}])
+
+        balance = run_with_adapter(handler, lambda adapter: adapter.get_balance("KRW"))
+
+        assert balance["balance"] == "1000"
+        assert seen[0].startswith("Bearer ")
+
+    def test_rate_limit_retry(self):
+        responses = iter([httpx.Response(429), httpx.Response(200, json=[{"currency": "KRW"}])])
+
+        accounts = run_with_adapter(
+            lambda request: next(responses),
+            lambda adapter: adapter.get_accounts(),
+        )
+
+        assert accounts == [{"currency": "KRW"}]
+
+    def test_ticker_drops_unknown_markets_before_request(self):
+        requested = []
+        listed = [f"KRW-C{i}" for i in range(150)]
+
+        def handler(request):
+            if request.url.path.endswith("/market/all"):
+                return httpx.Response(200, json=[{"market": market} for market in listed])
+            markets = request.url.params["markets"].split(",")
+            requested.append(markets)
+            if "KRW-GONE" in markets:
+                return httpx.Response(404, json={"error": {"message": "Code not found"}})
+            return httpx.Response(200, json=[{"market": market} for market in markets])
+
+        async def scenario(adapter):
+            first = await adapter.get_ticker(listed + ["KRW-GONE"])
+            second = await adapter.get_ticker(["KRW-C1", "KRW-GONE"])
+            return first, second
+
+        first, second = run_with_adapter(handler, scenario)
+
+        # 없는 마켓은 요청 전에 제외되어 배치가 실패하지 않음 (마켓 목록은 한 번만 조회)
+        assert [ticker["market"] for ticker in first] == listed
+        assert [ticker["market"] for ticker in second] == ["KRW-C1"]
+        assert sorted(len(batch) for batch in requested) == [1, 50, 100]
+        assert all("KRW-GONE" not in batch for batch in requested)
+
+    def test_ticker_falls_back_to_individual_markets(self):
+        requested = []
+
+        def handler(request):
+            if request.url.path.endswith("/market/all"):
+                return httpx.Response(500)
+            markets = request.url.params["markets"].split(",")
+            requested.append(markets)
+            if "KRW-GONE" in markets:
+                return httpx.Response(404, json={"error": {"message": "Code not found"}})
+            return httpx.Response(200, json=[{"market": market} for market in markets])
+
+        markets = ["KRW-A", "KRW-GONE", "KRW-B"]
+        tickers = run_with_adapter(handler, lambda adapter: adapter.get_ticker(markets))
+
+        # 마켓 목록을 받지 못하면 배치 실패 후 마켓별로 다시 조회
+        assert [ticker["market"] for ticker in tickers] == ["KRW-A", "KRW-B"]
+        assert len(requested) == 4
@@ -0,0 +1,103 @@
+"""
+백테스팅 엔진 테스트
+
+NumPy 배열 기반 실행과 행 단위 참조 구현의 결과 일치 확인
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.core.backtest_engine import BacktestEngine
+
+
+def make_price_data(n: int = 2000, seed: int = 42) -> pd.DataFrame:
+    """랜덤 워크 가격 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    closes = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    index = pd.date_range("2024-01-01", periods=n, freq="min", name="날짜")
+    return pd.DataFrame({"종가": closes, "market": "KRW-BTC"}, index=index)
+
+
+def make_cross_signals(df: pd.DataFrame, fast: int = 5, slow: int = 20) -> pd.DataFrame:
+    """SMA 크로스 신호 생성 (position: 1, -1, 0)"""
+    sma_fast = df["종가"].rolling(window=fast).mean()
+    sma_slow = df["종가"].rolling(window=slow).mean()
+    golden = (sma_fast.shift(1) < sma_slow.shift(1)) & (sma_fast > sma_slow)
+    dead = (sma_fast.shift(1) > sma_slow.shift(1)) & (sma_fast < sma_slow)
+
+    signals = pd.DataFrame(index=df.index)
+    signals["signal"] = "HOLD"
+    signals.loc[golden, "signal"] = "BUY"
+    signals.loc[dead, "signal"] = "SELL"
+    signals["position"] = 0
+    signals.loc[golden, "position"] = 1
+    signals.loc[dead, "position"] = -1
+    return signals
+
+
+def make_state_signals(df: pd.DataFrame, fast: int = 10, slow: int = 30) -> pd.DataFrame:
+    """상태 차분 신호 생성 (position에 NaN, 연속 매수 신호 포함)"""
+    sma_fast = df["종가"].rolling(window=fast).mean()
+    sma_slow = df["종가"].rolling(window=slow).mean()
+
+    signals = pd.DataFrame(index=df.index)
+    signals["signal"] = (sma_fast > sma_slow).astype(int)
+    signals["position"] = signals["signal"].diff()
+    # 보유 중 중복 매수 신호 (무시되어야 함)
+    signals.iloc[::97, signals.columns.get_loc("position")] = 1
+    return signals
+
+
+def assert_same_result(expected: dict, actual: dict):
+    """두 백테스팅 결과가 동일한지 확인"""
+    for key in ("initial_cash", "final_value", "net_profit", "total_return",
+                "buy_hold_return", "mdd", "sharpe_ratio", "num_trades", "win_rate"):
+        assert actual[key] == expected[key], key
+
+    assert actual["trades"] == expected["trades"]
+    assert actual["dates"] == expected["dates"]
+    assert actual["portfolio_values"] == expected["portfolio_values"]
+    pd.testing.assert_frame_equal(actual["portfolio_df"], expected["portfolio_df"])
+
+
+class TestVectorizedBacktest:
+    """run_vectorized()와 run_reference() 결과 비교"""
+
+    @pytest.mark.parametrize("seed", [1, 7, 42])
+    def test_cross_signals_match_reference(self, seed):
+        df = make_price_data(seed=seed)
+        signals = make_cross_signals(df)
+        engine = BacktestEngine(initial_cash=1_000_000, commission=0.0005)
+
+        expected = engine.run_reference(df, signals)
+        actual = engine.run_vectorized(df, signals)
+
+        assert expected["num_trades"] > 0
+        assert_same_result(expected, actual)
+
+    def test_state_signals_match_reference(self):
+        df = make_price_data(n=1500, seed=3)
+        signals = make_state_signals(df)
+        engine = BacktestEngine(initial_cash=5_000_000, commission=0.001)
+
+        assert_same_result(engine.run_reference(df, signals), engine.run_vectorized(df, signals))
+
+    def test_no_signals(self):
+        df = make_price_data(n=100)
+        signals = pd.DataFrame({"signal": "HOLD", "position": 0}, index=df.index)
+        engine = BacktestEngine()
+
+        result = engine.run_vectorized(df, signals)
+
+        assert result["num_trades"] == 0
+        assert result["final_value"] == engine.initial_cash
+        assert_same_result(engine.run_reference(df, signals), result)
+
+    def test_run_dispatch(self):
+        df = make_price_data(n=500)
+        signals = make_cross_signals(df)
+
+        vectorized = BacktestEngine().run(df, signals)
+        reference = BacktestEngine(vectorized=False).run(df, signals)
+
+        assert_same_result(reference, vectorized)
@@ -0,0 +1,147 @@
+"""
+캔들 캐시 테스트
+
+가짜 Upbit 캔들 API로 캐시 적중/부분 수집/진행 중 캔들 처리 확인
+"""
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from strategies.core import data_fetcher
+from strategies.core.candle_cache import CandleCache, UTC_FORMAT
+from strategies.core.rate_limiter import TokenBucket
+
+
+class FakeUpbit:
+    """분 단위로 캔들이 쌓이는 가짜 캔들 API"""
+
+    def __init__(self, now: datetime, minutes: int = 1, history: int = 5000):
+        self.now = now
+        self.minutes = minutes
+        self.history = history
+        self.requested = 0
+        self.skip_every = None      # N번째 캔들마다 거래 없음 (캔들 누락)
+        self.rate_limited = 0       # 남은 429 응답 수
+        self._lock = threading.Lock()
+
+    def candles(self):
+        """최신순 캔들 (첫 번째는 진행 중인 캔들)"""
+        step = timedelta(minutes=self.minutes)
+        open_start = self.now - (self.now - datetime(1970, 1, 1)) % step
+        result = []
+        for i in range(self.history):
+            if self.skip_every and i % self.skip_every == 1:
+                continue
+            start = open_start - step * i
+            # 마감된 캔들은 시작 시각으로 가격 고정, 진행 중인 캔들은 현재 시각 반영
+            price = float(start.timestamp() // 60)
+            if i == 0:
+                price += self.now.second / 100
+            result.append({
+                'market': 'KRW-BTC',
+                'candle_date_time_utc': start.strftime(UTC_FORMAT),
+                'candle_date_time_kst': (start + timedelta(hours=9)).strftime(UTC_FORMAT),
+                'opening_price': price,
+                'high_price': price,
+                'low_price': price,
+                'trade_price': price,
+                'candle_acc_trade_volume': 1.0,
+            })
+        return result
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        with self._lock:
+            if self.rate_limited > 0:
+                self.rate_limited -= 1
+                return FakeResponse([], status_code=429)
+            self.requested += params['count']
+        candles = self.candles()
+        if 'to' in params:
+            candles = [c for c in candles if c['candle_date_time_utc'] < params['to']]
+        return FakeResponse(candles[:params['count']])
+
+
+class FakeResponse:
+    def __init__(self, data, status_code: int = 200):
+        self.data = data
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture
+def upbit(monkeypatch, tmp_path):
+    monkeypatch.setenv("CANDLE_CACHE_PATH", str(tmp_path / "candles.db"))
+    monkeypatch.setattr(data_fetcher, "upbit_rate_limiter", TokenBucket(rate=10_000))
+
+    fake = FakeUpbit(now=datetime(2025, 1, 1, 12, 0, 30))
+    monkeypatch.setattr(data_fetcher.requests, "get", fake.get)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fake.now.replace(tzinfo=tz)
+
+    monkeypatch.setattr(data_fetcher, "datetime", FrozenDatetime)
+    monkeypatch.setattr("strategies.core.candle_cache.datetime", FrozenDatetime)
+    return fake
+
+
+class TestCandleCache:
+    """fetch_minute_data() 캐시 동작"""
+
+    def test_second_call_uses_cache(self, upbit):
+        first = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=1000)
+        assert upbit.requested == 1000
+
+        second = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=1000)
+
+        # 진행 중인 캔들 1개만 다시 요청
+        assert upbit.requested == 1001
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_top_up_tail_and_head(self, upbit):
+        data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=300)
+        upbit.requested = 0
+
+        # 10분 경과 후 더 긴 구간 요청
+        upbit.now += timedelta(minutes=10)
+        df = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=500)
+        uncached = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=500, use_cache=False)
+
+        # 최신 11개(새로 마감된 10개 + 진행 중 1개) + 부족한 과거 구간만 요청
+        assert upbit.requested == 11 + (500 - 11 - 299) + 500
+        pd.testing.assert_frame_equal(df, uncached)
+        assert df.index.is_monotonic_increasing
+        assert not df.index.has_duplicates
+
+    def test_open_candle_not_cached(self, upbit):
+        df = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=50)
+        cache = CandleCache()
+
+        open_candle_time = df['candle_date_time_utc'].iloc[-1]
+        assert cache.newest('KRW-BTC', 'minutes/1') < open_candle_time
+        assert len(cache.load('KRW-BTC', 'minutes/1', 100)) == 49
+
+        # 같은 캔들 안에서 시간이 지나면 진행 중인 캔들 값이 갱신됨
+        upbit.now += timedelta(seconds=20)
+        updated = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=50)
+        assert updated['종가'].iloc[-1] != df['종가'].iloc[-1]
+        pd.testing.assert_frame_equal(updated.iloc[:-1], df.iloc[:-1])
+
+    def test_stale_cache_is_replaced(self, upbit):
+        data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=100)
+
+        upbit.now += timedelta(days=1)
+        df = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=100)
+
+        assert len(CandleCache().load('KRW-BTC', 'minutes/1', 1000)) == 99
+        pd.testing.assert_frame_equal(
+            df, data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=100, use_cache=False)
+        )
@@ -0,0 +1,53 @@
+"""
+캔들 동시 수집 테스트
+
+페이지 경계 계산, 누락 캔들 보충, 429 재시도 확인
+"""
+import pandas as pd
+
+from strategies.core import data_fetcher
+from strategies.core.rate_limiter import TokenBucket
+
+from .test_candle_cache import upbit  # noqa: F401 (fixture)
+
+
+def expected_frame(upbit, count: int) -> pd.DataFrame:
+    """가짜 API의 최신 count개 캔들로 만든 기대 결과"""
+    return data_fetcher._to_dataframe(upbit.candles()[:count])
+
+
+class TestConcurrentDownload:
+    """_request_candles() 동시 요청 결과 검증"""
+
+    def test_pages_stitched_in_order(self, upbit):
+        df = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=1000, use_cache=False)
+
+        assert upbit.requested == 1000
+        pd.testing.assert_frame_equal(df, expected_frame(upbit, 1000))
+
+    def test_missing_candles_are_topped_up(self, upbit):
+        upbit.skip_every = 7
+
+        df = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=1000, use_cache=False)
+
+        assert len(df) == 1000
+        assert not df.index.has_duplicates
+        pd.testing.assert_frame_equal(df, expected_frame(upbit, 1000))
+
+    def test_daily_pages(self, upbit):
+        upbit.minutes = 60 * 24
+
+        df = data_fetcher.fetch_daily_data('KRW-BTC', days=450, use_cache=False)
+
+        pd.testing.assert_frame_equal(df, expected_frame(upbit, 450))
+
+    def test_rate_limited_requests_are_retried(self, upbit, monkeypatch):
+        limiter = TokenBucket(rate=10_000)
+        monkeypatch.setattr(data_fetcher, "upbit_rate_limiter", limiter)
+        upbit.rate_limited = 3
+
+        df = data_fetcher.fetch_minute_data('KRW-BTC', minutes=1, count=600, use_cache=False)
+
+        assert upbit.rate_limited == 0
+        assert limiter.paused_until > 0
+        pd.testing.assert_frame_equal(df, expected_frame(upbit, 600))
@@ -0,0 +1,80 @@
+"""
+정수 고정소수점 가상 계좌 테스트
+
+Decimal 구현(VirtualAccount)과 같은 결과를 원 단위 반올림 차이 안에서 내는지,
+반올림 규칙이 문서대로인지 확인
+"""
+import pytest
+
+from app.core.fixed_point_account import FixedPointVirtualAccount
+from app.core.virtual_account import VirtualAccount
+
+
+def apply(account, fills):
+    for side, currency, price, kwargs in fills:
+        getattr(account, side)(currency, price, **kwargs)
+    return account
+
+
+FILLS = [
+    ('buy', 'BTC', 90_123_000.0, {'amount': 1_000_000}),
+    ('buy', 'BTC', 91_000_000.0, {'quantity': 0.0123}),
+    ('buy', 'XRP', 812.5, {'amount': 333_333}),
+    ('sell', 'BTC', 92_500_000.0, {'ratio': 0.5}),
+    ('sell', 'XRP', 830.1, {'quantity': 100.5}),
+    ('sell', 'BTC', 93_000_000.0, {}),
+]
+
+
+class TestFixedPointVirtualAccount:
+    """FixedPointVirtualAccount"""
+
+    def test_matches_decimal_account_within_rounding(self):
+        reference = apply(VirtualAccount(initial_balance=10_000_000), FILLS)
+        account = apply(FixedPointVirtualAccount(initial_balance=10_000_000), FILLS)
+
+        # 체결마다 원 단위 반올림만 다름
+        assert account.get_balance() == pytest.approx(reference.get_balance(), abs=2 * len(FILLS))
+        assert account.get_holdings().keys() == reference.get_holdings().keys()
+        prices = {'BTC': 93_000_000.0, 'XRP': 830.1}
+        assert account.get_total_value(prices) == pytest.approx(reference.get_total_value(prices), abs=2 * len(FILLS))
+        for currency, avg_price in reference.get_avg_buy_prices().items():
+            assert account.get_avg_buy_prices()[currency] == pytest.approx(avg_price, rel=1e-6)
+
+        history = account.get_trade_history()
+        expected = reference.get_trade_history()
+        assert [trade.keys() for trade in history] == [trade.keys() for trade in expected]
+        assert [trade['type'] for trade in history] == [trade['type'] for trade in expected]
+        assert account.get_summary()['num_trades'] == len(FILLS)
+
+    def test_rounding_rules(self):
+        account = FixedPointVirtualAccount(initial_balance=1_000_000)
+
+        # 금액 매수: 금액 내림(10,000원), 수수료 올림(5원), 수량 1e-8 단위 내림
+        assert account.buy('SOL', 300_000.0, amount=10_000.9, commission=0.0005)
+        assert account.get_balance() == 990_000
+        assert account.holdings_units['SOL'] == 9995 * 10 ** 8 // 300_000
+
+        # 매도: 금액 내림, 수수료 올림
+        assert account.sell('SOL', 300_001.0, commission=0.0005)
+        gross = 3331666 * 300_001 // 10 ** 8
+        assert account.get_balance() == 990_000 + gross - (-(-gross * 5 // 10_000))
+        assert account.get_holdings() == {}
+        assert account.get_avg_buy_prices() == {}
+
+    def test_rejects_overdraft_and_empty_sell(self):
+        account = FixedPointVirtualAccount(initial_balance=10_000)
+
+        assert not account.buy('BTC', 90_000_000.0, amount=10_001)
+        assert not account.buy('BTC', 90_000_000.0, quantity=1.0)
+        assert not account.sell('BTC', 90_000_000.0)
+        assert account.get_balance() == 10_000
+        assert account.get_trade_history() == []
+
+    def test_sell_holdings_roundtrip(self):
+        account = FixedPointVirtualAccount(initial_balance=1_000_000)
+        account.buy('ETH', 4_123_456.0, amount=500_000)
+
+        # 전략은 get_holdings()의 float 수량을 그대로 매도 수량으로 넘김
+        assert account.sell('ETH', 4_200_000.0, quantity=account.get_holdings()['ETH'])
+        assert 'ETH' not in account.holdings_units
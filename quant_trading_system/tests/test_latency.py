@@ -0,0 +1,51 @@
+"""
+지연 시간 히스토그램 테스트
+"""
+import asyncio
+
+import httpx
+
+from app.adapters.upbit.async_adapter import AsyncUpbitAdapter
+from app.core.latency import LatencyHistogram, LatencyRecorder, upbit_latency
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram / LatencyRecorder"""
+
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(bounds_ms=(10, 50, 100))
+        for elapsed in [1, 2, 3, 40, 45, 90, 400]:
+            histogram.observe(elapsed)
+
+        summary = histogram.to_dict()
+        assert summary["buckets"] == {"le_10": 3, "le_50": 2, "le_100": 1, "inf": 1}
+        assert summary["count"] == 7
+        assert summary["p50_ms"] == 50
+        assert summary["p99_ms"] == 400
+        assert LatencyHistogram().percentile(0.5) is None
+
+    def test_recorder_groups_by_name(self):
+        recorder = LatencyRecorder()
+        recorder.observe("GET accounts", 0.02)
+        recorder.observe("GET accounts", 0.03)
+        recorder.observe("GET ticker", 0.01)
+
+        snapshot = recorder.snapshot()
+        assert list(snapshot) == ["GET accounts", "GET ticker"]
+        assert snapshot["GET accounts"]["count"] == 2
+        assert snapshot["GET accounts"]["avg_ms"] == 25.0
+
+    def test_adapter_records_endpoint_latency(self):
+        upbit_latency.reset()
+
+        async def scenario():
+            transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+            adapter = AsyncUpbitAdapter("access", "s" * 32, transport=transport)
+            try:
+                await adapter.get_accounts()
+                await adapter.get_accounts()
+            finally:
+                await adapter.aclose()
+
+        asyncio.run(scenario())
+        assert upbit_latency.snapshot()["GET accounts"]["count"] == 2
@@ -0,0 +1,99 @@
+"""
+시장 데이터 허브 테스트
+
+전략 수와 관계없이 주기마다 한 번만 조회하는지, 구독자마다 최신 현재가가 전달되는지 확인
+"""
+import asyncio
+
+from app.core.market_data_hub import MarketDataHub
+
+
+class FakeTickerSource:
+    """호출 횟수와 요청 마켓을 기록하는 가짜 현재가 조회"""
+
+    def __init__(self):
+        self.calls = []
+        self.price = 100.0
+
+    async def __call__(self, markets):
+        self.calls.append(list(markets))
+        self.price += 1
+        return [{'market': market, 'trade_price': self.price} for market in markets]
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestMarketDataHub:
+    """MarketDataHub"""
+
+    def test_one_request_per_cycle_for_all_strategies(self):
+        source = FakeTickerSource()
+
+        async def scenario():
+            hub = MarketDataHub(fetch_tickers=source)
+            markets = ['KRW-BTC', 'KRW-ETH', 'KRW-SOL']
+            queues = [(market, hub.subscribe(market, interval=0.05)) for market in markets for _ in range(10)]
+
+            await asyncio.sleep(0.22)
+            received = [(market, queue.get_nowait()) for market, queue in queues]
+            await hub.stop()
+            return hub, received
+
+        hub, received = run(scenario())
+
+        # 30개 구독이어도 주기마다 한 번 (처음 구독으로 인한 즉시 조회 포함)
+        assert 3 <= len(source.calls) <= 8
+        assert source.calls[-1] == ['KRW-BTC', 'KRW-ETH', 'KRW-SOL']
+        assert hub.request_count == len(source.calls)
+        # 큐에는 가장 최근 값만 남음
+        for market, ticker in received:
+            assert ticker['market'] == market
+            assert ticker == hub.get_snapshot(market)
+
+    def test_new_subscriber_gets_snapshot_and_unsubscribe_stops(self):
+        source = FakeTickerSource()
+
+        async def scenario():
+            hub = MarketDataHub(fetch_tickers=source)
+            first = hub.subscribe('KRW-BTC', interval=60)
+            ticker = await asyncio.wait_for(first.get(), timeout=1)
+
+            # 이미 받은 값이 있으면 바로 전달, 새 마켓은 주기를 기다리지 않고 조회
+            second = hub.subscribe('KRW-BTC', interval=60)
+            assert second.get_nowait() == ticker
+            other = hub.subscribe('KRW-ETH', interval=60)
+            other_ticker = await asyncio.wait_for(other.get(), timeout=1)
+
+            hub.unsubscribe('KRW-BTC', first)
+            hub.unsubscribe('KRW-BTC', second)
+            hub.unsubscribe('KRW-ETH', other)
+            await asyncio.sleep(0)
+            return hub, ticker, other_ticker
+
+        hub, ticker, other_ticker = run(scenario())
+
+        assert ticker['market'] == 'KRW-BTC'
+        assert other_ticker['market'] == 'KRW-ETH'
+        assert source.calls == [['KRW-BTC'], ['KRW-BTC', 'KRW-ETH']]
+        assert hub.markets == []
+
+    def test_fetch_error_keeps_running(self):
+        calls = []
+
+        async def flaky(markets):
+            calls.append(markets)
+            if len(calls) == 1:
+                raise ConnectionError("boom")
+            return [{'market': 'KRW-BTC', 'trade_price': 1.0}]
+
+        async def scenario():
+            hub = MarketDataHub(fetch_tickers=flaky)
+            queue = hub.subscribe('KRW-BTC', interval=0.01)
+            ticker = await asyncio.wait_for(queue.get(), timeout=1)
+            await hub.stop()
+            return ticker
+
+        assert run(scenario())['trade_price'] == 1.0
+        assert len(calls) >= 2
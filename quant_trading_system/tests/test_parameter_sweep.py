@@ -0,0 +1,66 @@
+"""
+파라미터 스윕 테스트
+
+스윕 결과가 BacktestEngine 단일 실행 결과와 일치하는지 확인
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.core.backtest_engine import BacktestEngine
+from strategies.core.parameter_sweep import ParameterSweep, METRIC_COLUMNS
+
+from .test_backtest_engine import make_price_data, make_cross_signals
+
+
+def run_engine(df: pd.DataFrame, signals: pd.DataFrame) -> dict:
+    return BacktestEngine(initial_cash=1_000_000, commission=0.0005).run(df, signals)
+
+
+def assert_metrics_close(row: pd.Series, expected: dict):
+    for key in METRIC_COLUMNS:
+        assert row[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-9), key
+
+
+class TestParameterSweep:
+    """ParameterSweep 결과 검증"""
+
+    def test_sma_cross_matches_engine(self):
+        df = make_price_data(n=800, seed=5)
+        table = ParameterSweep(df).sma_cross([3, 5, 10], [20, 30])
+
+        assert len(table) == 6
+        for _, row in table.iterrows():
+            signals = make_cross_signals(df, fast=int(row["fast"]), slow=int(row["slow"]))
+            assert_metrics_close(row, run_engine(df, signals))
+
+    def test_momentum_matches_engine(self):
+        df = make_price_data(n=800, seed=9)
+        table = ParameterSweep(df).momentum([10, 20], [0.01, 0.03], [-0.02])
+
+        for _, row in table.iterrows():
+            momentum = df["종가"].pct_change(periods=int(row["lookback"]))
+            signals = pd.DataFrame({"signal": "HOLD", "position": 0}, index=df.index)
+            signals.loc[momentum >= row["buy_threshold"], "position"] = 1
+            signals.loc[momentum <= row["sell_threshold"], "position"] = -1
+            assert_metrics_close(row, run_engine(df, signals))
+
+    def test_macd_grid_and_ranking(self):
+        df = make_price_data(n=600, seed=11)
+        table = ParameterSweep(df).macd([8, 12], [26, 30], [9], trend_periods=[50])
+
+        assert list(table.columns[:4]) == ["fast", "slow", "signal", "trend"]
+        assert len(table) == 4
+        assert list(table.index) == [1, 2, 3, 4]
+        assert table["total_return"].is_monotonic_decreasing
+
+    def test_indicators_computed_once(self):
+        df = make_price_data(n=300)
+        sweep = ParameterSweep(df)
+        sweep.sma_cross(range(2, 10), range(10, 40, 5))
+
+        assert sorted(sweep._sma_cache) == list(range(2, 10)) + list(range(10, 40, 5))
+        assert sweep.sma(5) is sweep.sma(5)
+        np.testing.assert_allclose(
+            sweep.sma(5), df["종가"].rolling(window=5).mean().to_numpy(), equal_nan=True
+        )
@@ -0,0 +1,83 @@
+"""
+스트리밍 지표 테스트
+
+봉 단위로 갱신한 값이 pandas 배치 계산(indicators.py)과 일치하는지 확인
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from strategies.core.indicators import calculate_sma, calculate_ema, calculate_rsi
+from strategies.core.streaming_indicators import (
+    RollingSMA, StreamingEMA, RollingRSI, WilderRSI, StreamingMACD, VolumeMA
+)
+
+from .test_backtest_engine import make_price_data
+
+
+def stream(indicator, values) -> np.ndarray:
+    return np.array([indicator.update(v) for v in values])
+
+
+def assert_series_close(actual: np.ndarray, expected: pd.Series):
+    np.testing.assert_allclose(actual, expected.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def wilder_rsi(close: pd.Series, period: int = 14) -> pd.Series:
+    """Wilder RSI 배치 계산 (첫 평균은 SMA, 이후 alpha=1/period 지수 평활)"""
+    delta = close.diff()
+    averages = []
+    for moves in (delta.clip(lower=0), -delta.clip(upper=0)):
+        seeded = moves.copy()
+        seeded.iloc[:period + 1] = np.nan
+        seeded.iloc[period] = moves.iloc[1:period + 1].mean()
+        averages.append(seeded.ewm(alpha=1 / period, adjust=False).mean())
+    avg_gain, avg_loss = averages
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+class TestStreamingIndicators:
+    """배치 계산과 비교"""
+
+    def test_sma_matches_rolling_mean(self):
+        df = make_price_data(n=3000, seed=1)
+        for window in (1, 5, 20, 200):
+            actual = stream(RollingSMA(window), df["종가"])
+            assert_series_close(actual, calculate_sma(df, window=window))
+
+    def test_ema_matches_ewm(self):
+        df = make_price_data(n=3000, seed=2)
+        for span in (5, 26, 100):
+            actual = stream(StreamingEMA(span), df["종가"])
+            assert_series_close(actual, calculate_ema(df, span=span))
+
+    def test_rsi_matches_batch(self):
+        df = make_price_data(n=3000, seed=3)
+        # 횡보 구간 (상승/하락 없음) 경계값 처리 확인
+        df.iloc[100:130, df.columns.get_loc("종가")] = df["종가"].iloc[100]
+
+        assert_series_close(stream(RollingRSI(14), df["종가"]), calculate_rsi(df, period=14))
+        assert_series_close(stream(WilderRSI(14), df["종가"]), wilder_rsi(df["종가"], 14))
+
+    def test_macd_matches_ewm(self):
+        close = make_price_data(n=3000, seed=4)["종가"]
+        macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+        signal = macd.ewm(span=9, adjust=False).mean()
+
+        values = stream(StreamingMACD(12, 26, 9), close)
+
+        assert_series_close(values[:, 0], macd)
+        assert_series_close(values[:, 1], signal)
+        assert_series_close(values[:, 2], macd - signal)
+
+    def test_volume_ma_and_update_many(self):
+        rng = np.random.default_rng(5)
+        volume = pd.Series(rng.exponential(10.0, 1000))
+
+        ma = VolumeMA(20)
+        assert np.isnan(ma.update_many(volume.iloc[:10]))
+        assert not ma.ready
+        last = ma.update_many(volume.iloc[10:])
+
+        assert ma.ready
+        assert last == pytest.approx(volume.rolling(20).mean().iloc[-1], rel=1e-12)
@@ -0,0 +1,63 @@
+"""
+현재가 캐시 테스트
+
+유효 시간 안에는 다시 조회하지 않고, 없는 마켓만 모아 한 번에 조회하는지 확인
+"""
+import asyncio
+
+from app.core.ticker_cache import TickerCache
+
+
+class FakeTickerSource:
+    """요청 마켓을 기록하는 가짜 현재가 조회"""
+
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, markets):
+        self.calls.append(list(markets))
+        return [{'market': market, 'trade_price': 100.0} for market in markets if market != 'KRW-GONE']
+
+
+class TestTickerCache:
+    """TickerCache"""
+
+    def test_fetches_only_missing_markets_within_ttl(self):
+        source = FakeTickerSource()
+        cache = TickerCache(ttl=60, fetch_tickers=source)
+
+        async def scenario():
+            await cache.get_tickers(['KRW-BTC', 'KRW-ETH'])
+            tickers = await cache.get_tickers(['KRW-ETH', 'KRW-SOL', 'KRW-ETH'])
+            prices = await cache.get_prices(['BTC', 'SOL', 'GONE'])
+            return tickers, prices
+
+        tickers, prices = asyncio.run(scenario())
+
+        assert [ticker['market'] for ticker in tickers] == ['KRW-ETH', 'KRW-SOL']
+        assert prices == {'BTC': 100.0, 'SOL': 100.0}
+        assert source.calls == [['KRW-BTC', 'KRW-ETH'], ['KRW-SOL'], ['KRW-GONE']]
+
+    def test_concurrent_callers_share_one_request(self):
+        source = FakeTickerSource()
+        cache = TickerCache(ttl=60, fetch_tickers=source)
+
+        async def scenario():
+            return await asyncio.gather(*(cache.get_tickers(['KRW-BTC']) for _ in range(20)))
+
+        results = asyncio.run(scenario())
+
+        assert all(result == results[0] for result in results)
+        assert source.calls == [['KRW-BTC']]
+
+    def test_expired_entries_are_refetched(self):
+        source = FakeTickerSource()
+        cache = TickerCache(ttl=0, fetch_tickers=source)
+
+        async def scenario():
+            await cache.get_tickers(['KRW-BTC'])
+            await asyncio.sleep(0.01)
+            return await cache.get_tickers(['KRW-BTC'])
+
+        assert asyncio.run(scenario()) == [{'market': 'KRW-BTC', 'trade_price': 100.0}]
+        assert len(source.calls) == 2
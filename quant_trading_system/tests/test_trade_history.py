@@ -0,0 +1,69 @@
+"""
+거래 내역 저장소 테스트
+
+메모리 링 버퍼와 SQLite로 옮긴 내역을 이어서 커서 페이지로 읽을 수 있는지,
+누적 통계가 전체 거래 기준으로 유지되는지 확인
+"""
+from app.core.fixed_point_account import FixedPointVirtualAccount
+from app.core.trade_history import TradeHistory
+from app.core.virtual_account import VirtualAccount
+
+
+def fill(history: TradeHistory, n: int):
+    for i in range(1, n + 1):
+        history.append('BUY' if i % 2 else 'SELL', 'BTC', 100.0 + i, 1.0, 100.0 + i, 0.5,
+                       1_700_000_000.0 + i, 1000.0, 0.0 if i % 2 else 2.0)
+
+
+def read_all(history: TradeHistory, page_size: int):
+    ids, cursor = [], None
+    while True:
+        page = history.page(limit=page_size, after_id=cursor)
+        if not page:
+            return ids
+        ids.extend(trade['id'] for trade in page)
+        cursor = page[-1]['id']
+
+
+class TestTradeHistory:
+    """TradeHistory"""
+
+    def test_memory_only_keeps_recent_and_exact_stats(self):
+        history = TradeHistory(capacity=100)
+        fill(history, 1050)
+
+        assert history.num_trades == 1050
+        assert history.num_buys == 525 and history.num_sells == 525
+        assert history.total_commission == 525.0
+        assert history.realized_pnl == 1050.0
+        # 밀려난 거래는 버려지고 최근 100개만 조회
+        assert read_all(history, 30) == list(range(1050, 950, -1))
+
+    def test_spill_to_sqlite_and_paginate(self, tmp_path):
+        history = TradeHistory(capacity=100, spill_path=tmp_path / "trades.db")
+        fill(history, 1234)
+
+        ids = read_all(history, 70)
+        assert ids == list(range(1234, 0, -1))
+
+        page = history.page(limit=3, after_id=5)
+        assert [trade['id'] for trade in page] == [4, 3, 2]
+        assert page[0]['price'] == 104.0 and page[0]['type'] == 'SELL'
+        history.close()
+
+    def test_accounts_page_newest_first(self):
+        for account_class in (VirtualAccount, FixedPointVirtualAccount):
+            account = account_class(initial_balance=1_000_000, history_capacity=4)
+            for _ in range(5):
+                account.buy('ETH', 4_000_000.0, amount=100_000)
+                account.sell('ETH', 4_100_000.0)
+
+            first = account.get_trade_history(limit=3)
+            second = account.get_trade_history(limit=3, after_id=first[-1]['id'])
+
+            assert [trade['id'] for trade in first] == [10, 9, 8]
+            assert [trade['id'] for trade in second] == [7]
+            summary = account.get_summary()
+            assert summary['num_trades'] == 10
+            assert summary['realized_pnl'] > 0
+            assert summary['total_commission'] > 0
@@ -5,6 +5,8 @@
 - indicators: 기술적 지표 계산
 - backtest_engine: 백테스팅 엔진
 - data_fetcher: 데이터 수집
+- candle_cache: 캔들 로컬 캐시 (SQLite)
+- rate_limiter: API 요청 제한 (토큰 버킷)
 """
 
 
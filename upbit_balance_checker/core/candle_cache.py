@@ -0,0 +1,166 @@
+"""
+캔들 캐시 모듈
+
+Upbit에서 받은 캔들을 (마켓, 캔들 단위)별로 SQLite 파일에 저장하여
+다음 실행 때 다시 받지 않도록 한다.
+
+- 완성된(마감된) 캔들만 저장하고, 아직 진행 중인 마지막 캔들은 저장하지 않음
+- API 응답(dict)을 그대로 JSON으로 저장하므로 캐시 여부와 관계없이 같은 DataFrame 생성
+"""
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+# 기본 캐시 파일 위치 (CANDLE_CACHE_PATH 환경변수로 변경 가능)
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "candles.db"
+
+UTC_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def candle_unit(minutes: Optional[int] = None) -> str:
+    """
+    캐시 키로 쓰는 캔들 단위 문자열
+
+    Parameters
+    ----------
+    minutes : int, optional
+        분봉 단위 (None이면 일봉)
+
+    Returns
+    -------
+    str
+        'days' 또는 'minutes/{분}' (Upbit API 경로와 동일)
+    """
+    return "days" if minutes is None else f"minutes/{minutes}"
+
+
+def unit_interval(unit: str) -> timedelta:
+    """캔들 단위 문자열을 캔들 길이로 변환"""
+    if unit == "days":
+        return timedelta(days=1)
+    return timedelta(minutes=int(unit.split("/")[1]))
+
+
+def is_closed(candle: Dict, interval: timedelta, now: Optional[datetime] = None) -> bool:
+    """
+    캔들 마감 여부
+
+    캔들 시작 시각 + 캔들 길이가 현재 시각 이전이면 마감된 캔들로 본다.
+
+    Parameters
+    ----------
+    candle : dict
+        Upbit 캔들 응답 (candle_date_time_utc 필요)
+    interval : timedelta
+        캔들 길이
+    now : datetime, optional
+        기준 시각 (UTC, 기본: 현재)
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    start = datetime.strptime(candle['candle_date_time_utc'], UTC_FORMAT)
+    return start + interval <= now
+
+
+class CandleCache:
+    """
+    SQLite 기반 캔들 캐시
+
+    캔들은 최신순(Upbit 응답 순서) 리스트로 주고받는다.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Parameters
+        ----------
+        db_path : str, optional
+            캐시 파일 경로 (기본: CANDLE_CACHE_PATH 환경변수 또는 DEFAULT_CACHE_PATH)
+        """
+        self.db_path = Path(db_path or os.getenv("CANDLE_CACHE_PATH") or DEFAULT_CACHE_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.db_path), timeout=30)
+
+    def _init_db(self):
+        """테이블 생성"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS candles (
+                    market TEXT NOT NULL,
+                    unit TEXT NOT NULL,
+                    candle_date_time_utc TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (market, unit, candle_date_time_utc)
+                ) WITHOUT ROWID
+            """)
+
+    def newest(self, market: str, unit: str) -> Optional[str]:
+        """가장 최근에 저장된 캔들 시각 (UTC 문자열, 없으면 None)"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT MAX(candle_date_time_utc) FROM candles WHERE market = ? AND unit = ?",
+                (market, unit)
+            ).fetchone()
+        return row[0]
+
+    def load(self, market: str, unit: str, limit: int) -> List[Dict]:
+        """
+        최근 캔들 조회
+
+        Parameters
+        ----------
+        market : str
+            마켓 코드
+        unit : str
+            캔들 단위 (candle_unit() 참고)
+        limit : int
+            최대 개수
+
+        Returns
+        -------
+        list of dict
+            최신순 캔들
+        """
+        if limit <= 0:
+            return []
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT payload FROM candles
+                WHERE market = ? AND unit = ?
+                ORDER BY candle_date_time_utc DESC
+                LIMIT ?
+                """,
+                (market, unit, limit)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save(self, market: str, unit: str, candles: List[Dict]):
+        """
+        마감된 캔들 저장 (이미 있으면 덮어씀)
+
+        진행 중인 캔들은 호출 측에서 제외해야 한다.
+        """
+        if not candles:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO candles VALUES (?, ?, ?, ?)",
+                [
+                    (market, unit, candle['candle_date_time_utc'], json.dumps(candle))
+                    for candle in candles
+                ]
+            )
+
+    def clear(self, market: str, unit: str):
+        """(마켓, 캔들 단위) 캐시 삭제"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM candles WHERE market = ? AND unit = ?", (market, unit))
@@ -6,11 +6,27 @@ Upbit API를 통한 가격 데이터 수집
 
 import pandas as pd
 import requests
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List
 
+from .candle_cache import CandleCache, candle_unit, unit_interval, is_closed, UTC_FORMAT
+from .rate_limiter import upbit_rate_limiter
 
-def fetch_daily_data(market: str, days: int):
+
+# Upbit 캔들 API 한 번에 받을 수 있는 최대 개수
+PAGE_SIZE = 200
+
+# 페이지 동시 요청 수 (실제 요청 속도는 upbit_rate_limiter가 제한)
+MAX_WORKERS = 8
+
+# 요청 실패 시 재시도 횟수
+MAX_RETRIES = 5
+
+
+def fetch_daily_data(market: str, days: int, use_cache: bool = True):
     """
     Upbit API에서 일봉 데이터 수집
     
@@ -20,59 +36,24 @@ def fetch_daily_data(market: str, days: int):
         마켓 코드 (예: 'KRW-BTC')
     days : int
         수집할 일수
+    use_cache : bool
+        로컬 캔들 캐시 사용 여부 (캐시에 없는 구간만 API로 수집)
     
     Returns
     -------
     pd.DataFrame
         가격 데이터
     """
-    url = "https://api.upbit.com/v1/candles/days"
-    headers = {"accept": "application/json"}
-    
-    all_data = []
-    last_timestamp = None
-    
     print(f"📡 {market} 데이터 수집 중...")
     
-    while len(all_data) < days:
-        params = {
-            'market': market,
-            'count': min(200, days - len(all_data)),
-        }
-        
-        if last_timestamp:
-            params['to'] = last_timestamp
-        
-        response = requests.get(url, params=params, headers=headers)
-        data = response.json()
-        
-        if not data:
-            break
-        
-        all_data.extend(data)
-        last_timestamp = data[-1]['candle_date_time_utc']
-        
-        print(f"   수집 완료: {len(all_data)}/{days}일")
-        time.sleep(0.1)  # API 요청 제한 방지
+    all_data = _collect_candles(market, None, days, use_cache, '일')
     
     print(f"✅ 총 {len(all_data)}일 데이터 수집 완료!\n")
     
-    df = pd.DataFrame(all_data)
-    df['날짜'] = pd.to_datetime(df['candle_date_time_kst'])
-    df = df.sort_values('날짜')
-    df['종가'] = df['trade_price']
-    df['시가'] = df['opening_price']
-    df['고가'] = df['high_price']
-    df['저가'] = df['low_price']
-    df['거래량'] = df['candle_acc_trade_volume']
-    
-    # 날짜를 인덱스로 설정
-    df = df.set_index('날짜')
-    
-    return df
+    return _to_dataframe(all_data)
 
 
-def fetch_minute_data(market: str, minutes: int = 1, count: int = 1000):
+def fetch_minute_data(market: str, minutes: int = 1, count: int = 1000, use_cache: bool = True):
     """
     Upbit API에서 분봉 데이터 수집
     
@@ -84,49 +65,254 @@ def fetch_minute_data(market: str, minutes: int = 1, count: int = 1000):
         분봉 단위 (1, 3, 5, 10, 15, 30, 60, 240)
     count : int
         수집할 캔들 개수
+    use_cache : bool
+        로컬 캔들 캐시 사용 여부 (캐시에 없는 구간만 API로 수집)
     
     Returns
     -------
     pd.DataFrame
         가격 데이터
     """
-    url = f"https://api.upbit.com/v1/candles/minutes/{minutes}"
-    headers = {"accept": "application/json"}
+    print(f"📡 {market} {minutes}분봉 데이터 수집 중...")
     
-    all_data = []
-    last_timestamp = None
+    all_data = _collect_candles(market, minutes, count, use_cache, '개')
     
-    print(f"📡 {market} {minutes}분봉 데이터 수집 중...")
+    print(f"✅ 총 {len(all_data)}개 캔들 수집 완료!\n")
     
-    while len(all_data) < count:
-        params = {
-            'market': market,
-            'count': min(200, count - len(all_data)),
-        }
-        
-        if last_timestamp:
-            params['to'] = last_timestamp
+    return _to_dataframe(all_data)
+
+
+def fetch_multi_market_data(markets: List[str], minutes: int = None, count: int = 1000,
+                            use_cache: bool = True) -> Dict[str, pd.DataFrame]:
+    """
+    여러 마켓 데이터 동시 수집
+    
+    마켓별 수집을 스레드로 동시에 진행하며, 요청 속도는 전역 토큰 버킷으로 함께 제한된다.
+    
+    Parameters
+    ----------
+    markets : List[str]
+        마켓 코드 목록
+    minutes : int, optional
+        분봉 단위 (None이면 일봉)
+    count : int
+        마켓별 수집할 캔들 개수
+    use_cache : bool
+        로컬 캔들 캐시 사용 여부
+    
+    Returns
+    -------
+    dict
+        마켓 코드 -> 가격 데이터
+    """
+    def fetch(market):
+        if minutes is None:
+            return fetch_daily_data(market, days=count, use_cache=use_cache)
+        return fetch_minute_data(market, minutes=minutes, count=count, use_cache=use_cache)
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(markets)) or 1) as executor:
+        futures = {market: executor.submit(fetch, market) for market in markets}
+    
+    return {market: future.result() for market, future in futures.items()}
+
+
+def _collect_candles(market: str, minutes, count: int, use_cache: bool, label: str):
+    """
+    캔들 수집 (최신순)
+    
+    캐시를 사용하면 캐시의 마지막 캔들 이후(최신 구간)와
+    캐시가 부족한 경우 그 이전(과거 구간)만 API로 받는다.
+    진행 중인 마지막 캔들은 저장하지 않으므로 매번 새로 받는다.
+    """
+    unit = candle_unit(minutes)
+    
+    if not use_cache:
+        return _request_candles(unit, market, count, label)[0]
+    
+    cache = CandleCache()
+    interval = unit_interval(unit)
+    newest = cache.newest(market, unit)
+    
+    # 1. 최신 구간: 캐시의 마지막 캔들 이후
+    if newest is not None:
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        missing = max((now - datetime.strptime(newest, UTC_FORMAT)) // interval, 1)
         
+        if missing > count:
+            # 캐시가 너무 오래되어 중간이 비므로 처음부터 다시 수집
+            cache.clear(market, unit)
+            newest = None
+    
+    if newest is None:
+        recent, recent_ok = _request_candles(unit, market, count, label)
+        cached = []
+    else:
+        recent, recent_ok = _request_candles(unit, market, missing, label, stop_at=newest)
+        cached = cache.load(market, unit, count - len(recent))
+        if cached:
+            print(f"   캐시 사용: {len(cached)}{label}")
+    
+    all_data = recent + cached
+    
+    # 2. 과거 구간: 캐시가 요청 개수보다 적은 경우
+    older = []
+    if all_data and len(all_data) < count:
+        older, _ = _request_candles(
+            unit, market, count - len(all_data), label,
+            to=all_data[-1]['candle_date_time_utc']
+        )
+        all_data += older
+    
+    # 마감된 캔들만 저장 (최신 구간 수집이 중간에 실패하면 캐시와의 사이가 비므로 제외)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    new_candles = (recent if recent_ok or not cached else []) + older
+    cache.save(market, unit, [c for c in new_candles if is_closed(c, interval, now)])
+    
+    return all_data
+
+
+def _request_candles(unit: str, market: str, count: int, label: str,
+                     to: str = None, stop_at: str = None):
+    """
+    Upbit 캔들 API 동시 요청 (200개씩, 최신순)
+    
+    캔들 길이 × 개수로 페이지별 `to` 시각을 미리 계산하여 페이지를 동시에 요청하고,
+    결과를 시간순으로 이어 붙인 뒤 중복을 제거한다.
+    모든 요청은 전역 토큰 버킷(upbit_rate_limiter)을 거치며 429 응답 시 물러났다가 재시도한다.
+    
+    Parameters
+    ----------
+    unit : str
+        캔들 단위 ('days', 'minutes/1' 등)
+    market : str
+        마켓 코드
+    count : int
+        최대 수집 개수
+    label : str
+        진행 상황 출력 단위 ('일', '개')
+    to : str, optional
+        이 시각(UTC) 이전 캔들부터 수집
+    stop_at : str, optional
+        이 시각(UTC) 이하의 캔들은 제외 (이미 가진 구간)
+    
+    Returns
+    -------
+    tuple
+        (캔들 리스트, 오류 없이 끝났는지 여부)
+    """
+    url = f"https://api.upbit.com/v1/candles/{unit}"
+    interval = unit_interval(unit)
+    
+    # 페이지별 (to, count) 계산
+    if to is None:
+        # 첫 페이지는 진행 중인 캔들부터, 이후 페이지는 앞 페이지의 마지막 캔들 시각 기준
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        open_start = now - (now - datetime(1970, 1, 1)) % interval
+        page_ends = [None] + [
+            (open_start - interval * (PAGE_SIZE * k - 1)).strftime(UTC_FORMAT)
+            for k in range(1, -(-count // PAGE_SIZE))
+        ]
+    else:
+        end = datetime.strptime(to, UTC_FORMAT)
+        page_ends = [
+            (end - interval * (PAGE_SIZE * k)).strftime(UTC_FORMAT)
+            for k in range(-(-count // PAGE_SIZE))
+        ]
+    
+    pages = [
+        {'market': market, 'count': min(PAGE_SIZE, count - PAGE_SIZE * k), **({'to': end} if end else {})}
+        for k, end in enumerate(page_ends)
+    ]
+    
+    progress = {'done': 0}
+    progress_lock = threading.Lock()
+    
+    def request_page(params):
+        data = _request_page(url, params)
+        with progress_lock:
+            progress['done'] += len(data)
+            print(f"   수집 완료: {min(progress['done'], count)}/{count}{label}")
+        return data
+    
+    if len(pages) == 1:
+        futures = [_completed(request_page, pages[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(pages))) as executor:
+            futures = [executor.submit(request_page, params) for params in pages]
+    
+    # 앞 페이지부터 이어 붙이기 (실패한 페이지 이후는 사이가 비므로 버림)
+    candles = {}
+    ok = True
+    exhausted = False
+    for params, future in zip(pages, futures):
         try:
-            response = requests.get(url, params=params, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            if not data:
-                break
-            
-            all_data.extend(data)
-            last_timestamp = data[-1]['candle_date_time_utc']
-            
-            print(f"   수집 완료: {len(all_data)}/{count}개")
-            time.sleep(0.1)  # API 요청 제한 방지
-            
+            page = future.result()
         except Exception as e:
             print(f"⚠️  데이터 수집 중 오류 발생: {e}")
+            ok = False
+            break
+        for candle in page:
+            candles[candle['candle_date_time_utc']] = candle
+        if len(page) < params['count']:
+            # 더 오래된 데이터 없음
+            exhausted = True
             break
     
-    print(f"✅ 총 {len(all_data)}개 캔들 수집 완료!\n")
+    all_data = sorted(candles.values(), key=lambda c: c['candle_date_time_utc'], reverse=True)
+    
+    reached_stop = stop_at is not None and all_data and all_data[-1]['candle_date_time_utc'] <= stop_at
+    if stop_at is not None:
+        all_data = [c for c in all_data if c['candle_date_time_utc'] > stop_at]
+    all_data = all_data[:count]
+    
+    # 거래가 없어 비어 있는 캔들 때문에 모자라면 가장 오래된 캔들 이전부터 이어서 수집
+    if ok and not exhausted and not reached_stop and all_data and len(all_data) < count:
+        more, ok = _request_candles(
+            unit, market, count - len(all_data), label,
+            to=all_data[-1]['candle_date_time_utc'], stop_at=stop_at
+        )
+        all_data += more
+    
+    return all_data, ok
+
+
+def _request_page(url: str, params: dict) -> list:
+    """
+    캔들 한 페이지 요청 (요청 제한 + 재시도)
     
+    429 응답이면 전역 토큰 버킷을 멈춰 모든 요청이 함께 물러나도록 한다.
+    """
+    headers = {"accept": "application/json"}
+    
+    for attempt in range(MAX_RETRIES):
+        upbit_rate_limiter.acquire()
+        try:
+            response = requests.get(url, params=params, headers=headers, timeout=10)
+            if response.status_code == 429:
+                upbit_rate_limiter.pause(0.5 * 2 ** attempt)
+                continue
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+    
+    raise requests.exceptions.HTTPError(f"429 Too Many Requests: {params}")
+
+
+def _completed(fn, *args) -> Future:
+    """함수를 바로 실행한 결과를 Future로 감싸기"""
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _to_dataframe(all_data: list) -> pd.DataFrame:
+    """Upbit 캔들 응답을 가격 데이터프레임으로 변환"""
     df = pd.DataFrame(all_data)
     df['날짜'] = pd.to_datetime(df['candle_date_time_kst'])
     df = df.sort_values('날짜')
@@ -140,5 +326,3 @@ def fetch_minute_data(market: str, minutes: int = 1, count: int = 1000):
     df = df.set_index('날짜')
     
     return df
-
-
@@ -0,0 +1,72 @@
+"""
+요청 제한 모듈
+
+여러 스레드가 함께 쓰는 토큰 버킷 방식의 API 요청 제한
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    토큰 버킷 요청 제한기 (스레드 안전)
+
+    초당 rate개씩 토큰이 채워지고 최대 capacity개까지 쌓인다.
+    요청 전에 acquire()로 토큰을 하나 가져가며, 토큰이 없으면 채워질 때까지 대기한다.
+    """
+
+    def __init__(self, rate: float, capacity: int = None):
+        """
+        Parameters
+        ----------
+        rate : float
+            초당 허용 요청 수
+        capacity : int, optional
+            한 번에 몰아서 보낼 수 있는 최대 요청 수 (기본: rate)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        # pause() 중에는 updated_at이 미래 시각이므로 그 이후부터 채움
+        if now > self.updated_at:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+    def acquire(self):
+        """토큰 하나 가져오기 (없으면 대기)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """
+        요청 일시 중지 (429 응답 시 백오프)
+
+        모든 스레드의 acquire()가 지정 시간 동안 대기하고, 남은 토큰도 비운다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.paused_until = max(self.paused_until, now + seconds)
+            self.tokens = 0.0
+            self.updated_at = self.paused_until
+
+
+# 전역 Upbit 시세 조회 API 요청 제한 (IP당 초당 10회)
+upbit_rate_limiter = TokenBucket(rate=10)
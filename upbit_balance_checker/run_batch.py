@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+전략 일괄 백테스팅 스크립트
+
+(전략, 마켓, 시간 단위) 조합을 프로세스 풀로 병렬 실행하고
+결과를 하나의 비교 테이블로 정리한다.
+
+- 데이터는 (마켓, 시간 단위)별로 한 번만 수집하여 모든 전략이 공유
+- 완료된 작업은 results/batch/<실행 이름>/results.jsonl에 즉시 기록
+- 같은 실행 이름으로 다시 실행하면 완료된 작업은 건너뜀 (중단 후 재개)
+
+upbit_balance_checker 디렉토리에서 실행:
+    python run_batch.py                                   # 전체 전략 × 전체 코인 × 전체 시간 단위
+    python run_batch.py -s sma_5_20 macd -m KRW-BTC KRW-ETH -t daily 240min
+    python run_batch.py --run batch_20260101_120000       # 중단된 실행 재개
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+# 현재 스크립트의 디렉토리 (upbit_balance_checker)
+SCRIPT_DIR = Path(__file__).parent.resolve()
+
+# 프로젝트 루트를 경로에 추가
+sys.path.insert(0, str(SCRIPT_DIR))
+
+from global_config import (
+    AVAILABLE_MARKETS,
+    AVAILABLE_TIMEFRAMES,
+    COMMISSION,
+    INITIAL_CASH,
+    get_candles_count,
+)
+from core.backtest_engine import BacktestEngine
+from core.data_fetcher import fetch_daily_data, fetch_minute_data
+from strategies.sma_strategy.strategy import SMAStrategy
+from strategies.sma_strategy.config import SMA5_20_CONFIG, SMA20_50_CONFIG
+from strategies.macd_strategy.strategy import MACDTrendStrategy
+from strategies.macd_strategy.config import MACD_TREND_CONFIG
+from strategies.momentum_strategy.strategy import MomentumStrategy
+from strategies.momentum_strategy.config import MOMENTUM_20_CONFIG
+
+
+# 일괄 실행 가능한 전략 (키는 global_config.STRATEGY_MARKETS와 동일)
+# 골든크로스 + RSI 전략은 패키지 import가 정리되지 않아 제외
+BATCH_STRATEGIES = {
+    'sma_5_20': {
+        'name': SMA5_20_CONFIG['name'],
+        'build': lambda: SMAStrategy(
+            fast_period=SMA5_20_CONFIG['fast_period'],
+            slow_period=SMA5_20_CONFIG['slow_period'],
+        ),
+    },
+    'sma_20_50': {
+        'name': SMA20_50_CONFIG['name'],
+        'build': lambda: SMAStrategy(
+            fast_period=SMA20_50_CONFIG['fast_period'],
+            slow_period=SMA20_50_CONFIG['slow_period'],
+        ),
+    },
+    'macd': {
+        'name': MACD_TREND_CONFIG['name'],
+        'build': lambda: MACDTrendStrategy(
+            macd_fast=MACD_TREND_CONFIG['macd_fast'],
+            macd_slow=MACD_TREND_CONFIG['macd_slow'],
+            macd_signal=MACD_TREND_CONFIG['macd_signal'],
+            trend_ma_period=MACD_TREND_CONFIG['trend_ma_period'],
+            trend_ma_type=MACD_TREND_CONFIG['trend_ma_type'],
+            use_trend_filter=MACD_TREND_CONFIG.get('use_trend_filter', True),
+            use_histogram_filter=MACD_TREND_CONFIG.get('use_histogram_filter', False),
+            min_histogram=MACD_TREND_CONFIG.get('min_histogram', 0),
+        ),
+    },
+    'momentum': {
+        'name': MOMENTUM_20_CONFIG['name'],
+        'build': lambda: MomentumStrategy(
+            lookback_period=MOMENTUM_20_CONFIG['lookback_period'],
+            buy_threshold=MOMENTUM_20_CONFIG['buy_threshold'],
+            sell_threshold=MOMENTUM_20_CONFIG['sell_threshold'],
+        ),
+    },
+}
+
+# 비교 테이블 컬럼
+RESULT_COLUMNS = [
+    'strategy', 'market', 'timeframe', 'candles', 'start', 'end',
+    'total_return', 'buy_hold_return', 'excess_return', 'mdd',
+    'sharpe_ratio', 'num_trades', 'win_rate', 'final_value',
+]
+
+BATCH_DIR = SCRIPT_DIR / "results" / "batch"
+
+# 동시에 수집할 데이터셋 수
+FETCH_WORKERS = 4
+
+# 워커 프로세스별 데이터셋 캐시 (파일 경로 -> DataFrame)
+_DATASETS: Dict[str, pd.DataFrame] = {}
+
+
+def job_key(strategy: str, market: str, timeframe: str) -> str:
+    """작업 식별 키"""
+    return f"{strategy}|{market}|{timeframe}"
+
+
+def build_jobs(strategies: List[str], markets: List[str], timeframes: List[str]) -> List[Dict]:
+    """
+    (전략, 마켓, 시간 단위) 작업 목록 생성
+
+    같은 (마켓, 시간 단위)의 작업이 연속되도록 정렬
+    """
+    return [
+        {'strategy': strategy, 'market': market, 'timeframe': timeframe}
+        for market in markets
+        for timeframe in timeframes
+        for strategy in strategies
+    ]
+
+
+def load_completed(results_path: Path) -> Dict[str, Dict]:
+    """
+    체크포인트 파일에서 완료된 작업 결과 로드
+
+    Returns
+    -------
+    dict
+        작업 키 -> 결과 (성공한 작업만)
+    """
+    completed = {}
+    if not results_path.exists():
+        return completed
+
+    valid_lines = []
+    corrupted = False
+    with open(results_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # 비정상 종료로 잘린 줄
+                corrupted = True
+                continue
+            valid_lines.append(line)
+            if record.get('status') == 'ok':
+                completed[job_key(record['strategy'], record['market'], record['timeframe'])] = record
+
+    # 잘린 줄 뒤에 새 결과가 이어 붙지 않도록 정상 줄만 남김
+    if corrupted:
+        tmp_path = results_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("".join(line + "\n" for line in valid_lines))
+        os.replace(tmp_path, results_path)
+
+    return completed
+
+
+def append_result(results_path: Path, record: Dict):
+    """결과 한 건을 체크포인트 파일에 즉시 기록"""
+    with open(results_path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def fetch_dataset(market: str, timeframe: str, data_dir: Path, count: int = None) -> Path:
+    """
+    (마켓, 시간 단위) 데이터 수집 후 파일로 저장
+
+    이미 저장된 파일이 있으면 다시 수집하지 않는다.
+
+    Returns
+    -------
+    Path
+        저장된 데이터 파일 경로
+    """
+    data_path = data_dir / f"{market}_{timeframe}.pkl"
+    if data_path.exists():
+        return data_path
+
+    tf = AVAILABLE_TIMEFRAMES[timeframe]
+    count = count or get_candles_count(tf['type'])
+
+    if tf['type'] == 'daily':
+        df = fetch_daily_data(market=market, days=count)
+    else:
+        df = fetch_minute_data(market=market, minutes=tf['minutes'], count=count)
+
+    # 쓰는 도중 중단되어도 깨진 파일이 남지 않도록 임시 파일 후 교체
+    tmp_path = data_path.with_suffix('.tmp')
+    df.to_pickle(tmp_path)
+    os.replace(tmp_path, data_path)
+    return data_path
+
+
+def _load_dataset(data_path: str) -> pd.DataFrame:
+    """워커에서 데이터셋 로드 (프로세스당 1회)"""
+    if data_path not in _DATASETS:
+        _DATASETS[data_path] = pd.read_pickle(data_path)
+    return _DATASETS[data_path]
+
+
+def run_job(job: Dict, data_path: str, initial_cash: float, commission: float) -> Dict:
+    """
+    작업 하나 실행 (워커 프로세스)
+
+    Returns
+    -------
+    dict
+        비교 테이블 한 행 (status: 'ok' 또는 'error')
+    """
+    record = dict(job)
+    try:
+        df = _load_dataset(data_path)
+        strategy = BATCH_STRATEGIES[job['strategy']]['build']()
+        signals = strategy.generate_signals(df)
+
+        engine = BacktestEngine(initial_cash=initial_cash, commission=commission)
+        result = engine.run(df, signals)
+
+        record.update({
+            'status': 'ok',
+            'candles': len(df),
+            'start': str(df.index[0]),
+            'end': str(df.index[-1]),
+            'total_return': float(result['total_return']),
+            'buy_hold_return': float(result['buy_hold_return']),
+            'excess_return': float(result['total_return'] - result['buy_hold_return']),
+            'mdd': float(result['mdd']),
+            'sharpe_ratio': float(result['sharpe_ratio']),
+            'num_trades': int(result['num_trades']),
+            'win_rate': float(result['win_rate']),
+            'final_value': float(result['final_value']),
+        })
+    except Exception as e:
+        record.update({'status': 'error', 'error': f"{type(e).__name__}: {e}"})
+    return record
+
+
+def run_batch(
+    jobs: List[Dict],
+    run_dir: Path,
+    workers: int = None,
+    count: int = None,
+    initial_cash: float = INITIAL_CASH,
+    commission: float = COMMISSION,
+) -> pd.DataFrame:
+    """
+    작업 목록을 프로세스 풀로 실행
+
+    데이터 수집은 메인 프로세스의 스레드에서 동시에 하고 (요청 속도는
+    core.rate_limiter의 전역 토큰 버킷이 제한), (마켓, 시간 단위) 하나의
+    수집이 끝나는 즉시 해당 작업들을 풀에 넣어 수집과 백테스팅이 겹쳐서 진행되도록 한다.
+
+    Parameters
+    ----------
+    jobs : list of dict
+        작업 목록 (strategy, market, timeframe)
+    run_dir : Path
+        실행 결과 디렉토리 (체크포인트, 데이터, 비교 테이블)
+    workers : int, optional
+        워커 프로세스 수 (기본: CPU 코어 수)
+    count : int, optional
+        캔들 개수 (기본: global_config 설정)
+    initial_cash : float
+        초기 자본금
+    commission : float
+        수수료율
+
+    Returns
+    -------
+    pd.DataFrame
+        비교 테이블
+    """
+    data_dir = run_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    results_path = run_dir / "results.jsonl"
+
+    completed = load_completed(results_path)
+    pending_jobs = [
+        job for job in jobs
+        if job_key(job['strategy'], job['market'], job['timeframe']) not in completed
+    ]
+
+    print(f"📋 전체 작업: {len(jobs)}개 (완료 {len(jobs) - len(pending_jobs)}개, 남은 작업 {len(pending_jobs)}개)")
+
+    # (마켓, 시간 단위)별로 묶기
+    groups: Dict[tuple, List[Dict]] = {}
+    for job in pending_jobs:
+        groups.setdefault((job['market'], job['timeframe']), []).append(job)
+
+    workers = workers or os.cpu_count() or 1
+    print(f"⚙️  워커 프로세스: {workers}개, 데이터셋: {len(groups)}개")
+    print()
+
+    done_count = 0
+    failed = []
+
+    def collect(futures, block: bool):
+        nonlocal done_count
+        if not futures:
+            return futures
+        finished, remaining = wait(futures, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+        for future in finished:
+            record = future.result()
+            append_result(results_path, record)
+            done_count += 1
+            if record['status'] == 'ok':
+                completed[job_key(record['strategy'], record['market'], record['timeframe'])] = record
+                print(f"   [{done_count}/{len(pending_jobs)}] ✅ {record['strategy']} {record['market']} "
+                      f"{record['timeframe']}: {record['total_return']:+.2f}%")
+            else:
+                failed.append(record)
+                print(f"   [{done_count}/{len(pending_jobs)}] ❌ {record['strategy']} {record['market']} "
+                      f"{record['timeframe']}: {record['error']}")
+        return remaining
+
+    with ProcessPoolExecutor(max_workers=workers) as executor, \
+            ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetcher:
+        futures = set()
+        fetches = {
+            fetcher.submit(fetch_dataset, market, timeframe, data_dir, count): (market, timeframe)
+            for market, timeframe in groups
+        }
+
+        for fetch in as_completed(fetches):
+            market, timeframe = fetches[fetch]
+            group_jobs = groups[(market, timeframe)]
+            try:
+                data_path = fetch.result()
+            except Exception as e:
+                print(f"⚠️  {market} {timeframe} 데이터 수집 실패: {e}")
+                for job in group_jobs:
+                    record = {**job, 'status': 'error', 'error': f"데이터 수집 실패: {e}"}
+                    append_result(results_path, record)
+                    failed.append(record)
+                continue
+
+            for job in group_jobs:
+                futures.add(executor.submit(run_job, job, str(data_path), initial_cash, commission))
+
+            # 수집 중에도 끝난 작업은 바로 기록
+            futures = collect(futures, block=False)
+
+        while futures:
+            futures = collect(futures, block=True)
+
+    if failed:
+        print(f"\n⚠️  실패한 작업 {len(failed)}개 (다시 실행하면 재시도합니다)")
+
+    table = pd.DataFrame(list(completed.values()), columns=RESULT_COLUMNS)
+    table = table.sort_values('total_return', ascending=False).reset_index(drop=True)
+    table.index = table.index + 1
+
+    table_path = run_dir / "comparison.csv"
+    table.to_csv(table_path, index_label='rank', encoding='utf-8-sig')
+    print(f"\n💾 비교 테이블 저장: {table_path}")
+
+    return table
+
+
+def print_table(table: pd.DataFrame, top: int = 20):
+    """비교 테이블 출력"""
+    print()
+    print("=" * 100)
+    print(f"📊 전략 비교 (상위 {min(top, len(table))}개 / 전체 {len(table)}개)")
+    print("=" * 100)
+
+    if table.empty:
+        print("결과가 없습니다.")
+        return
+
+    columns = ['strategy', 'market', 'timeframe', 'total_return', 'buy_hold_return',
+               'mdd', 'sharpe_ratio', 'num_trades', 'win_rate']
+    print(table[columns].head(top).to_string(float_format=lambda x: f"{x:,.2f}"))
+    print("=" * 100)
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='전략 일괄 백테스팅')
+    parser.add_argument('-s', '--strategies', nargs='+', default=list(BATCH_STRATEGIES),
+                        choices=list(BATCH_STRATEGIES), help='실행할 전략 (기본: 전체)')
+    parser.add_argument('-m', '--markets', nargs='+', default=AVAILABLE_MARKETS,
+                        help='마켓 코드 (기본: AVAILABLE_MARKETS 전체)')
+    parser.add_argument('-t', '--timeframes', nargs='+', default=list(AVAILABLE_TIMEFRAMES),
+                        choices=list(AVAILABLE_TIMEFRAMES), help='시간 단위 (기본: 전체)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='워커 프로세스 수 (기본: CPU 코어 수)')
+    parser.add_argument('-c', '--count', type=int, default=None,
+                        help='캔들 개수 (기본: global_config 설정)')
+    parser.add_argument('--run', default=None,
+                        help='실행 이름 (같은 이름으로 다시 실행하면 이어서 진행)')
+    parser.add_argument('--top', type=int, default=20, help='출력할 상위 결과 수')
+    return parser.parse_args()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+
+    for market in args.markets:
+        if market not in AVAILABLE_MARKETS:
+            print(f"❌ 지원하지 않는 마켓입니다: {market}")
+            return
+
+    run_name = args.run or datetime.now().strftime("batch_%Y%m%d_%H%M%S")
+    run_dir = BATCH_DIR / run_name
+
+    print("=" * 70)
+    print(f"🚀 전략 일괄 백테스팅: {run_name}")
+    print("=" * 70)
+
+    jobs = build_jobs(args.strategies, args.markets, args.timeframes)
+
+    try:
+        table = run_batch(jobs, run_dir, workers=args.workers, count=args.count)
+    except KeyboardInterrupt:
+        print("\n\n⚠️  사용자에 의해 중단되었습니다.")
+        print(f"💡 이어서 실행: python run_batch.py --run {run_name}")
+        return
+
+    print_table(table, top=args.top)
+
+
+if __name__ == "__main__":
+    main()